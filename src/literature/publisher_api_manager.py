@@ -19,8 +19,14 @@ class PublisherAPIClient:
     
     This class provides a common interface for all publisher API clients
     with basic configuration and rate limiting support.
+    
+    Attributes are declared in ``__slots__``. Subclasses that do not declare
+    their own ``__slots__`` get a regular instance ``__dict__`` and may add
+    arbitrary attributes as before.
     """
     
+    __slots__ = ('config', 'base_url', 'api_key', 'rate_limit', 'timeout')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the publisher API client.
@@ -33,7 +39,6 @@ class PublisherAPIClient:
         self.api_key = config.get('api_key')
         self.rate_limit = config.get('rate_limit', 1.0)
         self.timeout = config.get('timeout', 30)
-        self.logger = logger
 
 
 class PublisherAPIManager:
@@ -6,13 +6,38 @@ managing API usage across multiple publisher APIs with configurable
 limits and automatic enforcement.
 """
 
+import math
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+import numpy as np
 from loguru import logger
 
 
+# Quota periods in the column order used by QuotaManager's usage arrays
+_QUOTA_PERIODS = ('daily', 'hourly', 'minute')
+
+# Array stand-in for an unenforced (None) quota limit
+_NO_LIMIT = np.iinfo(np.int64).max
+
+
+def _period_keys(moment: datetime) -> Tuple[int, int, int]:
+    """
+    Get integer keys identifying the day, hour and minute containing a moment.
+    
+    Args:
+        moment: Point in time to key
+        
+    Returns:
+        Tuple of (day, hour, minute) keys, in _QUOTA_PERIODS order
+    """
+    day = moment.toordinal()
+    hour = day * 24 + moment.hour
+    return day, hour, hour * 60 + moment.minute
+
+
 class QuotaTracker:
     """
     Tracks API usage quotas for daily, hourly, and minute limits.
@@ -21,6 +46,11 @@ class QuotaTracker:
     if requests are within configured quota limits.
     """
     
+    __slots__ = (
+        'api_name', 'daily_limit', 'hourly_limit', 'minute_limit',
+        'current_usage', 'last_reset', 'lock'
+    )
+    
     def __init__(self, api_name: str, config: Dict[str, Any]):
         """
         Initialize the quota tracker.
@@ -30,9 +60,10 @@ class QuotaTracker:
             config: Configuration dictionary with quota limits
         """
         self.api_name = api_name
-        self.daily_limit = config.get('daily_limit', float('inf'))
-        self.hourly_limit = config.get('hourly_limit', float('inf'))
-        self.minute_limit = config.get('minute_limit', float('inf'))
+        # A limit of None means the quota is not enforced
+        self.daily_limit = config.get('daily_limit')
+        self.hourly_limit = config.get('hourly_limit')
+        self.minute_limit = config.get('minute_limit')
         
         # Current usage counters
         self.current_usage = {
@@ -49,7 +80,6 @@ class QuotaTracker:
         }
         
         self.lock = threading.Lock()
-        self.logger = logger
     
     def _check_and_reset_quotas(self):
         """Check if quotas need to be reset based on time periods."""
@@ -81,9 +111,12 @@ class QuotaTracker:
             self._check_and_reset_quotas()
             
             # Check if incrementing would exceed any limit
-            if (self.current_usage['daily'] + 1 > self.daily_limit or
-                self.current_usage['hourly'] + 1 > self.hourly_limit or
-                self.current_usage['minute'] + 1 > self.minute_limit):
+            if ((self.daily_limit is not None and
+                 self.current_usage['daily'] + 1 > self.daily_limit) or
+                (self.hourly_limit is not None and
+                 self.current_usage['hourly'] + 1 > self.hourly_limit) or
+                (self.minute_limit is not None and
+                 self.current_usage['minute'] + 1 > self.minute_limit)):
                 return False
             
             # Increment all counters
@@ -103,9 +136,12 @@ class QuotaTracker:
         with self.lock:
             self._check_and_reset_quotas()
             
-            return (self.current_usage['daily'] < self.daily_limit and
-                    self.current_usage['hourly'] < self.hourly_limit and
-                    self.current_usage['minute'] < self.minute_limit)
+            return ((self.daily_limit is None or
+                     self.current_usage['daily'] < self.daily_limit) and
+                    (self.hourly_limit is None or
+                     self.current_usage['hourly'] < self.hourly_limit) and
+                    (self.minute_limit is None or
+                     self.current_usage['minute'] < self.minute_limit))
     
     def get_limiting_quota(self) -> Optional[str]:
         """
@@ -117,11 +153,14 @@ class QuotaTracker:
         with self.lock:
             self._check_and_reset_quotas()
             
-            if self.current_usage['minute'] >= self.minute_limit:
+            if (self.minute_limit is not None and
+                    self.current_usage['minute'] >= self.minute_limit):
                 return 'minute'
-            elif self.current_usage['hourly'] >= self.hourly_limit:
+            elif (self.hourly_limit is not None and
+                    self.current_usage['hourly'] >= self.hourly_limit):
                 return 'hourly'
-            elif self.current_usage['daily'] >= self.daily_limit:
+            elif (self.daily_limit is not None and
+                    self.current_usage['daily'] >= self.daily_limit):
                 return 'daily'
             
             return None
@@ -155,6 +194,11 @@ class RateLimiter:
     rate limits with burst capacity.
     """
     
+    __slots__ = (
+        'api_name', 'requests_per_second', 'burst_limit',
+        'tokens', 'last_refill', 'lock'
+    )
+    
     def __init__(self, api_name: str, config: Dict[str, Any]):
         """
         Initialize the rate limiter.
@@ -172,7 +216,6 @@ class RateLimiter:
         self.last_refill = time.time()
         
         self.lock = threading.Lock()
-        self.logger = logger
     
     def _refill_tokens(self):
         """Refill tokens based on elapsed time."""
@@ -248,12 +291,62 @@ class QuotaManager:
         self.config = config
         self.quota_trackers = {}
         self.rate_limiters = {}
-        self.logger = logger
         
         # Initialize trackers and limiters for each API
         for api_name, api_config in config.items():
             self.quota_trackers[api_name] = QuotaTracker(api_name, api_config)
             self.rate_limiters[api_name] = RateLimiter(api_name, api_config)
+        
+        # Per-API state mirrored into arrays (one row per API) for batch checks
+        api_count = len(config)
+        self._api_index = {}
+        self._quota_limits = np.empty((api_count, len(_QUOTA_PERIODS)), dtype=np.int64)
+        self._quota_usage = np.zeros((api_count, len(_QUOTA_PERIODS)), dtype=np.int64)
+        self._usage_periods = np.zeros((api_count, len(_QUOTA_PERIODS)), dtype=np.int64)
+        self._refill_rates = np.empty(api_count, dtype=np.float64)
+        self._burst_limits = np.empty(api_count, dtype=np.float64)
+        self._tokens = np.empty(api_count, dtype=np.float64)
+        self._last_refill = np.empty(api_count, dtype=np.float64)
+        
+        for row, api_name in enumerate(config):
+            self._api_index[api_name] = row
+            quota_tracker = self.quota_trackers[api_name]
+            rate_limiter = self.rate_limiters[api_name]
+            
+            limits = (quota_tracker.daily_limit,
+                      quota_tracker.hourly_limit,
+                      quota_tracker.minute_limit)
+            for column, limit in enumerate(limits):
+                # None and non-finite limits (e.g. float('inf')) mean unlimited
+                if limit is None or not math.isfinite(limit):
+                    self._quota_limits[row, column] = _NO_LIMIT
+                else:
+                    self._quota_limits[row, column] = min(int(limit), _NO_LIMIT)
+            
+            self._refill_rates[row] = rate_limiter.requests_per_second
+            self._burst_limits[row] = rate_limiter.burst_limit
+            self._sync_arrays(api_name)
+    
+    def _sync_arrays(self, api_name: str):
+        """
+        Mirror an API's quota usage and token bucket state into the batch arrays.
+        
+        Args:
+            api_name: Name of the API
+        """
+        row = self._api_index[api_name]
+        quota_tracker = self.quota_trackers[api_name]
+        rate_limiter = self.rate_limiters[api_name]
+        
+        with quota_tracker.lock:
+            for column, period in enumerate(_QUOTA_PERIODS):
+                self._quota_usage[row, column] = quota_tracker.current_usage[period]
+                self._usage_periods[row, column] = _period_keys(
+                    quota_tracker.last_reset[period])[column]
+        
+        with rate_limiter.lock:
+            self._tokens[row] = rate_limiter.tokens
+            self._last_refill[row] = rate_limiter.last_refill
     
     def can_make_request(self, api_name: str) -> bool:
         """
@@ -266,7 +359,7 @@ class QuotaManager:
             True if request can be made, False otherwise
         """
         if api_name not in self.quota_trackers:
-            self.logger.warning(f"Unknown API: {api_name}")
+            logger.warning(f"Unknown API: {api_name}")
             return False
         
         quota_tracker = self.quota_trackers[api_name]
@@ -285,17 +378,61 @@ class QuotaManager:
             True if request recorded successfully, False otherwise
         """
         if api_name not in self.quota_trackers:
-            self.logger.warning(f"Unknown API: {api_name}")
+            logger.warning(f"Unknown API: {api_name}")
             return False
         
         quota_tracker = self.quota_trackers[api_name]
         rate_limiter = self.rate_limiters[api_name]
         
         # Consume rate limit token and increment quota
-        if rate_limiter.consume_token() and quota_tracker.increment_usage():
-            return True
+        recorded = rate_limiter.consume_token() and quota_tracker.increment_usage()
+        self._sync_arrays(api_name)
+        
+        return recorded
+    
+    def batch_can_make_request(self, api_names: List[str]) -> np.ndarray:
+        """
+        Check if requests can be made for several APIs at once.
+        
+        Quota usage, limits and token bucket state are kept in per-API
+        arrays, so the whole batch is answered with a few vectorized
+        comparisons instead of a Python-level loop over trackers. Usage
+        recorded in an earlier quota period counts as zero, matching the
+        trackers' automatic resets. The arrays are refreshed by
+        record_request and reset_quotas and read without per-API locks,
+        so results are best-effort under concurrent updates.
+        
+        Args:
+            api_names: Names of the APIs to check
+            
+        Returns:
+            Boolean array aligned with api_names; unknown APIs are False
+        """
+        rows = np.fromiter(
+            (self._api_index.get(api_name, -1) for api_name in api_names),
+            dtype=np.intp,
+            count=len(api_names)
+        )
+        known = rows >= 0
+        rows = rows[known]
+        
+        result = np.zeros(len(api_names), dtype=bool)
+        if rows.size == 0:
+            return result
+        
+        # Usage from a previous day/hour/minute has already expired
+        current_periods = np.array(_period_keys(datetime.now()), dtype=np.int64)
+        usage = np.where(self._usage_periods[rows] == current_periods,
+                         self._quota_usage[rows], 0)
+        under_limit = np.less(usage, self._quota_limits[rows]).all(axis=1)
+        
+        # Refill token buckets as RateLimiter._refill_tokens would
+        elapsed = time.time() - self._last_refill[rows]
+        tokens = np.minimum(self._burst_limits[rows],
+                            self._tokens[rows] + elapsed * self._refill_rates[rows])
         
-        return False
+        result[known] = under_limit & (tokens >= 1)
+        return result
     
     def get_wait_time(self, api_name: str) -> Optional[float]:
         """
@@ -336,6 +473,7 @@ class QuotaManager:
         """
         if api_name in self.quota_trackers:
             self.quota_trackers[api_name].reset_all_quotas()
+            self._sync_arrays(api_name)
 
 
 class QuotaMiddleware:
@@ -354,7 +492,6 @@ class QuotaMiddleware:
             config: Dictionary mapping API names to their configurations
         """
         self.quota_manager = QuotaManager(config)
-        self.logger = logger
     
     def intercept_request(self, api_name: str, request_func: Callable) -> Any:
         """
@@ -387,8 +524,8 @@ class QuotaMiddleware:
         # Execute the request
         try:
             result = request_func()
-            self.logger.debug(f"Request completed for {api_name}")
+            logger.debug(f"Request completed for {api_name}")
             return result
         except Exception as e:
-            self.logger.error(f"Request failed for {api_name}: {str(e)}")
+            logger.error(f"Request failed for {api_name}: {str(e)}")
             raise
@@ -6,55 +6,265 @@ correlation ID tracking, metrics collection, and performance monitoring for
 literature access operations.
 """
 
-import uuid
+import os
+import sys
 import time
+import queue
+import atexit
 import threading
 from typing import Any, Dict, Optional, Union, List
 from datetime import datetime
 from contextlib import contextmanager
-from collections import defaultdict, Counter
+from contextvars import ContextVar
 from loguru import logger
-import json
+import orjson
+
+
+# orjson options for one newline-terminated JSON log line
+_LOG_JSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+# Kinds of events queued by MetricsCollector's recording methods
+_OPERATION_EVENT = 0
+_REQUEST_EVENT = 1
+_ERROR_EVENT = 2
+
+# Loguru logger method for each structured log level
+_LEVEL_METHODS = {
+    'DEBUG': 'debug',
+    'INFO': 'info',
+    'WARNING': 'warning',
+    'ERROR': 'error'
+}
+
+# Loguru severity number for each structured log level
+_LEVEL_NUMBERS = {name: logger.level(name).no for name in _LEVEL_METHODS}
+
+# Metric events of every MetricsCollector, as (collector, kind, ...) tuples,
+# plus threading.Event markers set once everything queued before them is applied
+_METRIC_EVENTS = queue.SimpleQueue()
+
+# Maximum number of metric events applied per aggregation batch
+_METRICS_BATCH_SIZE = 1024
+
+# Seconds between aggregator liveness checks while waiting for metric events
+_METRICS_DRAIN_POLL_SECONDS = 1.0
+
+# Shared metrics aggregator thread, (re)started on demand
+_metrics_aggregator = None
+_metrics_aggregator_lock = threading.Lock()
+
+
+def _aggregate_metric_events() -> None:
+    """Apply queued metric events in batches (runs in the aggregator thread)."""
+    events = _METRIC_EVENTS
+    while True:
+        batch = [events.get()]
+        while len(batch) < _METRICS_BATCH_SIZE:
+            try:
+                batch.append(events.get_nowait())
+            except queue.Empty:
+                break
+        
+        # Group events by collector, keeping their order within each collector
+        markers = []
+        collector_events = {}
+        for event in batch:
+            if isinstance(event, threading.Event):
+                markers.append(event)
+            else:
+                collector_events.setdefault(event[0], []).append(event)
+        
+        for collector, events_for_collector in collector_events.items():
+            try:
+                collector._apply_events(events_for_collector)
+            except Exception as e:
+                # Keep aggregating for the other collectors
+                logger.error(f"Failed to apply metric events: {str(e)}")
+        
+        # Wake readers waiting for everything queued before their marker
+        for marker in markers:
+            marker.set()
+
+
+def _ensure_metrics_aggregator() -> None:
+    """Start the shared metrics aggregator thread unless it is already running."""
+    global _metrics_aggregator
+    with _metrics_aggregator_lock:
+        if _metrics_aggregator is None or not _metrics_aggregator.is_alive():
+            _metrics_aggregator = threading.Thread(target=_aggregate_metric_events,
+                                                   name="metrics-aggregator",
+                                                   daemon=True)
+            _metrics_aggregator.start()
+
+
+# Hex digits carrying the RFC 4122 variant bits (10xx) of a UUID's clock_seq_hi
+_UUID_VARIANT_DIGITS = '89ab'
+
+# Correlation ID of the current thread or asyncio task; ContextVars are
+# created once at module level since contexts keep references to them
+_CORRELATION_ID = ContextVar('correlation_id', default=None)
+
+# Upper bounds on a single coalesced stdout write
+_MAX_LOG_BATCH_RECORDS = 256
+_MAX_LOG_BATCH_BYTES = 1024 * 1024
+
+
+# Log messages of every StructuredLogger, written to stdout by one shared thread
+_LOG_QUEUE = queue.SimpleQueue()
+
+# Shared log writer thread, (re)started on demand, e.g. in a forked child
+_log_writer = None
+_log_writer_lock = threading.Lock()
+
+
+def _drain_log_queue() -> None:
+    """Write queued log messages to stdout in coalesced batches (log writer thread)."""
+    log_queue = _LOG_QUEUE
+    while True:
+        chunks = []
+        batch_bytes = 0
+        flush_events = []
+        
+        item = log_queue.get()
+        while True:
+            if isinstance(item, threading.Event):
+                flush_events.append(item)
+            else:
+                chunks.append(item)
+                batch_bytes += len(item)
+                if len(chunks) >= _MAX_LOG_BATCH_RECORDS or batch_bytes >= _MAX_LOG_BATCH_BYTES:
+                    break
+            try:
+                item = log_queue.get_nowait()
+            except queue.Empty:
+                break
+        
+        if chunks:
+            try:
+                sys.stdout.write(''.join(chunks))
+                sys.stdout.flush()
+            except Exception:
+                # Nowhere left to report a broken stdout; drop the batch
+                pass
+        
+        for flush_event in flush_events:
+            flush_event.set()
+
+
+def _ensure_log_writer() -> None:
+    """Start the shared log writer thread unless it is already running."""
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None or not _log_writer.is_alive():
+            _log_writer = threading.Thread(target=_drain_log_queue,
+                                           name="structured-log-writer",
+                                           daemon=True)
+            _log_writer.start()
+
+
+def _flush_log_queue(timeout: Optional[float] = 5.0) -> bool:
+    """
+    Block until all previously queued log messages have been written.
+    
+    Args:
+        timeout: Maximum seconds to wait, or None to wait indefinitely
+        
+    Returns:
+        True if the queue drained, False if the timeout expired
+    """
+    _ensure_log_writer()
+    flush_event = threading.Event()
+    _LOG_QUEUE.put(flush_event)
+    return flush_event.wait(timeout)
+
+
+# One exit hook for all loggers, so no logger is kept alive by atexit
+atexit.register(_flush_log_queue)
 
 
 class CorrelationContext:
-    """Thread-local storage for correlation IDs."""
+    """
+    Context-local storage for correlation IDs.
     
-    def __init__(self):
-        self._local = threading.local()
+    Backed by a module-level ContextVar shared by all instances, so the ID
+    follows the current thread as well as asyncio tasks, which copy the
+    context they were created in.
+    """
+    
+    __slots__ = ()
     
     def set_correlation_id(self, correlation_id: str) -> None:
-        """Set correlation ID for current thread."""
-        self._local.correlation_id = correlation_id
+        """Set correlation ID for current context."""
+        _CORRELATION_ID.set(correlation_id)
     
     def get_correlation_id(self) -> Optional[str]:
-        """Get correlation ID for current thread."""
-        return getattr(self._local, 'correlation_id', None)
+        """Get correlation ID for current context."""
+        return _CORRELATION_ID.get()
     
     def clear_correlation_id(self) -> None:
-        """Clear correlation ID for current thread."""
-        if hasattr(self._local, 'correlation_id'):
-            delattr(self._local, 'correlation_id')
+        """Clear correlation ID for current context."""
+        _CORRELATION_ID.set(None)
+
+
+class _OperationMetrics:
+    """Aggregated counters for a single operation."""
+    
+    __slots__ = ('count', 'success_count', 'error_count', 'total_duration_ms',
+                 'min_duration_ms', 'max_duration_ms', 'status_counts', 'error_types')
+    
+    def __init__(self):
+        self.count = 0
+        self.success_count = 0
+        self.error_count = 0
+        self.total_duration_ms = 0
+        self.min_duration_ms = float('inf')
+        self.max_duration_ms = 0
+        self.status_counts = {}
+        # Allocated on the first recorded error type
+        self.error_types = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counters to the reported metrics format."""
+        return {
+            'count': self.count,
+            'success_count': self.success_count,
+            'error_count': self.error_count,
+            'total_duration_ms': self.total_duration_ms,
+            'avg_duration_ms': self.total_duration_ms / self.count if self.count else 0.0,
+            # Clean up infinite values for JSON serialization
+            'min_duration_ms': 0 if self.min_duration_ms == float('inf') else self.min_duration_ms,
+            'max_duration_ms': self.max_duration_ms,
+            # Copies, since the aggregator keeps updating the live dicts
+            'status_counts': dict(self.status_counts),
+            'error_types': dict(self.error_types) if self.error_types is not None else {}
+        }
 
 
 class MetricsCollector:
-    """Collects and aggregates metrics from log entries."""
+    """
+    Collects and aggregates metrics from log entries.
+    
+    Recording threads only put small event tuples on a shared SimpleQueue,
+    so the recording path takes no lock. One background thread shared by
+    all collectors drains the queue in batches and is the only writer of
+    the aggregated counters. Reads wait until every event queued before
+    them has been applied, and the merged snapshot is cached until more
+    events are applied.
+    """
     
     def __init__(self):
+        # Guards the aggregated state against concurrent snapshot reads
         self._lock = threading.Lock()
-        self._operations = defaultdict(lambda: {
-            'count': 0,
-            'success_count': 0,
-            'error_count': 0,
-            'total_duration_ms': 0,
-            'avg_duration_ms': 0.0,
-            'min_duration_ms': float('inf'),
-            'max_duration_ms': 0,
-            'status_counts': Counter(),
-            'error_types': Counter()
-        })
-        self._request_counts = Counter()
-        self._error_counts = Counter()
+        self._operations = {}
+        self._request_counts = {}
+        self._error_counts = {}
+        # Applied event count and reset generation identify a snapshot's version
+        self._applied = 0
+        self._generation = 0
+        # Cached (version key, metrics dict, JSON bytes or None)
+        self._snapshot = None
+        
+        _ensure_metrics_aggregator()
     
     def record_operation(self, 
                         operation: str, 
@@ -62,78 +272,160 @@ class MetricsCollector:
                         status: str = "unknown",
                         error_type: Optional[str] = None) -> None:
         """Record an operation with its metrics."""
-        with self._lock:
-            op_metrics = self._operations[operation]
-            op_metrics['count'] += 1
-            op_metrics['status_counts'][status] += 1
-            
-            if status == 'success':
-                op_metrics['success_count'] += 1
-            elif status == 'error':
-                op_metrics['error_count'] += 1
-                if error_type:
-                    op_metrics['error_types'][error_type] += 1
-            
-            if duration_ms is not None:
-                op_metrics['total_duration_ms'] += duration_ms
-                op_metrics['avg_duration_ms'] = op_metrics['total_duration_ms'] / op_metrics['count']
-                op_metrics['min_duration_ms'] = min(op_metrics['min_duration_ms'], duration_ms)
-                op_metrics['max_duration_ms'] = max(op_metrics['max_duration_ms'], duration_ms)
+        _METRIC_EVENTS.put((self, _OPERATION_EVENT, operation, duration_ms, status, error_type))
     
     def record_request(self, service: str) -> None:
         """Record a request to a service."""
-        with self._lock:
-            self._request_counts[service] += 1
+        _METRIC_EVENTS.put((self, _REQUEST_EVENT, service))
     
     def record_error(self, error_type: str) -> None:
         """Record an error occurrence."""
+        _METRIC_EVENTS.put((self, _ERROR_EVENT, error_type))
+    
+    def _apply_events(self, events: List[tuple]) -> None:
+        """
+        Update the aggregated counters from this collector's metric events.
+        
+        An event that cannot be aggregated (e.g. an unhashable operation
+        name) is logged and skipped without affecting the others.
+        """
         with self._lock:
-            self._error_counts[error_type] += 1
+            for event in events:
+                try:
+                    kind = event[1]
+                    if kind == _OPERATION_EVENT:
+                        self._apply_operation(*event[2:])
+                    elif kind == _REQUEST_EVENT:
+                        self._request_counts[event[2]] = self._request_counts.get(event[2], 0) + 1
+                    else:
+                        self._error_counts[event[2]] = self._error_counts.get(event[2], 0) + 1
+                except Exception as e:
+                    logger.error(f"Skipped invalid metric event {event[1:]!r}: {str(e)}")
+                    continue
+                self._applied += 1
     
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get collected metrics."""
+    def _apply_operation(self,
+                         operation: str,
+                         duration_ms: Optional[float],
+                         status: str,
+                         error_type: Optional[str]) -> None:
+        """
+        Fold one operation event into its counters.
+        
+        Everything that can raise (hashing keys, duration arithmetic) runs
+        before the counters are touched, so a bad event leaves no trace.
+        """
+        op_metrics = self._operations.get(operation)
+        is_new = op_metrics is None
+        if is_new:
+            op_metrics = _OperationMetrics()
+        
+        status_count = op_metrics.status_counts.get(status, 0) + 1
+        
+        if duration_ms is not None:
+            total_duration_ms = op_metrics.total_duration_ms + duration_ms
+            min_duration_ms = min(op_metrics.min_duration_ms, duration_ms)
+            max_duration_ms = max(op_metrics.max_duration_ms, duration_ms)
+        
+        record_error_type = status == 'error' and bool(error_type)
+        if record_error_type:
+            error_types = op_metrics.error_types or {}
+            error_type_count = error_types.get(error_type, 0) + 1
+        
+        if is_new:
+            self._operations[operation] = op_metrics
+        op_metrics.count += 1
+        op_metrics.status_counts[status] = status_count
+        
+        if status == 'success':
+            op_metrics.success_count += 1
+        elif status == 'error':
+            op_metrics.error_count += 1
+            if record_error_type:
+                error_types[error_type] = error_type_count
+                op_metrics.error_types = error_types
+        
+        if duration_ms is not None:
+            op_metrics.total_duration_ms = total_duration_ms
+            op_metrics.min_duration_ms = min_duration_ms
+            op_metrics.max_duration_ms = max_duration_ms
+    
+    def _wait_for_pending_events(self) -> None:
+        """Block until all events queued so far have been applied."""
+        drained = threading.Event()
+        _ensure_metrics_aggregator()
+        _METRIC_EVENTS.put(drained)
+        while not drained.wait(_METRICS_DRAIN_POLL_SECONDS):
+            # The aggregator may be gone, e.g. in a forked child; restart it
+            _ensure_metrics_aggregator()
+    
+    def _current_snapshot(self) -> list:
+        """Get the cached metrics snapshot, rebuilding it if events were applied."""
+        self._wait_for_pending_events()
+        
         with self._lock:
-            # Clean up infinite values for JSON serialization
-            operations = {}
-            for op_name, op_data in self._operations.items():
-                operations[op_name] = dict(op_data)
-                if operations[op_name]['min_duration_ms'] == float('inf'):
-                    operations[op_name]['min_duration_ms'] = 0
-                # Convert Counter objects to regular dicts
-                operations[op_name]['status_counts'] = dict(operations[op_name]['status_counts'])
-                operations[op_name]['error_types'] = dict(operations[op_name]['error_types'])
+            version_key = (self._generation, self._applied)
+            if self._snapshot is not None and self._snapshot[0] == version_key:
+                return self._snapshot
             
-            return {
-                'operations': operations,
+            metrics = {
+                'operations': {op_name: op_metrics.to_dict() for op_name, op_metrics in self._operations.items()},
                 'request_counts': dict(self._request_counts),
                 'error_counts': dict(self._error_counts),
                 'timestamp': datetime.now().isoformat()
             }
+            self._snapshot = [version_key, metrics, None]
+            return self._snapshot
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get collected metrics.
+        
+        The returned dict is shared between calls until new metrics are
+        recorded, so callers must treat it as read-only. Its timestamp is
+        the time the snapshot was built.
+        """
+        return self._current_snapshot()[1]
+    
+    def get_metrics_json(self) -> bytes:
+        """Get collected metrics serialized as JSON, cached with the snapshot."""
+        snapshot = self._current_snapshot()
+        metrics_json = snapshot[2]
+        if metrics_json is None:
+            metrics_json = snapshot[2] = orjson.dumps(snapshot[1], option=orjson.OPT_NON_STR_KEYS)
+        return metrics_json
     
     def reset_metrics(self) -> None:
         """Reset all collected metrics."""
+        # Apply earlier events first so they cannot reappear after the reset
+        self._wait_for_pending_events()
+        
         with self._lock:
-            self._operations.clear()
-            self._request_counts.clear()
-            self._error_counts.clear()
+            self._operations = {}
+            self._request_counts = {}
+            self._error_counts = {}
+            self._generation += 1
+            self._snapshot = None
 
 
 class OperationTimer:
     """Context manager for timing operations."""
     
+    __slots__ = ('logger', 'operation', 'start_ns', 'duration_ms')
+    
     def __init__(self, logger_instance: 'StructuredLogger', operation: str):
         self.logger = logger_instance
         self.operation = operation
-        self.start_time = None
+        self.start_ns = None
         self.duration_ms = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        # Monotonic integer clock: immune to wall-clock adjustments
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        end_time = time.time()
-        self.duration_ms = (end_time - self.start_time) * 1000
+        self.duration_ms = (time.perf_counter_ns() - self.start_ns) * 1e-6
 
         status = "error" if exc_type else "success"
         error_type = exc_type.__name__ if exc_type else None
@@ -155,17 +447,29 @@ class StructuredLogger:
     tracking, metrics collection, and performance monitoring.
     """
     
-    def __init__(self, logger_name: str = "literature_access"):
+    __slots__ = ('logger_name', 'level', '_min_level_no', 'correlation_context',
+                 'metrics_collector', '_timestamp_cache', '_static_log_prefix')
+    
+    def __init__(self, logger_name: str = "literature_access", level: str = "DEBUG"):
         """
         Initialize structured logger.
         
         Args:
             logger_name: Name for the logger instance
+            level: Minimum level to emit ('DEBUG', 'INFO', 'WARNING' or 'ERROR')
         """
         self.logger_name = logger_name
+        self.level = level
+        self._min_level_no = _LEVEL_NUMBERS[level]
         self.correlation_context = CorrelationContext()
         self.metrics_collector = MetricsCollector()
         
+        # Per-thread (millisecond, ISO string) cache for record timestamps
+        self._timestamp_cache = threading.local()
+        
+        # (process ID, serialized static log fields), built on first use
+        self._static_log_prefix = None
+        
         # Configure loguru with structured format
         self._configure_logger()
     
@@ -174,42 +478,126 @@ class StructuredLogger:
         # Remove default handler and add structured handler
         logger.remove()
         logger.add(
-            lambda msg: print(msg, end=''),
+            self._enqueue_log_record,
             format="{message}",  # Use simple format since we handle formatting in _format_log_record
-            level="DEBUG"
+            level=self.level
         )
+        
+        _ensure_log_writer()
+    
+    def _enqueue_log_record(self, message) -> None:
+        """Loguru sink: format the record as a JSON line and queue it for the writer."""
+        _LOG_QUEUE.put(self._format_log_record(message.record))
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Block until all previously logged messages have been written.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if the queue drained, False if the timeout expired
+        """
+        return _flush_log_queue(timeout)
+    
+    def _format_timestamp(self, moment: datetime) -> str:
+        """
+        Format a record time as ISO 8601, reusing the string within a millisecond.
+        
+        Bursts of records from one thread usually share a millisecond, so
+        the last formatted value is cached per thread; records in the same
+        millisecond get the first record's timestamp.
+        
+        Args:
+            moment: Record time
+            
+        Returns:
+            ISO 8601 timestamp string
+        """
+        moment_ms = int(moment.timestamp() * 1000)
+        cached = getattr(self._timestamp_cache, 'value', None)
+        if cached is not None and cached[0] == moment_ms:
+            return cached[1]
+        
+        timestamp = moment.isoformat()
+        self._timestamp_cache.value = (moment_ms, timestamp)
+        return timestamp
+    
+    def _get_static_log_prefix(self, process_id: int) -> bytes:
+        """
+        Get the serialized fields shared by every record from a process.
+        
+        Args:
+            process_id: ID of the process that emitted the record
+            
+        Returns:
+            JSON object prefix ending in a comma, e.g. b'{"logger":"x","process_id":1,'
+        """
+        cached = self._static_log_prefix
+        if cached is not None and cached[0] == process_id:
+            return cached[1]
+        
+        # Rebuilt when the process ID changes, e.g. in a forked child
+        prefix = orjson.dumps({'logger': self.logger_name, 'process_id': process_id})[:-1] + b','
+        self._static_log_prefix = (process_id, prefix)
+        return prefix
     
     def _format_log_record(self, record) -> str:
         """Format log record with structured data."""
-        # Extract structured data from record
-        extra_data = record.get("extra", {})
-
-        # Build structured log entry
+        # Build structured log entry, only adding optional fields that are set
+        # 'logger' and 'process_id' come from the preserialized static prefix
         log_entry = {
-            'timestamp': record['time'].isoformat(),
+            'timestamp': self._format_timestamp(record['time']),
             'level': record['level'].name,
-            'logger': self.logger_name,
-            'message': record['message'],
-            'correlation_id': self.correlation_context.get_correlation_id(),
-            'thread_id': getattr(record.get('thread'), 'id', None),
-            'process_id': getattr(record.get('process'), 'id', None),
-            'module': record.get('name'),
-            'function': record.get('function'),
-            'line': record.get('line')
+            'message': record['message']
         }
 
+        correlation_id = self.correlation_context.get_correlation_id()
+        if correlation_id is not None:
+            log_entry['correlation_id'] = correlation_id
+
+        thread = record.get('thread')
+        if thread is not None:
+            log_entry['thread_id'] = thread.id
+
+        module = record.get('name')
+        if module is not None:
+            log_entry['module'] = module
+
+        function = record.get('function')
+        if function is not None:
+            log_entry['function'] = function
+
+        line = record.get('line')
+        if line is not None:
+            log_entry['line'] = line
+
         # Add any extra structured data
+        extra_data = record.get("extra")
         if extra_data:
-            log_entry.update(extra_data)
+            for key, value in extra_data.items():
+                if value is not None:
+                    log_entry[key] = value
 
-        # Remove None values for cleaner output
-        log_entry = {k: v for k, v in log_entry.items() if v is not None}
+        process = record.get('process')
+        if process is None or 'logger' in log_entry or 'process_id' in log_entry:
+            # No usable static prefix; serialize every field together
+            log_entry.setdefault('logger', self.logger_name)
+            if process is not None:
+                log_entry.setdefault('process_id', process.id)
+            return orjson.dumps(log_entry, default=str, option=_LOG_JSON_OPTIONS).decode()
 
-        return json.dumps(log_entry, default=str) + '\n'
+        # Splice the dynamic fields (minus their opening brace) onto the prefix
+        dynamic_json = orjson.dumps(log_entry, default=str, option=_LOG_JSON_OPTIONS)
+        return (self._get_static_log_prefix(process.id) + dynamic_json[1:]).decode()
     
     def generate_correlation_id(self) -> str:
-        """Generate a new correlation ID."""
-        return str(uuid.uuid4())
+        """Generate a new correlation ID (a random version 4 UUID string)."""
+        # Lay out os.urandom hex digits directly instead of building a uuid.UUID
+        digits = os.urandom(16).hex()
+        variant = _UUID_VARIANT_DIGITS[int(digits[16], 16) & 3]
+        return f"{digits[:8]}-{digits[8:12]}-4{digits[13:16]}-{variant}{digits[17:20]}-{digits[20:]}"
     
     def set_correlation_id(self, correlation_id: Optional[str] = None) -> str:
         """
@@ -235,24 +623,58 @@ class StructuredLogger:
         """Clear current correlation ID."""
         self.correlation_context.clear_correlation_id()
     
-    def _log_with_structure(self, level: str, message: str, **kwargs) -> None:
-        """Log message with structured data."""
-        # Record metrics if operation is specified
-        if 'operation' in kwargs:
-            operation = kwargs['operation']
-            duration_ms = kwargs.get('duration_ms')
-            status = kwargs.get('status', 'unknown')
-            error_type = kwargs.get('exception_type')
+    def _log_with_structure(self,
+                            level: str,
+                            message: str,
+                            operation: Optional[str] = None,
+                            duration_ms: Optional[float] = None,
+                            status: Optional[str] = None,
+                            exception_type: Optional[str] = None,
+                            service: Optional[str] = None,
+                            **kwargs) -> None:
+        """
+        Log message with structured data.
+        
+        The fields that drive metrics are named parameters so they are plain
+        locals here; any that are set are passed on to the log record along
+        with the remaining keyword arguments.
+        
+        Args:
+            level: Upper-case level name, a key of _LEVEL_METHODS
+            message: Log message
+            operation: Operation to record metrics for
+            duration_ms: Operation duration in milliseconds
+            status: Operation status (recorded as 'unknown' if not given)
+            exception_type: Exception class name for error metrics
+            service: Service to record a request for
+            **kwargs: Additional structured data
+        """
+        metrics_collector = self.metrics_collector
 
-            self.metrics_collector.record_operation(operation, duration_ms, status, error_type)
+        # Record metrics if operation is specified
+        if operation is not None:
+            metrics_collector.record_operation(operation, duration_ms, status or 'unknown', exception_type)
+            kwargs['operation'] = operation
 
         # Record service requests
-        if 'service' in kwargs:
-            self.metrics_collector.record_request(kwargs['service'])
+        if service is not None:
+            metrics_collector.record_request(service)
+            kwargs['service'] = service
 
         # Record errors
-        if level.upper() == 'ERROR' and 'exception_type' in kwargs:
-            self.metrics_collector.record_error(kwargs['exception_type'])
+        if exception_type is not None:
+            if level == 'ERROR':
+                metrics_collector.record_error(exception_type)
+            kwargs['exception_type'] = exception_type
+
+        # Metrics are always recorded; skip building the record for filtered levels
+        if _LEVEL_NUMBERS[level] < self._min_level_no:
+            return
+
+        if duration_ms is not None:
+            kwargs['duration_ms'] = duration_ms
+        if status is not None:
+            kwargs['status'] = status
 
         # Add correlation ID to the log data
         correlation_id = self.correlation_context.get_correlation_id()
@@ -260,7 +682,21 @@ class StructuredLogger:
             kwargs['correlation_id'] = correlation_id
 
         # Log with structured data
-        getattr(logger, level.lower())(message, **kwargs)
+        getattr(logger, _LEVEL_METHODS[level])(message, **kwargs)
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether messages at a level would be emitted.
+        
+        Callers can use this to skip computing expensive log arguments.
+        
+        Args:
+            level: Level name ('DEBUG', 'INFO', 'WARNING' or 'ERROR')
+            
+        Returns:
+            True if the level is at or above the logger's minimum level
+        """
+        return _LEVEL_NUMBERS[level] >= self._min_level_no
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with structured data."""
@@ -297,6 +733,10 @@ class StructuredLogger:
         """Get collected metrics."""
         return self.metrics_collector.get_metrics()
     
+    def get_metrics_json(self) -> bytes:
+        """Get collected metrics serialized as JSON."""
+        return self.metrics_collector.get_metrics_json()
+    
     def reset_metrics(self) -> None:
         """Reset collected metrics."""
         self.metrics_collector.reset_metrics()
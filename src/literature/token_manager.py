@@ -6,63 +6,149 @@ management for publisher APIs with encryption and expiration handling.
 """
 
 import os
+import re
 import json
 import time
+import base64
+import atexit
 import hashlib
 import secrets
+import threading
+import weakref
 from typing import Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from loguru import logger
 
 
+# Tokens are treated as expired this many seconds before their actual expiry
+_EXPIRY_BUFFER_SECONDS = 300
+
+# Leading byte of AES-GCM token files; older Fernet files start with base64 text
+_STORAGE_FORMAT_VERSION = b'\x01'
+_NONCE_SIZE = 12
+
+# Scrypt parameters for passphrase keys (32 MiB of memory per derivation)
+_KDF_SALT_SIZE = 16
+_KDF_N = 2 ** 15
+_KDF_R = 8
+_KDF_P = 1
+
+# At least 10 characters after stripping, measured after any known scheme prefix.
+# The prefix is matched atomically (lookahead + backreference) so a prefixed
+# token whose remainder is too short cannot fall back to matching as a whole.
+_TOKEN_FORMAT_RE = re.compile(r'(?=((?:Bearer |Token |API-Key )?))\1\s*\S.{8,}\S', re.DOTALL)
+
+# Live token managers, flushed by a single exit hook without keeping them alive
+_LIVE_MANAGERS = weakref.WeakSet()
+
+
+def _flush_live_managers() -> None:
+    """Write pending token changes of every live TokenManager at exit."""
+    for manager in list(_LIVE_MANAGERS):
+        try:
+            manager.flush()
+        except Exception:
+            # Already logged by _save_tokens; keep flushing the other managers
+            pass
+
+
+atexit.register(_flush_live_managers)
+
+
 class TokenManager:
     """
     Secure token manager for API authentication.
     
     Provides encrypted storage, automatic refresh, and expiration handling
     for authentication tokens used with publisher APIs.
+    
+    Use TokenManager.get() to share one instance per storage file and key
+    instead of repeating key setup and decryption on every construction.
     """
     
-    def __init__(self, storage_path: str = "config/tokens.enc", encryption_key: Optional[str] = None):
+    # Shared instances keyed by (resolved storage path, key fingerprint)
+    _shared_instances: Dict[Tuple[str, Optional[str]], 'TokenManager'] = {}
+    _shared_instances_lock = threading.Lock()
+    
+    def __init__(self, storage_path: str = "config/tokens.enc", encryption_key: Optional[str] = None,
+                 flush_interval: Optional[float] = 0.5):
         """
         Initialize the token manager.
 
         Args:
             storage_path: Path to encrypted token storage file
-            encryption_key: Optional encryption key (generated if not provided)
+            encryption_key: Optional passphrase, stretched with scrypt (a random
+                key file is generated and used if not provided)
+            flush_interval: Seconds to coalesce token changes before writing them
+                to storage; None or 0 writes on every change
         """
         self.storage_path = Path(storage_path)
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = logger
 
-        # Initialize encryption
+        # Initialize encryption; only the generated key file holds a ready-made key
         if encryption_key:
-            # If custom key provided, it should be base64-encoded Fernet key
             if isinstance(encryption_key, str):
-                try:
-                    self.cipher = Fernet(encryption_key.encode())
-                except Exception:
-                    # If not valid Fernet key, generate one from the string
-                    key_bytes = hashlib.sha256(encryption_key.encode()).digest()
-                    fernet_key = Fernet.generate_key()
-                    self.cipher = Fernet(fernet_key)
-                    self.encryption_key = fernet_key
-            else:
-                self.cipher = Fernet(encryption_key)
-                self.encryption_key = encryption_key
+                encryption_key = encryption_key.encode()
+            self.encryption_key = encryption_key
+            aes_key = self._derive_aes_key(encryption_key)
         else:
             self.encryption_key = self._get_or_create_encryption_key()
-            self.cipher = Fernet(self.encryption_key)
+            aes_key = self._derive_aes_key(self.encryption_key, from_key_file=True)
+        self.cipher = AESGCM(aes_key)
 
-        # Token storage
+        # Token storage; _tokens_lock guards changes against concurrent serialization
         self.tokens = {}
         self.refresh_callbacks = {}
+        self._tokens_lock = threading.Lock()
+
+        # Deferred persistence state
+        self.flush_interval = flush_interval
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        # Set after a deferred save fails, so the next change saves synchronously
+        self._save_failed = False
+        self._flush_timer = None
+        _LIVE_MANAGERS.add(self)
 
         # Load existing tokens
         self._load_tokens()
     
+    @classmethod
+    def get(cls, storage_path: str = "config/tokens.enc",
+            encryption_key: Optional[str] = None) -> 'TokenManager':
+        """
+        Get a shared token manager for a storage path and encryption key.
+        
+        The first call constructs the manager (loading and decrypting the
+        token file); later calls with the same path and key return the same
+        instance. Keys are identified by a SHA-256 fingerprint so the cache
+        key does not hold them in plain form.
+        
+        Args:
+            storage_path: Path to encrypted token storage file
+            encryption_key: Optional encryption key (generated if not provided)
+            
+        Returns:
+            Shared TokenManager instance
+        """
+        key_fingerprint = None
+        if encryption_key:
+            key_bytes = encryption_key.encode() if isinstance(encryption_key, str) else encryption_key
+            key_fingerprint = hashlib.sha256(key_bytes).hexdigest()
+        cache_key = (str(Path(storage_path).resolve()), key_fingerprint)
+        
+        with cls._shared_instances_lock:
+            manager = cls._shared_instances.get(cache_key)
+            if manager is None:
+                manager = cls(storage_path, encryption_key)
+                cls._shared_instances[cache_key] = manager
+            return manager
+    
     def _get_or_create_encryption_key(self) -> bytes:
         """
         Get or create encryption key for token storage.
@@ -76,14 +162,58 @@ class TokenManager:
             with open(key_path, 'rb') as f:
                 return f.read()
         else:
-            # Generate new key
-            key = Fernet.generate_key()
+            # Generate new raw AES-256 key
+            key = AESGCM.generate_key(bit_length=256)
             with open(key_path, 'wb') as f:
                 f.write(key)
             # Set restrictive permissions
             os.chmod(key_path, 0o600)
             return key
     
+    def _get_or_create_kdf_salt(self) -> bytes:
+        """
+        Get or create the salt used to derive keys from passphrases.
+        
+        Returns:
+            Salt bytes stored next to the token file
+        """
+        salt_path = self.storage_path.with_suffix('.salt')
+        
+        if salt_path.exists():
+            with open(salt_path, 'rb') as f:
+                return f.read()
+        else:
+            salt = os.urandom(_KDF_SALT_SIZE)
+            with open(salt_path, 'wb') as f:
+                f.write(salt)
+            # Set restrictive permissions
+            os.chmod(salt_path, 0o600)
+            return salt
+    
+    def _derive_aes_key(self, encryption_key: bytes, from_key_file: bool = False) -> bytes:
+        """
+        Derive the 256-bit AES-GCM key for an encryption key.
+        
+        Keys read from the generated key file are used as-is (raw 32-byte
+        keys) or decoded (Fernet keys from older versions). Every
+        caller-supplied key is treated as a passphrase, whatever its length
+        or encoding, and stretched with scrypt using a per-store salt.
+        
+        Args:
+            encryption_key: Key file contents or passphrase
+            from_key_file: Whether the key was read from the generated key file
+            
+        Returns:
+            32-byte AES key
+        """
+        if from_key_file:
+            if len(encryption_key) == 32:
+                return encryption_key
+            return base64.urlsafe_b64decode(encryption_key)
+        
+        kdf = Scrypt(salt=self._get_or_create_kdf_salt(), length=32, n=_KDF_N, r=_KDF_R, p=_KDF_P)
+        return kdf.derive(encryption_key)
+    
     def _load_tokens(self) -> None:
         """Load tokens from encrypted storage."""
         if not self.storage_path.exists():
@@ -94,7 +224,13 @@ class TokenManager:
                 encrypted_data = f.read()
             
             if encrypted_data:
-                decrypted_data = self.cipher.decrypt(encrypted_data)
+                if encrypted_data[:1] == _STORAGE_FORMAT_VERSION:
+                    nonce = encrypted_data[1:1 + _NONCE_SIZE]
+                    ciphertext = encrypted_data[1 + _NONCE_SIZE:]
+                    decrypted_data = self.cipher.decrypt(nonce, ciphertext, _STORAGE_FORMAT_VERSION)
+                else:
+                    # Token file written by an earlier Fernet-based version
+                    decrypted_data = Fernet(self.encryption_key).decrypt(encrypted_data)
                 self.tokens = json.loads(decrypted_data.decode())
                 self.logger.info(f"Loaded {len(self.tokens)} tokens from storage")
         except Exception as e:
@@ -104,9 +240,12 @@ class TokenManager:
     def _save_tokens(self) -> None:
         """Save tokens to encrypted storage."""
         try:
-            # Serialize tokens
-            token_data = json.dumps(self.tokens, indent=2)
-            encrypted_data = self.cipher.encrypt(token_data.encode())
+            # Serialize tokens; holding the lock keeps the dict from changing mid-dump
+            with self._tokens_lock:
+                token_data = json.dumps(self.tokens)
+            nonce = os.urandom(_NONCE_SIZE)
+            encrypted_data = (_STORAGE_FORMAT_VERSION + nonce +
+                              self.cipher.encrypt(nonce, token_data.encode(), _STORAGE_FORMAT_VERSION))
             
             # Write to file with atomic operation
             temp_path = self.storage_path.with_suffix('.tmp')
@@ -124,6 +263,67 @@ class TokenManager:
             self.logger.error(f"Failed to save tokens: {str(e)}")
             raise
     
+    def _schedule_save(self) -> None:
+        """
+        Mark tokens as changed and persist them after the flush interval.
+        
+        Saves immediately, raising any error to the caller, when deferred
+        saving is disabled or the last deferred save failed.
+        """
+        if not self.flush_interval:
+            self._save_tokens()
+            return
+        
+        with self._save_lock:
+            self._dirty = True
+            if self._save_failed:
+                # Save now so the error reaches the caller instead of a log line
+                self._cancel_flush_timer()
+                self._save_tokens()
+                self._dirty = False
+                self._save_failed = False
+                return
+            
+            # A pending timer already covers this change
+            if self._flush_timer is None:
+                self._start_flush_timer()
+    
+    def _start_flush_timer(self) -> None:
+        """Start the timer that persists pending changes (caller holds _save_lock)."""
+        self._flush_timer = threading.Timer(self.flush_interval, self._flush_if_dirty)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _cancel_flush_timer(self) -> None:
+        """Cancel a pending flush timer (caller holds _save_lock)."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+    
+    def _flush_if_dirty(self) -> None:
+        """Persist pending token changes from the flush timer."""
+        with self._save_lock:
+            self._flush_timer = None
+            if not self._dirty:
+                return
+            try:
+                self._save_tokens()
+                self._dirty = False
+                self._save_failed = False
+            except Exception:
+                # Already logged by _save_tokens; retry after another interval
+                self._save_failed = True
+                self._start_flush_timer()
+    
+    def flush(self) -> None:
+        """Write pending token changes to encrypted storage immediately."""
+        with self._save_lock:
+            self._cancel_flush_timer()
+            if self._dirty:
+                self._save_tokens()
+                self._dirty = False
+                self._save_failed = False
+    
     def _is_token_expired(self, token_info: Dict[str, Any]) -> bool:
         """
         Check if a token is expired.
@@ -134,12 +334,17 @@ class TokenManager:
         Returns:
             True if token is expired, False otherwise
         """
+        # Fast path: precomputed POSIX deadline with the buffer already applied
+        expires_at_ts = token_info.get('expires_at_ts')
+        if expires_at_ts is not None:
+            return time.time() >= expires_at_ts
+        
         if 'expires_at' not in token_info:
             return False
         
         expires_at = datetime.fromisoformat(token_info['expires_at'])
         # Consider token expired if it expires within 5 minutes
-        buffer_time = timedelta(minutes=5)
+        buffer_time = timedelta(seconds=_EXPIRY_BUFFER_SECONDS)
         return datetime.now() + buffer_time >= expires_at
     
     def store_token(self, api_name: str, token: str, expires_in: Optional[int] = None, 
@@ -163,13 +368,15 @@ class TokenManager:
         if expires_in:
             expires_at = datetime.now() + timedelta(seconds=expires_in)
             token_info['expires_at'] = expires_at.isoformat()
+            token_info['expires_at_ts'] = expires_at.timestamp() - _EXPIRY_BUFFER_SECONDS
             token_info['expires_in'] = expires_in
         
         if refresh_token:
             token_info['refresh_token'] = refresh_token
         
-        self.tokens[api_name] = token_info
-        self._save_tokens()
+        with self._tokens_lock:
+            self.tokens[api_name] = token_info
+        self._schedule_save()
         
         self.logger.info(f"Stored token for API: {api_name}")
     
@@ -274,9 +481,10 @@ class TokenManager:
         Returns:
             True if token was removed, False if not found
         """
-        if api_name in self.tokens:
-            del self.tokens[api_name]
-            self._save_tokens()
+        with self._tokens_lock:
+            removed = self.tokens.pop(api_name, None) is not None
+        if removed:
+            self._schedule_save()
             self.logger.info(f"Revoked token for API: {api_name}")
             return True
         return False
@@ -310,16 +518,19 @@ class TokenManager:
         """
         expired_apis = []
         
-        for api_name, token_info in self.tokens.items():
-            if self._is_token_expired(token_info) and 'refresh_token' not in token_info:
-                expired_apis.append(api_name)
+        with self._tokens_lock:
+            for api_name, token_info in self.tokens.items():
+                if self._is_token_expired(token_info) and 'refresh_token' not in token_info:
+                    expired_apis.append(api_name)
+            
+            for api_name in expired_apis:
+                del self.tokens[api_name]
         
         for api_name in expired_apis:
-            del self.tokens[api_name]
             self.logger.info(f"Cleaned up expired token for {api_name}")
         
         if expired_apis:
-            self._save_tokens()
+            self._schedule_save()
         
         return len(expired_apis)
     
@@ -333,17 +544,7 @@ class TokenManager:
         Returns:
             True if format appears valid, False otherwise
         """
-        if not token or not isinstance(token, str):
-            return False
-
-        # Basic validation - token should be non-empty and reasonable length
-        if len(token.strip()) < 10:
+        if not isinstance(token, str):
             return False
 
-        # Check for common token patterns
-        if token.startswith(('Bearer ', 'Token ', 'API-Key ')):
-            # For prefixed tokens, check the actual token part
-            token_part = token.split(' ', 1)[1] if ' ' in token else token
-            return len(token_part.strip()) >= 10
-
-        return True
+        return _TOKEN_FORMAT_RE.match(token) is not None
@@ -5,12 +5,19 @@ This module provides functionality for automated validation of ontology terms
 through cross-reference validation and multi-metric scoring systems.
 """
 
-import json
+import re
+import asyncio
+import hashlib
+import threading
 import numpy as np
+from string import Template
 from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 import time
 from collections import defaultdict
+from contextlib import contextmanager
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from SPARQLWrapper import SPARQLWrapper, JSON
@@ -18,8 +25,24 @@ except ImportError:
     SPARQLWrapper = None
     JSON = None
 
+import orjson
 from loguru import logger
 
+from .result_cache import MISSING, ResultCache
+
+
+# Matches strings with no letters (only digits, punctuation, whitespace or underscores)
+_NO_LETTERS = re.compile(r'^[\W\d_]*$').match
+
+# Label lookup patterns; exact matching binds every term through one VALUES clause,
+# full-text endpoints need one UNION block per term
+_EXACT_MATCH_PATTERN = "VALUES ?t { $values } ?term rdfs:label ?label . FILTER(LCASE(STR(?label)) = ?t)"
+_JENA_TEXT_BLOCK = Template('{ ?term text:query (rdfs:label "$literal") . BIND("$literal" AS ?t) }')
+_VIRTUOSO_BLOCK = Template('{ ?term rdfs:label ?label . ?label bif:contains "\'$phrase\'" . BIND("$literal" AS ?t) }')
+
+# orjson options for indented, UTF-8 report files
+_REPORT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 class AutomatedValidator:
     """
@@ -50,9 +73,22 @@ class AutomatedValidator:
                 "validation_confidence": 0.3,
                 "cluster_coherence": 0.15
             },
+            "source_weights": {
+                "Plant Ontology": 1.0,
+                "Gene Ontology": 0.8
+            },
             "sparql_timeout": 30,
+            "max_concurrent_queries": 32,
+            "sparql_batch_size": 50,
+            "endpoint_features": {},
             "max_retries": 3,
-            "validation_cache": True
+            "validation_cache": True,
+            "keep_individual_results": False,
+            "cache_dir": None,
+            "cache_max_entries": 100000,
+            "cache_ttl": 86400,
+            "negative_cache_ttl": 3600,
+            "min_query_length": 2
         }
         
         # Merge with provided config
@@ -64,8 +100,15 @@ class AutomatedValidator:
         for key, value in kwargs.items():
             self.config[key] = value
         
-        # Initialize validation cache
-        self.validation_cache = {} if self.config["validation_cache"] else None
+        # Initialize validation cache, persisted under cache_dir when one is configured
+        if self.config["validation_cache"]:
+            self.validation_cache = ResultCache(
+                max_entries=self.config["cache_max_entries"],
+                ttl=self.config["cache_ttl"],
+                cache_dir=self.config["cache_dir"]
+            )
+        else:
+            self.validation_cache = None
         
         # SPARQL endpoints for different ontologies
         self.sparql_endpoints = {
@@ -73,6 +116,15 @@ class AutomatedValidator:
             "Gene Ontology": "http://sparql.geneontology.org/sparql",
             "Chemical Ontology": "http://sparql.bioontology.org/sparql"
         }
+        
+        # Compiled validation query templates, keyed by (source, endpoint feature)
+        self._query_templates = {}
+        
+        # Idle configured SPARQLWrapper clients per endpoint, checked out one query
+        # at a time; worker threads change with every asyncio.run, so the pool is
+        # owned by the validator rather than by threads
+        self._sparql_clients: Dict[str, List["SPARQLWrapper"]] = defaultdict(list)
+        self._sparql_clients_lock = threading.Lock()
     
     def cross_reference_validation(self, terms: List[str]) -> Dict[str, Dict[str, Any]]:
         """
@@ -89,20 +141,31 @@ class AutomatedValidator:
         
         validation_results = {}
         ontology_sources = self.config["ontology_sources"]
+        min_length = self.config["min_query_length"]
+        
+        # Terms without letters or too short to match anything never reach an endpoint
+        queryable = {
+            term for term in terms
+            if isinstance(term, str) and len(term.strip()) >= min_length and not _NO_LETTERS(term)
+        }
+        source_results = self._run_coroutine(
+            self._avalidate([term for term in terms if term in queryable], ontology_sources)
+        )
         
         for term in terms:
+            if term not in queryable:
+                validation_results[term] = {
+                    "found": False,
+                    "confidence": 0.0,
+                    "source": "None",
+                    "sources_checked": ontology_sources
+                }
+                continue
+            
             term_results = []
             
             for source in ontology_sources:
-                # Check cache first
-                cache_key = f"{term}_{source}"
-                if self.validation_cache and cache_key in self.validation_cache:
-                    result = self.validation_cache[cache_key]
-                else:
-                    result = self._query_external_ontology(term, source)
-                    if self.validation_cache:
-                        self.validation_cache[cache_key] = result
-                
+                result = source_results[(term, source)]
                 if term in result:
                     term_results.append(result[term])
             
@@ -136,34 +199,29 @@ class AutomatedValidator:
         scoring_results = {}
         weights = self.config["scoring_weights"]
         
-        # Extract raw scores for normalization
-        raw_scores = defaultdict(list)
+        # Extract raw scores into a (metrics x terms) matrix for normalization
+        metrics = list(weights.keys())
         terms = list(term_data.keys())
-        
-        for term, data in term_data.items():
-            for metric in weights.keys():
-                if metric in data:
-                    raw_scores[metric].append(data[metric])
-                else:
-                    raw_scores[metric].append(0.0)
+        term_values = list(term_data.values())
+        raw_scores = np.empty((len(metrics), len(terms)), dtype=np.float64)
+        for row, metric in enumerate(metrics):
+            raw_scores[row] = np.fromiter(
+                (data.get(metric, 0.0) for data in term_values),
+                dtype=np.float64,
+                count=len(term_values)
+            )
         
         # Normalize scores
-        normalized_scores = self._normalize_scores(raw_scores)
+        normalized_scores = self._normalize_matrix(raw_scores)
         
-        # Calculate combined scores
-        for i, term in enumerate(terms):
-            component_scores = {}
-            combined_score = 0.0
-            
-            for metric, weight in weights.items():
-                if metric in normalized_scores:
-                    score = normalized_scores[metric][i]
-                    component_scores[metric] = score
-                    combined_score += weight * score
-            
+        # Calculate combined scores as the weighted sum over metrics
+        weight_vector = np.array([weights[metric] for metric in metrics], dtype=np.float64)
+        combined_scores = weight_vector @ normalized_scores
+        
+        for term, component_row, combined_score in zip(terms, normalized_scores.T.tolist(), combined_scores.tolist()):
             scoring_results[term] = {
                 "combined_score": combined_score,
-                "component_scores": component_scores
+                "component_scores": dict(zip(metrics, component_row))
             }
         
         self.logger.info(f"Calculated multi-metric scores for {len(terms)} terms")
@@ -185,11 +243,15 @@ class AutomatedValidator:
         
         # Prepare data for scoring
         if term_metadata:
-            scoring_data = term_metadata.copy()
-            # Add validation confidence to scoring data
-            for term in terms:
-                if term in validation_results and term in scoring_data:
-                    scoring_data[term]["validation_confidence"] = validation_results[term]["confidence"]
+            # Add validation confidence to scoring data, copying only the entries that
+            # change so the caller's metadata dicts are left untouched
+            scoring_data = {
+                term: (
+                    {**metadata, "validation_confidence": validation_results[term]["confidence"]}
+                    if term in validation_results else metadata
+                )
+                for term, metadata in term_metadata.items()
+            }
         else:
             # Create minimal scoring data from validation results
             scoring_data = {}
@@ -207,18 +269,15 @@ class AutomatedValidator:
         
         # Apply selection threshold
         threshold = self.config["selection_threshold"]
-        recommended_terms = []
-        rejected_terms = []
-        
-        for term in terms:
-            if term in scoring_results:
-                score = scoring_results[term]["combined_score"]
-                if score >= threshold:
-                    recommended_terms.append(term)
-                else:
-                    rejected_terms.append(term)
-            else:
-                rejected_terms.append(term)
+        # Unscored terms get -inf so a single vector comparison rejects them
+        combined_scores = np.fromiter(
+            (scoring_results[term]["combined_score"] if term in scoring_results else -np.inf for term in terms),
+            dtype=np.float64,
+            count=len(terms)
+        )
+        selected = combined_scores >= threshold
+        recommended_terms = list(compress(terms, selected.tolist()))
+        rejected_terms = list(compress(terms, (~selected).tolist()))
         
         return {
             "validation_results": validation_results,
@@ -254,11 +313,127 @@ class AutomatedValidator:
             "selection_threshold": self.config["selection_threshold"]
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(orjson.dumps(report_data, option=_REPORT_JSON_OPTIONS))
         
         self.logger.info(f"Generated validation report at {output_path}")
     
+    async def _avalidate(self, terms: List[str], ontology_sources: List[str]) -> Dict[Tuple[str, str], Dict[str, Dict[str, Any]]]:
+        """
+        Query every uncached (term, source) pair concurrently, in batches per source.
+        
+        Args:
+            terms: List of terms to validate
+            ontology_sources: Names of ontology sources to query
+            
+        Returns:
+            Dictionary mapping (term, source) pairs to query results
+        """
+        source_results = {}
+        pending_terms = {source: {} for source in ontology_sources}
+        
+        for term in terms:
+            for source in ontology_sources:
+                # Check cache first
+                if self.validation_cache is not None:
+                    cached = self.validation_cache.get(self._cache_key(term, source), MISSING)
+                    if cached is not MISSING:
+                        source_results[(term, source)] = cached
+                        continue
+                pending_terms[source][term] = None
+        
+        batch_size = self.config["sparql_batch_size"]
+        batches = []
+        for source, pending in pending_terms.items():
+            uncached = list(pending)
+            for start in range(0, len(uncached), batch_size):
+                batches.append((source, uncached[start:start + batch_size]))
+        
+        if not batches:
+            return source_results
+        
+        semaphore = asyncio.Semaphore(self.config["max_concurrent_queries"])
+        results = await asyncio.gather(
+            *(self._aquery_external_ontology_batch(semaphore, batch, source) for source, batch in batches),
+            return_exceptions=True
+        )
+        
+        found, not_found = {}, {}
+        for (source, batch), result in zip(batches, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Error querying {source} for {len(batch)} terms: {result}")
+                result = self._failed_results(batch, source, str(result))
+            
+            for term in batch:
+                term_result = result.get(term)
+                source_results[(term, source)] = {term: term_result} if term_result is not None else {}
+                
+                # Errors are not cached; misses are cached for a shorter time than hits
+                if term_result is None or "error" not in term_result:
+                    cached = found if term_result is not None and term_result.get("found") else not_found
+                    cached[self._cache_key(term, source)] = source_results[(term, source)]
+        
+        if self.validation_cache is not None:
+            self.validation_cache.update(found)
+            self.validation_cache.update(not_found, ttl=self.config["negative_cache_ttl"])
+        
+        return source_results
+    
+    def _cache_key(self, term: str, ontology_source: str) -> str:
+        """
+        Build the validation cache key for a term and ontology source.
+        
+        Args:
+            term: Queried term
+            ontology_source: Name of ontology source
+            
+        Returns:
+            Hex digest identifying the endpoint, term and source
+        """
+        endpoint_url = self.sparql_endpoints.get(ontology_source, "")
+        return hashlib.blake2b(f"{endpoint_url}|{term}|{ontology_source}".encode("utf-8"), digest_size=16).hexdigest()
+    
+    async def _aquery_external_ontology_batch(self, semaphore: asyncio.Semaphore, terms: List[str], ontology_source: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Run a blocking batched ontology query in a worker thread.
+        
+        Args:
+            semaphore: Semaphore bounding the number of in-flight queries
+            terms: Terms to query
+            ontology_source: Name of ontology source
+            
+        Returns:
+            Validation results keyed by term
+        """
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(self._query_external_ontology_batch, terms, ontology_source),
+                    timeout=self.config["sparql_timeout"]
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Timed out querying {ontology_source} for {len(terms)} terms")
+                return self._failed_results(terms, ontology_source, "Query timed out")
+    
+    @staticmethod
+    def _run_coroutine(coroutine):
+        """
+        Run a coroutine to completion from synchronous code.
+        
+        Args:
+            coroutine: Coroutine to run
+            
+        Returns:
+            Result of the coroutine
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        # Called from inside an event loop: run on a separate loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    
     def _query_external_ontology(self, term: str, ontology_source: str) -> Dict[str, Dict[str, Any]]:
         """
         Query an external ontology for term validation.
@@ -270,6 +445,22 @@ class AutomatedValidator:
         Returns:
             Validation result for the term
         """
+        return self._query_external_ontology_batch([term], ontology_source)
+    
+    def _query_external_ontology_batch(self, terms: List[str], ontology_source: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Query an external ontology for several terms with a single request.
+        
+        The terms are bound through a VALUES clause so the endpoint evaluates
+        one query per batch instead of one per term.
+        
+        Args:
+            terms: Terms to query
+            ontology_source: Name of ontology source
+            
+        Returns:
+            Validation results keyed by term
+        """
         if not SPARQLWrapper:
             self.logger.warning("SPARQLWrapper not available, returning mock results")
             return {
@@ -279,89 +470,203 @@ class AutomatedValidator:
                     "source": ontology_source,
                     "uri": f"http://example.org/{term}"
                 }
+                for term in terms
             }
         
         endpoint_url = self.sparql_endpoints.get(ontology_source)
         if not endpoint_url:
-            return {
-                term: {
-                    "found": False,
-                    "confidence": 0.0,
-                    "source": ontology_source,
-                    "error": "Unknown ontology source"
-                }
-            }
+            return self._failed_results(terms, ontology_source, "Unknown ontology source")
+        
+        # Terms are matched on their lowercase form, which is what ?t binds to
+        terms_by_value = defaultdict(list)
+        for term in terms:
+            terms_by_value[term.lower()].append(term)
+        query = self._build_validation_query(list(terms_by_value), ontology_source)
         
         try:
+            with self._sparql_client(endpoint_url) as sparql:
+                sparql.setQuery(query)
+                results = sparql.query().convert()
+            
+            # Keep the first matching URI for each queried value
+            uris = {}
+            for binding in results["results"]["bindings"]:
+                if "t" in binding:
+                    value = binding["t"]["value"]
+                elif len(terms_by_value) == 1:
+                    # A single-value batch needs no ?t to attribute its matches
+                    value = next(iter(terms_by_value))
+                else:
+                    continue
+                uris.setdefault(value, binding["term"]["value"])
+            
+            # Process results
+            validation_results = {}
+            for value, value_terms in terms_by_value.items():
+                for term in value_terms:
+                    if value in uris:
+                        validation_results[term] = {
+                            "found": True,
+                            "confidence": 0.9,  # High confidence for exact matches
+                            "source": ontology_source,
+                            "uri": uris[value]
+                        }
+                    else:
+                        validation_results[term] = {
+                            "found": False,
+                            "confidence": 0.0,
+                            "source": ontology_source,
+                            "uri": None
+                        }
+            return validation_results
+                
+        except (TimeoutError, Exception) as e:
+            self.logger.warning(f"Error querying {ontology_source} for {len(terms)} terms: {e}")
+            return self._failed_results(terms, ontology_source, str(e))
+    
+    @contextmanager
+    def _sparql_client(self, endpoint_url: str):
+        """
+        Check out an idle SPARQLWrapper for an endpoint, creating one if none is free.
+        
+        SPARQLWrapper keeps the query on the instance, so a client serves one
+        query at a time and goes back to the pool afterwards for later batches
+        and later validation calls.
+        
+        Args:
+            endpoint_url: SPARQL endpoint URL
+            
+        Yields:
+            Configured SPARQLWrapper instance
+        """
+        with self._sparql_clients_lock:
+            idle = self._sparql_clients[endpoint_url]
+            sparql = idle.pop() if idle else None
+        
+        if sparql is None:
             sparql = SPARQLWrapper(endpoint_url)
             sparql.setTimeout(self.config["sparql_timeout"])
+            sparql.setReturnFormat(JSON)
+        
+        try:
+            yield sparql
+        finally:
+            with self._sparql_clients_lock:
+                self._sparql_clients[endpoint_url].append(sparql)
+    
+    def _build_validation_query(self, values: List[str], ontology_source: str) -> str:
+        """
+        Build the label lookup query for a batch of lowercase term values.
+        
+        By default labels are matched exactly (ignoring case), which stores can
+        answer from their label index. Sources listed in the endpoint_features
+        config as "jena-text" or "virtuoso" use the endpoint's full-text index instead.
+        
+        Args:
+            values: Lowercase term values to look up
+            ontology_source: Name of ontology source
             
-            # Construct SPARQL query based on ontology source
+        Returns:
+            SPARQL query binding ?t to the matched value and ?term to the match
+        """
+        feature = self.config["endpoint_features"].get(ontology_source, "exact")
+        query_template = self._get_query_template(ontology_source, feature)
+        
+        if feature == "jena-text":
+            pattern = " UNION ".join(
+                _JENA_TEXT_BLOCK.substitute(literal=self._escape_sparql_literal(value))
+                for value in values
+            )
+            return query_template.substitute(pattern=pattern, limit=10 * len(values))
+        
+        if feature == "virtuoso":
+            # bif:contains takes a single-quoted free-text phrase, so quotes are dropped from it
+            pattern = " UNION ".join(
+                _VIRTUOSO_BLOCK.substitute(
+                    literal=self._escape_sparql_literal(value),
+                    phrase=self._escape_sparql_literal(value.replace("'", " "))
+                )
+                for value in values
+            )
+            return query_template.substitute(pattern=pattern, limit=10 * len(values))
+        
+        literals = " ".join(f'"{self._escape_sparql_literal(value)}"' for value in values)
+        return query_template.substitute(values=literals, limit=10 * len(values))
+    
+    def _get_query_template(self, ontology_source: str, feature: str) -> Template:
+        """
+        Get the compiled query template for an ontology source and endpoint feature.
+        
+        Prefixes and the fixed parts of the query are assembled once per
+        (source, feature); only the term values change between batches.
+        
+        Args:
+            ontology_source: Name of ontology source
+            feature: Label matching syntax ("exact", "jena-text" or "virtuoso")
+            
+        Returns:
+            Template with $limit and either $values or $pattern placeholders
+        """
+        template = self._query_templates.get((ontology_source, feature))
+        if template is None:
+            prefixes = ["PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>"]
             if ontology_source == "Plant Ontology":
-                query = f"""
-                PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-                PREFIX obo: <http://purl.obolibrary.org/obo/>
-                
-                SELECT ?term WHERE {{
-                    ?term rdfs:label ?label .
-                    FILTER(CONTAINS(LCASE(?label), LCASE("{term}")))
-                }}
-                LIMIT 10
-                """
-            else:
-                # Generic query for other ontologies
-                query = f"""
-                PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-                
-                SELECT ?term WHERE {{
-                    ?term rdfs:label ?label .
-                    FILTER(CONTAINS(LCASE(?label), LCASE("{term}")))
-                }}
-                LIMIT 10
-                """
+                prefixes.append("PREFIX obo: <http://purl.obolibrary.org/obo/>")
+            if feature == "jena-text":
+                prefixes.append("PREFIX text: <http://jena.apache.org/text#>")
             
-            sparql.setQuery(query)
-            sparql.setReturnFormat(JSON)
+            pattern = _EXACT_MATCH_PATTERN if feature not in ("jena-text", "virtuoso") else "$pattern"
+            template = Template("\n".join(prefixes) + f"\nSELECT ?t ?term WHERE {{ {pattern} }}\nLIMIT $limit")
+            self._query_templates[(ontology_source, feature)] = template
+        return template
+    
+    @staticmethod
+    def _escape_sparql_literal(value: str) -> str:
+        """
+        Escape a string for use inside a double-quoted SPARQL literal.
+        
+        Args:
+            value: Raw string value
             
-            results = sparql.query().convert()
+        Returns:
+            Escaped string value
+        """
+        return (
+            value.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    
+    @staticmethod
+    def _failed_results(terms: List[str], ontology_source: str, error: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Build not-found results for terms whose query failed.
+        
+        Args:
+            terms: Terms that were queried
+            ontology_source: Name of ontology source
+            error: Error description
             
-            # Process results
-            if results["results"]["bindings"]:
-                return {
-                    term: {
-                        "found": True,
-                        "confidence": 0.9,  # High confidence for exact matches
-                        "source": ontology_source,
-                        "uri": results["results"]["bindings"][0]["term"]["value"]
-                    }
-                }
-            else:
-                return {
-                    term: {
-                        "found": False,
-                        "confidence": 0.0,
-                        "source": ontology_source,
-                        "uri": None
-                    }
-                }
-                
-        except (TimeoutError, Exception) as e:
-            self.logger.warning(f"Error querying {ontology_source} for term '{term}': {e}")
-            return {
-                term: {
-                    "found": False,
-                    "confidence": 0.0,
-                    "source": ontology_source,
-                    "error": str(e)
-                }
+        Returns:
+            Failed validation results keyed by term
+        """
+        return {
+            term: {
+                "found": False,
+                "confidence": 0.0,
+                "source": ontology_source,
+                "error": error
             }
+            for term in terms
+        }
     
     def _normalize_scores(self, raw_scores: Dict[str, List[float]]) -> Dict[str, List[float]]:
         """
         Normalize scores to 0-1 range using min-max normalization.
         
         Args:
-            raw_scores: Dictionary of raw score lists
+            raw_scores: Dictionary of raw score lists or 1-D arrays
             
         Returns:
             Dictionary of normalized score lists
@@ -369,24 +674,38 @@ class AutomatedValidator:
         normalized = {}
         
         for metric, scores in raw_scores.items():
-            if not scores:
+            if len(scores) == 0:
                 normalized[metric] = []
                 continue
             
-            min_score = min(scores)
-            max_score = max(scores)
-            
-            if max_score == min_score:
-                # All scores are the same
-                normalized[metric] = [1.0] * len(scores)
-            else:
-                normalized[metric] = [
-                    (score - min_score) / (max_score - min_score)
-                    for score in scores
-                ]
+            # Same kernel as the multi-metric matrix, applied to a single row
+            score_row = np.asarray(scores, dtype=np.float64).reshape(1, -1)
+            normalized[metric] = self._normalize_matrix(score_row)[0].tolist()
         
         return normalized
     
+    @staticmethod
+    def _normalize_matrix(raw_scores: np.ndarray) -> np.ndarray:
+        """
+        Min-max normalize each row of a (metrics x terms) score matrix.
+        
+        Rows whose scores are all the same normalize to 1.0.
+        
+        Args:
+            raw_scores: Raw score matrix with one row per metric
+            
+        Returns:
+            Normalized score matrix of the same shape
+        """
+        if raw_scores.size == 0:
+            return raw_scores
+        
+        min_scores = raw_scores.min(axis=1, keepdims=True)
+        max_scores = raw_scores.max(axis=1, keepdims=True)
+        constant = max_scores == min_scores
+        span = np.where(constant, 1.0, max_scores - min_scores)
+        return np.where(constant, 1.0, (raw_scores - min_scores) / span)
+    
     def _aggregate_validation_results(self, results_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Aggregate validation results from multiple sources.
@@ -403,16 +722,32 @@ class AutomatedValidator:
         # If any source found the term, consider it found
         found = any(result.get("found", False) for result in results_list)
         
-        # Calculate weighted average confidence
-        confidences = [result.get("confidence", 0.0) for result in results_list]
-        avg_confidence = sum(confidences) / len(confidences)
+        # Calculate weighted average confidence, weighting each source by its reliability
+        source_weights = self.config["source_weights"]
+        confidences = np.fromiter(
+            (result.get("confidence", 0.0) for result in results_list),
+            dtype=np.float64,
+            count=len(results_list)
+        )
+        weights = np.fromiter(
+            (source_weights.get(result.get("source"), 1.0) for result in results_list),
+            dtype=np.float64,
+            count=len(results_list)
+        )
+        total_weight = weights.sum()
+        avg_confidence = float(confidences @ weights / total_weight) if total_weight > 0 else 0.0
         
         # Collect sources
         sources = [result.get("source", "Unknown") for result in results_list]
         
-        return {
+        aggregated = {
             "found": found,
             "confidence": avg_confidence,
-            "source": ", ".join(sources),
-            "individual_results": results_list
+            "source": ", ".join(sources)
         }
+        
+        # Per-source results duplicate every row into the report, so they are opt-in
+        if self.config["keep_individual_results"]:
+            aggregated["individual_results"] = results_list
+        
+        return aggregated
@@ -5,20 +5,55 @@ This module provides functionality for analyzing literature corpus to extract
 term frequency information and calculate citation impact scores for ontology terms.
 """
 
-import json
+import os
+import time
+import random
 import logging
 from collections import Counter, defaultdict
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
+from functools import lru_cache
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 import re
+import numpy as np
 
 try:
     import scholarly
 except ImportError:
     scholarly = None
 
+import orjson
 from loguru import logger
 
+from .result_cache import MISSING, ResultCache
+from .term_counting import _LETTER_SEARCH, _count_chunk, _iter_valid_terms
+
+
+# orjson options for indented, UTF-8 report files
+_REPORT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Frequency workers are spawned, not forked: by the time a corpus is counted the
+# process runs the log writer and metrics threads, whose locks a fork could copy
+# while held. Workers only import the light term_counting module.
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_term(term: str, case_sensitive: bool) -> str:
+    """
+    Strip and optionally lowercase a term, memoized for frequently repeated terms.
+    
+    Args:
+        term: Raw term string
+        case_sensitive: Whether to keep the original case
+        
+    Returns:
+        Normalized term string
+    """
+    normalized = term.strip()
+    return normalized if case_sensitive else normalized.lower()
+
 
 class CorpusAnalyzer:
     """
@@ -46,13 +81,32 @@ class CorpusAnalyzer:
             "case_sensitive": False,
             "include_stopwords": False,
             "citation_weight": 0.3,
-            "frequency_weight": 0.7
+            "frequency_weight": 0.7,
+            "parallel_threshold": 250000,
+            "frequency_workers": None,
+            "citation_workers": 16,
+            "citation_jitter": 0.25,
+            "citation_cache": True,
+            "cache_dir": None,
+            "cache_max_entries": 100000,
+            "citation_cache_ttl": 30 * 86400
         }
         
         # Merge with provided config
         for key, value in self.default_config.items():
             if key not in self.config:
                 self.config[key] = value
+        
+        # Cache citation lookups, persisted under cache_dir when one is configured
+        if self.config["citation_cache"]:
+            self.citation_cache = ResultCache(
+                max_entries=self.config["cache_max_entries"],
+                ttl=self.config["citation_cache_ttl"],
+                cache_dir=self.config["cache_dir"],
+                name="citation_cache"
+            )
+        else:
+            self.citation_cache = None
     
     def analyze_term_frequency(self, 
                              corpus_data: List[Dict[str, Any]], 
@@ -70,15 +124,29 @@ class CorpusAnalyzer:
         if not corpus_data:
             return {}
         
-        term_counter = Counter()
+        term_options = (
+            self.config["min_term_length"],
+            self.config["max_term_length"],
+            self.config["case_sensitive"]
+        )
+        workers = self.config["frequency_workers"] or os.cpu_count() or 1
         
-        for document in corpus_data:
-            terms = document.get("terms", [])
-            
-            for term in terms:
-                normalized_term = self.normalize_term(term)
-                if self._is_valid_term(normalized_term):
-                    term_counter[normalized_term] += 1
+        term_counter = Counter()
+        if workers > 1 and len(corpus_data) >= self.config["parallel_threshold"]:
+            # Count slices of the corpus in worker processes and merge them in order;
+            # only the term lists are pickled, not the rest of each document
+            term_lists = [document.get("terms", []) for document in corpus_data]
+            chunk_size = -(-len(term_lists) // workers)
+            chunks = [
+                (term_lists[start:start + chunk_size],) + term_options
+                for start in range(0, len(term_lists), chunk_size)
+            ]
+            with _POOL_CONTEXT.Pool(processes=len(chunks)) as pool:
+                for partial_counter in pool.map(_count_chunk, chunks):
+                    term_counter.update(partial_counter)
+        else:
+            term_lists = (document.get("terms", []) for document in corpus_data)
+            term_counter.update(_iter_valid_terms(term_lists, *term_options))
         
         # Filter by minimum frequency
         filtered_terms = {
@@ -109,35 +177,14 @@ class CorpusAnalyzer:
             return {term: 0.0 for term in terms}
         
         citation_scores = {}
+        unique_terms = list(dict.fromkeys(terms))
         
-        for term in terms:
-            try:
-                # Search for publications related to the term
-                search_query = f'"{term}" plant metabolite'
-                publications = list(scholarly.search_pubs_query(search_query))
-                
-                if not publications:
-                    citation_scores[term] = 0.0
-                    continue
-                
-                # Calculate citation impact
-                total_citations = sum(
-                    getattr(pub, 'citedby', 0) for pub in publications[:10]  # Limit to top 10
-                )
-                
-                # Normalize by number of publications
-                avg_citations = total_citations / min(len(publications), 10)
-                
-                # Apply weighting if requested
-                if weight_recent:
-                    # Simple recency weighting (would need publication dates in real implementation)
-                    avg_citations *= 1.2
-                
-                citation_scores[term] = avg_citations
-                
-            except (TimeoutError, Exception) as e:
-                self.logger.warning(f"Error calculating citation impact for '{term}': {e}")
-                citation_scores[term] = 0.0
+        if unique_terms:
+            # Lookups are independent network round-trips, so run them concurrently
+            max_workers = min(self.config["citation_workers"], len(unique_terms))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                scores = executor.map(lambda term: self._one_term_citations(term, weight_recent), unique_terms)
+                citation_scores = dict(zip(unique_terms, scores))
         
         self.logger.info(f"Calculated citation impact for {len(terms)} terms")
         return citation_scores
@@ -159,35 +206,36 @@ class CorpusAnalyzer:
         terms = list(frequency_data.keys())
         citation_data = self.calculate_citation_impact(terms)
         
-        # Combine statistics
-        term_stats = {}
+        if not terms:
+            return {}
         
-        for term in terms:
-            frequency = frequency_data.get(term, 0)
-            citation_impact = citation_data.get(term, 0.0)
-            
-            # Calculate combined score
-            freq_weight = self.config["frequency_weight"]
-            cite_weight = self.config["citation_weight"]
-            
-            # Normalize frequency (simple min-max normalization)
-            max_freq = max(frequency_data.values()) if frequency_data else 1
-            normalized_freq = frequency / max_freq
-            
-            # Normalize citation impact
-            max_citations = max(citation_data.values()) if citation_data else 1
-            normalized_citations = citation_impact / max_citations if max_citations > 0 else 0
-            
-            combined_score = (freq_weight * normalized_freq + 
-                            cite_weight * normalized_citations)
-            
-            term_stats[term] = {
-                "frequency": frequency,
-                "citation_impact": citation_impact,
+        # Combine statistics over term-aligned arrays
+        freq_weight = self.config["frequency_weight"]
+        cite_weight = self.config["citation_weight"]
+        
+        frequencies = np.fromiter((frequency_data[term] for term in terms), dtype=np.float64, count=len(terms))
+        citations = np.fromiter((citation_data.get(term, 0.0) for term in terms), dtype=np.float64, count=len(terms))
+        
+        # Normalize frequency (simple min-max normalization)
+        normalized_freq = frequencies / frequencies.max()
+        
+        # Normalize citation impact
+        max_citations = max(citation_data.values()) if citation_data else 1
+        if max_citations > 0:
+            normalized_citations = citations / max_citations
+        else:
+            normalized_citations = np.zeros_like(citations)
+        
+        combined_scores = freq_weight * normalized_freq + cite_weight * normalized_citations
+        
+        return {
+            term: {
+                "frequency": frequency_data[term],
+                "citation_impact": citation_data.get(term, 0.0),
                 "combined_score": combined_score
             }
-        
-        return term_stats
+            for term, combined_score in zip(terms, combined_scores.tolist())
+        }
     
     def normalize_term(self, term: str) -> str:
         """
@@ -202,14 +250,7 @@ class CorpusAnalyzer:
         if not term:
             return ""
         
-        # Strip whitespace
-        normalized = term.strip()
-        
-        # Convert to lowercase if not case sensitive
-        if not self.config["case_sensitive"]:
-            normalized = normalized.lower()
-        
-        return normalized
+        return _normalize_term(term, self.config["case_sensitive"])
     
     def filter_terms_by_relevance(self, 
                                 term_stats: Dict[str, Dict[str, float]], 
@@ -247,8 +288,7 @@ class CorpusAnalyzer:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(orjson.dumps(results, option=_REPORT_JSON_OPTIONS))
         
         self.logger.info(f"Exported analysis results to {output_path}")
     
@@ -262,18 +302,61 @@ class CorpusAnalyzer:
         Returns:
             True if term is valid, False otherwise
         """
-        if not term:
-            return False
+        # Length checks are cheap, so they short-circuit before the letter search
+        return (
+            bool(term)
+            and self.config["min_term_length"] <= len(term) <= self.config["max_term_length"]
+            and _LETTER_SEARCH(term) is not None
+        )
+    
+    def _one_term_citations(self, term: str, weight_recent: bool = False) -> float:
+        """
+        Calculate the citation impact score for a single term.
         
-        # Check length constraints
-        if len(term) < self.config["min_term_length"]:
-            return False
+        Args:
+            term: Term to analyze
+            weight_recent: Whether to weight recent citations more heavily
+            
+        Returns:
+            Citation impact score, or 0.0 if the lookup fails
+        """
+        if self.citation_cache is not None:
+            avg_citations = self.citation_cache.get(term, MISSING)
+            if avg_citations is not MISSING:
+                return avg_citations * 1.2 if weight_recent else avg_citations
+        
+        # Spread concurrent requests out to stay under Scholar's rate limits
+        jitter = self.config["citation_jitter"]
+        if jitter > 0:
+            time.sleep(random.uniform(0, jitter))
+        
+        try:
+            # Search for publications related to the term
+            search_query = f'"{term}" plant metabolite'
+            publications = list(scholarly.search_pubs_query(search_query))
+            
+            if publications:
+                # Calculate citation impact
+                total_citations = sum(
+                    getattr(pub, 'citedby', 0) for pub in publications[:10]  # Limit to top 10
+                )
+                
+                # Normalize by number of publications
+                avg_citations = total_citations / min(len(publications), 10)
+            else:
+                avg_citations = 0.0
+            
+        except (TimeoutError, Exception) as e:
+            self.logger.warning(f"Error calculating citation impact for '{term}': {e}")
+            return 0.0
         
-        if len(term) > self.config["max_term_length"]:
-            return False
+        # Failed lookups are not cached so they are retried on the next run
+        if self.citation_cache is not None:
+            self.citation_cache[term] = avg_citations
         
-        # Check for basic validity (contains letters)
-        if not re.search(r'[a-zA-Z]', term):
-            return False
+        # Apply weighting if requested
+        if weight_recent:
+            # Simple recency weighting (would need publication dates in real implementation)
+            avg_citations *= 1.2
         
-        return True
+        return avg_citations
@@ -16,47 +16,76 @@ Supports the following 8 source ontologies:
 """
 
 import os
+import mmap
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import urlparse
 import json
+import sqlite3
 import time
+import queue
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 
 from ...literature.structured_logger import structured_logger
 
 
+@lru_cache(maxsize=256)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp from metadata; memoized since the same values are re-checked often."""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True, slots=True)
 class OntologySource:
-    """Configuration for an ontology source."""
+    """
+    Static configuration for an ontology source.
     
-    def __init__(self, 
-                 name: str,
-                 url: str,
-                 format: str = "owl",
-                 description: str = "",
-                 update_frequency_days: int = 7,
-                 priority: int = 1):
-        """
-        Initialize ontology source configuration.
-        
-        Args:
-            name: Short name identifier for the ontology
-            url: Download URL for the ontology
-            format: File format (owl, obo, json, etc.)
-            description: Human-readable description
-            update_frequency_days: How often to check for updates
-            priority: Priority for conflict resolution (1=highest)
-        """
-        self.name = name
-        self.url = url
-        self.format = format
-        self.description = description
-        self.update_frequency_days = update_frequency_days
-        self.priority = priority
-        self.last_updated = None
-        self.file_hash = None
-        self.file_size = None
+    Download state (last update, hash, size) lives in the downloader metadata.
+    
+    Attributes:
+        name: Short name identifier for the ontology
+        url: Download URL for the ontology
+        format: File format (owl, obo, json, etc.)
+        description: Human-readable description
+        update_frequency_days: How often to check for updates
+        priority: Priority for conflict resolution (1=highest)
+    """
+    name: str
+    url: str
+    format: str = "owl"
+    description: str = ""
+    update_frequency_days: int = 7
+    priority: int = 1
+
+
+# Largest slice of a mapped file passed to a single hasher update
+_HASH_WINDOW = 1 << 30
+
+# Span size hashed independently by _get_file_tree_hash
+_TREE_HASH_SPAN = 8 << 20
+
+# Chunk size requested from the HTTP response while streaming a download
+_DOWNLOAD_CHUNK = 1 << 18
+
+# Per-ontology metadata fields persisted as columns of the metadata table
+_METADATA_COLUMNS = (
+    'last_updated', 'file_hash', 'file_size', 'file_mtime_ns',
+    'url', 'format', 'etag', 'last_modified', 'tree_hash'
+)
+
+# Chunks buffered between the network reader and the hash/write stages
+_PIPELINE_DEPTH = 4
+
+# Upper bound on simultaneous downloads in download_all_ontologies
+_MAX_DOWNLOAD_WORKERS = 8
 
 
 class OntologyDownloader:
@@ -66,23 +95,79 @@ class OntologyDownloader:
     Handles caching, update checking, and validation of ontology files.
     """
     
-    def __init__(self, cache_dir: str = "data/ontologies/cache"):
+    def __init__(self, cache_dir: str = "data/ontologies/cache", min_request_interval: float = 1.0):
         """
         Initialize ontology downloader.
         
         Args:
             cache_dir: Directory to store cached ontology files
+            min_request_interval: Minimum seconds between request starts to the same host
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        self.metadata_file = self.cache_dir / "metadata.json"
+        self.metadata_file = self.cache_dir / "metadata.db"
+        self._legacy_metadata_file = self.cache_dir / "metadata.json"
+        self._metadata_db = sqlite3.connect(
+            str(self.metadata_file),
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._metadata_db.execute(
+            "CREATE TABLE IF NOT EXISTS ontology_metadata ("
+            "name TEXT PRIMARY KEY, last_updated TEXT, file_hash TEXT, file_size INTEGER, "
+            "file_mtime_ns INTEGER, url TEXT, format TEXT, etag TEXT, last_modified TEXT, "
+            "tree_hash TEXT)"
+        )
+        # Tables created before tree hashes were recorded lack the column
+        columns = {row[1] for row in self._metadata_db.execute("PRAGMA table_info(ontology_metadata)")}
+        if 'tree_hash' not in columns:
+            self._metadata_db.execute("ALTER TABLE ontology_metadata ADD COLUMN tree_hash TEXT")
         self.sources = self._initialize_sources()
+        
+        # Cache and temp file paths, built once per source instead of on every call
+        self._cache_files: Dict[str, Path] = {
+            name: self.cache_dir / f"{source.name}.{source.format}"
+            for name, source in self.sources.items()
+        }
+        self._temp_files: Dict[str, Path] = {
+            name: self.cache_dir / f"{source.name}.{source.format}.tmp"
+            for name, source in self.sources.items()
+        }
         self.metadata = self._load_metadata()
+        self._metadata_lock = threading.Lock()
+        
+        # (mtime_ns, size, sha256) per cached file, so unchanged files are not re-hashed
+        self._file_hashes: Dict[str, Tuple[int, int, str]] = {
+            str(self.cache_dir / f"{name}.{entry['format']}"): (entry['file_mtime_ns'], entry['file_size'], entry['file_hash'])
+            for name, entry in self.metadata.items()
+            if isinstance(entry, dict) and {'format', 'file_mtime_ns', 'file_size', 'file_hash'} <= entry.keys()
+        }
+        
+        # Per-host throttling: requests to one host start min_request_interval apart,
+        # while requests to different hosts never wait on each other
+        self.min_request_interval = min_request_interval
+        self._host_limiters: Dict[str, threading.Semaphore] = {}
+        self._host_last_request: Dict[str, float] = {}
+        self._host_limiters_lock = threading.Lock()
+        
+        # Shared session so downloads reuse pooled keep-alive connections
+        self.session = self._create_session()
+        
+        # When the earliest cached ontology goes stale; None while any needs an update
+        self._fresh_until = self._compute_fresh_until()
         
         # Set correlation ID for logging
         structured_logger.set_correlation_id()
     
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session whose connection pool serves every concurrent download."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_MAX_DOWNLOAD_WORKERS, pool_maxsize=_MAX_DOWNLOAD_WORKERS)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def _initialize_sources(self) -> Dict[str, OntologySource]:
         """Initialize the 8 source ontologies configuration."""
         sources = {
@@ -146,11 +231,20 @@ class OntologyDownloader:
         return sources
     
     def _load_metadata(self) -> Dict:
-        """Load cached metadata about downloaded ontologies."""
-        if self.metadata_file.exists():
+        """Load cached metadata about downloaded ontologies, importing a legacy metadata.json once."""
+        rows = self._metadata_db.execute(
+            f"SELECT name, {', '.join(_METADATA_COLUMNS)} FROM ontology_metadata"
+        ).fetchall()
+        if rows:
+            return {
+                row[0]: {column: value for column, value in zip(_METADATA_COLUMNS, row[1:]) if value is not None}
+                for row in rows
+            }
+        
+        if self._legacy_metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
+                with open(self._legacy_metadata_file, 'r') as f:
+                    metadata = json.load(f)
             except (json.JSONDecodeError, IOError) as e:
                 structured_logger.warning(
                     "Failed to load metadata file, starting fresh",
@@ -158,14 +252,35 @@ class OntologyDownloader:
                     error=str(e),
                     status="warning"
                 )
+            else:
+                self.metadata = metadata
+                self._save_metadata()
+                return metadata
         return {}
     
-    def _save_metadata(self) -> None:
-        """Save metadata about downloaded ontologies."""
+    def _save_metadata(self, source_name: Optional[str] = None) -> None:
+        """
+        Save metadata about downloaded ontologies.
+        
+        Args:
+            source_name: Ontology whose row is upserted; all rows are written when None
+        """
+        names = list(self.metadata) if source_name is None else [source_name]
+        rows = [
+            (name, *(self.metadata[name].get(column) for column in _METADATA_COLUMNS))
+            for name in names
+        ]
+        updates = ', '.join(f"{column} = excluded.{column}" for column in _METADATA_COLUMNS)
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2, default=str)
-        except IOError as e:
+            with self._metadata_db:
+                self._metadata_db.execute("BEGIN")
+                self._metadata_db.executemany(
+                    f"INSERT INTO ontology_metadata (name, {', '.join(_METADATA_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * (len(_METADATA_COLUMNS) + 1))}) "
+                    f"ON CONFLICT(name) DO UPDATE SET {updates}",
+                    rows
+                )
+        except sqlite3.Error as e:
             structured_logger.error(
                 "Failed to save metadata file",
                 operation="save_metadata",
@@ -173,32 +288,293 @@ class OntologyDownloader:
                 status="error"
             )
     
+    @staticmethod
+    def _make_hasher():
+        """
+        Create the SHA256 hasher used for file integrity hashes.
+        
+        hashlib's OpenSSL backend picks SHA-NI/AVX2 code paths at runtime, so
+        no CPU feature gating is needed here. The hash only tags local cache
+        files, hence usedforsecurity=False.
+        """
+        return hashlib.new("sha256", usedforsecurity=False)
+    
     def _get_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a file."""
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+        """Calculate SHA256 hash of a file, reusing the last hash while mtime and size are unchanged."""
+        stat = file_path.stat()
+        cached = self._file_hashes.get(str(file_path))
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        
+        hash_sha256 = self._make_hasher()
+        if stat.st_size:
+            # Hash straight from the mapping instead of copying through read buffers
+            with open(file_path, "rb") as f, \
+                 mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view:
+                    for start in range(0, len(view), _HASH_WINDOW):
+                        hash_sha256.update(view[start:start + _HASH_WINDOW])
+        
+        file_hash = hash_sha256.hexdigest()
+        self._file_hashes[str(file_path)] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+    
+    def _get_file_tree_hash(self, file_path: Path, span_size: int = _TREE_HASH_SPAN) -> str:
+        """
+        Calculate a two-level SHA256 tree hash of a file for integrity tagging.
+        
+        Spans of span_size bytes are hashed on parallel threads (hashlib releases
+        the GIL) and the result is the SHA256 of the concatenated span digests.
+        It therefore differs from the plain SHA256 of the file and must not be
+        compared with upstream checksums; use _get_file_hash for that.
+        """
+        offsets = range(0, file_path.stat().st_size, span_size)
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            def hash_span(offset: int) -> bytes:
+                hasher = self._make_hasher()
+                hasher.update(os.pread(fd, span_size, offset))
+                return hasher.digest()
+            
+            with ThreadPoolExecutor(max_workers=max(1, min(os.cpu_count() or 1, len(offsets)))) as executor:
+                span_digests = list(executor.map(hash_span, offsets))
+        finally:
+            os.close(fd)
+        
+        return self._tree_hash_root(span_digests)
+    
+    def _tree_hash_root(self, span_digests: Iterable[bytes]) -> str:
+        """Combine ordered span digests into the tree hash hex digest."""
+        root = self._make_hasher()
+        root.update(b"".join(span_digests))
+        return root.hexdigest()
+    
+    def _cache_file_intact(self, source_name: str, stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Check that a cached ontology exists and still matches its recorded tree hash.
+        
+        The tree hash is only recomputed when the file's mtime differs from
+        the one recorded at download time, so the usual check is a stat.
+        Files cached before tree hashes were recorded are only checked for
+        existence.
+        
+        Args:
+            source_name: Name of the ontology source
+            stat: Stat result of the cache file, if already known
+            
+        Returns:
+            True if the cache file can be used as is
+        """
+        cache_file = self._cache_files[source_name]
+        if stat is None:
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                return False
+        
+        source_metadata = self.metadata.get(source_name, {})
+        tree_hash = source_metadata.get('tree_hash')
+        if tree_hash is None:
+            return True
+        if stat.st_size != source_metadata.get('file_size'):
+            return False
+        if stat.st_mtime_ns == source_metadata.get('file_mtime_ns'):
+            return True
+        if self._get_file_tree_hash(cache_file) != tree_hash:
+            return False
+        
+        # Same content under a new mtime (e.g. touched or copied back); record it
+        # so the file is not hashed again
+        with self._metadata_lock:
+            self.metadata[source_name] = {**source_metadata, 'file_mtime_ns': stat.st_mtime_ns}
+            self._save_metadata(source_name)
+        return True
     
     def _needs_update(self, source: OntologySource) -> bool:
         """Check if an ontology needs to be updated."""
         source_metadata = self.metadata.get(source.name, {})
         
-        # Check if file exists
-        cache_file = self.cache_dir / f"{source.name}.{source.format}"
-        if not cache_file.exists():
+        # Check if file exists and is unchanged since it was downloaded
+        if not self._cache_file_intact(source.name):
             return True
         
         # Check if enough time has passed since last update
         last_updated = source_metadata.get('last_updated')
         if last_updated:
-            last_updated_date = datetime.fromisoformat(last_updated)
+            last_updated_date = _parse_timestamp(last_updated)
             if datetime.now() - last_updated_date < timedelta(days=source.update_frequency_days):
                 return False
         
         return True
     
+    def _compute_fresh_until(self) -> Optional[datetime]:
+        """Return when the first cached ontology goes stale, or None if any needs an update now."""
+        fresh_until = datetime.max
+        for source_name, source in self.sources.items():
+            last_updated = self.metadata.get(source_name, {}).get('last_updated')
+            if not last_updated or not self._cache_file_intact(source_name):
+                return None
+            fresh_until = min(fresh_until, _parse_timestamp(last_updated) + timedelta(days=source.update_frequency_days))
+        return fresh_until if fresh_until > datetime.now() else None
+    
+    def needs_any_update(self) -> bool:
+        """
+        Check whether any ontology is missing or stale.
+        
+        While every ontology is known to be fresh this is a timestamp
+        comparison plus one directory listing, so cache files removed or
+        changed behind the downloader's back are still noticed; the full
+        per-source scan only runs once that window lapses or after a download.
+        
+        Returns:
+            True if at least one ontology needs to be downloaded
+        """
+        if self._fresh_until is None or datetime.now() >= self._fresh_until:
+            self._fresh_until = self._compute_fresh_until()
+        elif not self._all_cache_files_present():
+            self._fresh_until = None
+        return self._fresh_until is None
+    
+    def _scan_cache_dir(self) -> Dict[str, os.DirEntry]:
+        """List the cache directory once instead of a lookup per source."""
+        with os.scandir(self.cache_dir) as entries:
+            return {entry.name: entry for entry in entries}
+    
+    def _all_cache_files_present(self) -> bool:
+        """Check that every configured ontology still has an intact cache file."""
+        entries = self._scan_cache_dir()
+        for source_name, cache_file in self._cache_files.items():
+            entry = entries.get(cache_file.name)
+            if entry is None or not self._cache_file_intact(source_name, entry.stat()):
+                return False
+        return True
+    
+    def _throttle_host(self, url: str) -> None:
+        """Wait until a request to the URL's host may start without breaching the per-host gap."""
+        host = urlparse(url).netloc
+        with self._host_limiters_lock:
+            limiter = self._host_limiters.setdefault(host, threading.Semaphore(1))
+        
+        with limiter:
+            last_request = self._host_last_request.get(host)
+            if last_request is not None:
+                wait = last_request + self.min_request_interval - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            self._host_last_request[host] = time.monotonic()
+    
+    def _stream_to_file(self, chunks: Iterable[bytes], temp_file: Path) -> Tuple[str, str, int]:
+        """
+        Write and hash a chunk stream as a pipeline.
+        
+        The calling thread pulls chunks off the network and hands each one to
+        a hashing thread, a tree-hashing thread and a writing thread through
+        bounded queues; hashlib and file writes release the GIL, so a slow
+        disk or hash no longer stalls the socket reads. The file is fsynced
+        before returning.
+        
+        Args:
+            chunks: Downloaded byte chunks in order
+            temp_file: File to write
+            
+        Returns:
+            Tuple of (SHA256 hex digest, tree hash hex digest, size in bytes)
+        """
+        hasher = self._make_hasher()
+        span_digests = []
+        span_hasher = self._make_hasher()
+        span_filled = 0
+        errors = []
+        
+        def hash_spans(chunk: bytes) -> None:
+            # Same spans as _get_file_tree_hash, cut wherever chunks cross a boundary
+            nonlocal span_hasher, span_filled
+            view = memoryview(chunk)
+            while view:
+                piece = view[:_TREE_HASH_SPAN - span_filled]
+                span_hasher.update(piece)
+                span_filled += len(piece)
+                view = view[len(piece):]
+                if span_filled == _TREE_HASH_SPAN:
+                    span_digests.append(span_hasher.digest())
+                    span_hasher = self._make_hasher()
+                    span_filled = 0
+        
+        def consume(chunk_queue: queue.Queue, handle) -> None:
+            try:
+                while (chunk := chunk_queue.get()) is not None:
+                    handle(chunk)
+            except Exception as e:
+                errors.append(e)
+                # Keep draining so the reader never blocks on a full queue
+                while chunk_queue.get() is not None:
+                    pass
+        
+        file_size = 0
+        with open(temp_file, 'wb', buffering=0) as f:
+            handlers = (hasher.update, hash_spans, f.write)
+            queues = tuple(queue.Queue(maxsize=_PIPELINE_DEPTH) for _ in handlers)
+            stages = [
+                threading.Thread(target=consume, args=(chunk_queue, handle), daemon=True)
+                for chunk_queue, handle in zip(queues, handlers)
+            ]
+            for stage in stages:
+                stage.start()
+            
+            try:
+                for chunk in chunks:
+                    if errors:
+                        break
+                    for chunk_queue in queues:
+                        chunk_queue.put(chunk)
+                    file_size += len(chunk)
+            finally:
+                for chunk_queue in queues:
+                    chunk_queue.put(None)
+                for stage in stages:
+                    stage.join()
+            
+            if errors:
+                raise errors[0]
+            
+            # Make the bytes durable before the rename can expose them
+            os.fsync(f.fileno())
+            
+            # The file is read once later for parsing; drop its now-clean pages
+            # so it does not evict hotter ones
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        
+        if span_filled:
+            span_digests.append(span_hasher.digest())
+        return hasher.hexdigest(), self._tree_hash_root(span_digests), file_size
+    
+    @staticmethod
+    def _fsync_directory(directory: Path) -> None:
+        """Flush a directory entry so a completed rename survives a crash (POSIX only)."""
+        if os.name != "posix":
+            return
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    def _conditional_headers(self, source_name: str, cache_file: Path, force_update: bool) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from the cached copy's validators."""
+        if force_update or not cache_file.exists():
+            return {}
+        
+        source_metadata = self.metadata.get(source_name, {})
+        headers = {}
+        if source_metadata.get('etag'):
+            headers['If-None-Match'] = source_metadata['etag']
+        if source_metadata.get('last_modified'):
+            headers['If-Modified-Since'] = source_metadata['last_modified']
+        return headers
+    
     def download_ontology(self, source_name: str, force_update: bool = False) -> Tuple[bool, str]:
         """
         Download a single ontology.
@@ -214,7 +590,7 @@ class OntologyDownloader:
             return False, f"Unknown ontology source: {source_name}"
         
         source = self.sources[source_name]
-        cache_file = self.cache_dir / f"{source.name}.{source.format}"
+        cache_file = self._cache_files[source_name]
         
         # Check if update is needed
         if not force_update and not self._needs_update(source):
@@ -237,31 +613,62 @@ class OntologyDownloader:
         try:
             with structured_logger.time_operation(f"download_{source_name}"):
                 # Download the ontology
-                response = requests.get(source.url, timeout=300, stream=True)
-                response.raise_for_status()
+                self._throttle_host(source.url)
+                response = self.session.get(
+                    source.url, timeout=300, stream=True,
+                    headers=self._conditional_headers(source_name, cache_file, force_update)
+                )
                 
-                # Write to temporary file first
-                temp_file = cache_file.with_suffix(f".{source.format}.tmp")
-                with open(temp_file, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                # Remote content is unchanged, so the cached file stays valid
+                if response.status_code == 304:
+                    response.close()
+                    with self._metadata_lock:
+                        self.metadata[source_name] = {
+                            **self.metadata.get(source_name, {}),
+                            'last_updated': datetime.now().isoformat()
+                        }
+                        self._save_metadata(source_name)
+                    
+                    structured_logger.info(
+                        "Ontology not modified on server, keeping cached copy",
+                        operation="download_ontology",
+                        ontology=source_name,
+                        status="not_modified"
+                    )
+                    return True, f"Ontology {source_name} not modified"
                 
-                # Calculate hash and validate
-                file_hash = self._get_file_hash(temp_file)
-                file_size = temp_file.stat().st_size
+                response.raise_for_status()
                 
-                # Move temp file to final location
-                temp_file.rename(cache_file)
+                # Write to temporary file first, hashing as the bytes arrive
+                temp_file = self._temp_files[source_name]
+                file_hash, tree_hash, file_size = self._stream_to_file(
+                    response.iter_content(chunk_size=_DOWNLOAD_CHUNK), temp_file
+                )
+                
+                # Atomically move temp file to final location and persist the rename
+                os.replace(temp_file, cache_file)
+                self._fsync_directory(self.cache_dir)
+                file_mtime_ns = cache_file.stat().st_mtime_ns
+                self._file_hashes[str(cache_file)] = (file_mtime_ns, file_size, file_hash)
                 
-                # Update metadata
-                self.metadata[source_name] = {
+                # Update metadata, keeping whichever cache validators the server sent
+                source_metadata = {
                     'last_updated': datetime.now().isoformat(),
                     'file_hash': file_hash,
                     'file_size': file_size,
+                    'file_mtime_ns': file_mtime_ns,
+                    'tree_hash': tree_hash,
                     'url': source.url,
                     'format': source.format
                 }
-                self._save_metadata()
+                for key, header in (('etag', 'ETag'), ('last_modified', 'Last-Modified')):
+                    if response.headers.get(header):
+                        source_metadata[key] = response.headers[header]
+                
+                with self._metadata_lock:
+                    self.metadata[source_name] = source_metadata
+                    self._save_metadata(source_name)
+                self._fresh_until = None
                 
                 structured_logger.info(
                     "Ontology download completed successfully",
@@ -300,12 +707,27 @@ class OntologyDownloader:
         """
         Download all configured ontologies.
         
+        Downloads are network-bound and independent, so they run concurrently
+        on a thread pool and total wall time tracks the slowest source.
+        
         Args:
             force_update: Force download even if cached versions are recent
             
         Returns:
             Dictionary mapping ontology names to (success, message) tuples
         """
+        if not force_update and not self.needs_any_update():
+            structured_logger.info(
+                "All ontologies are up to date, skipping bulk download",
+                operation="download_all_ontologies",
+                ontology_count=len(self.sources),
+                status="skipped"
+            )
+            return {
+                source_name: (True, f"Ontology {source_name} is up to date")
+                for source_name in self.sources
+            }
+        
         results = {}
         
         structured_logger.info(
@@ -316,12 +738,20 @@ class OntologyDownloader:
             status="started"
         )
         
-        for source_name in self.sources:
-            success, message = self.download_ontology(source_name, force_update)
-            results[source_name] = (success, message)
-            
-            # Add delay between downloads to be respectful to servers
-            time.sleep(1.0)
+        workers = min(_MAX_DOWNLOAD_WORKERS, len(self.sources)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Each task gets its own context copy so the correlation ID follows it
+            futures = {
+                source_name: executor.submit(
+                    contextvars.copy_context().run,
+                    self.download_ontology, source_name, force_update
+                )
+                for source_name in self.sources
+            }
+            for source_name, future in futures.items():
+                results[source_name] = future.result()
+        
+        self._fresh_until = self._compute_fresh_until()
         
         success_count = sum(1 for success, _ in results.values() if success)
         
@@ -349,8 +779,7 @@ class OntologyDownloader:
         if source_name not in self.sources:
             return None
         
-        source = self.sources[source_name]
-        cache_file = self.cache_dir / f"{source.name}.{source.format}"
+        cache_file = self._cache_files[source_name]
         
         return cache_file if cache_file.exists() else None
     
@@ -363,9 +792,21 @@ class OntologyDownloader:
         """
         status = {}
         
+        entries = self._scan_cache_dir()
+        now = datetime.now()
+        
         for source_name, source in self.sources.items():
-            cache_file = self.cache_dir / f"{source.name}.{source.format}"
+            cache_file = self._cache_files[source_name]
+            entry = entries.get(cache_file.name)
+            cache_exists = entry is not None
             source_metadata = self.metadata.get(source_name, {})
+            last_updated = source_metadata.get('last_updated')
+            
+            # Same rule as _needs_update, reusing the lookups above
+            needs_update = not (
+                cache_exists and self._cache_file_intact(source_name, entry.stat()) and last_updated
+                and now - _parse_timestamp(last_updated) < timedelta(days=source.update_frequency_days)
+            )
             
             status[source_name] = {
                 'name': source.name,
@@ -373,12 +814,13 @@ class OntologyDownloader:
                 'url': source.url,
                 'format': source.format,
                 'priority': source.priority,
-                'cached': cache_file.exists(),
-                'cache_path': str(cache_file) if cache_file.exists() else None,
-                'last_updated': source_metadata.get('last_updated'),
+                'cached': cache_exists,
+                'cache_path': str(cache_file) if cache_exists else None,
+                'last_updated': last_updated,
                 'file_size': source_metadata.get('file_size'),
                 'file_hash': source_metadata.get('file_hash'),
-                'needs_update': self._needs_update(source)
+                'tree_hash': source_metadata.get('tree_hash'),
+                'needs_update': needs_update
             }
         
         return status
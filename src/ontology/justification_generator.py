@@ -6,15 +6,74 @@ documents for ontology term selection decisions, including detailed
 methodology, statistics, and validation reports.
 """
 
-import json
-import statistics
-from typing import Dict, List, Any, Optional
+import io
+import heapq
+from itertools import chain
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import numpy as np
+import orjson
 from loguru import logger
 
 
+# Sentinel distinguishing a missing score key from a stored value
+_MISSING = object()
+
+# orjson options for indented, UTF-8 report files
+_REPORT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# orjson options for one newline-terminated NDJSON term line
+_NDJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Buffer size for NDJSON sidecar files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Maximum number of terms per NDJSON sidecar file
+_NDJSON_BATCH_SIZE = 5000
+
+# Lower bounds of the medium and high score buckets
+_DISTRIBUTION_THRESHOLDS = np.array([0.5, 0.8])
+
+# Edges of the score histogram in create_score_visualization_data
+_SCORE_BINS = np.array([0.0, 0.2, 0.4, 0.6, 0.8, 1.0])
+
+
+# Score keys collected from term dictionaries for report statistics
+_SCORE_KEYS = ('final_score', 'frequency_score', 'citation_impact', 'validation_score')
+
+
+def _extract_score_arrays(terms: Iterable[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """Collect the present values of every score key in one pass over the terms."""
+    arrays = {key: [] for key in _SCORE_KEYS}
+    appenders = [(key, arrays[key].append) for key in _SCORE_KEYS]
+    for term in terms:
+        for key, append in appenders:
+            if (value := term.get(key, _MISSING)) is not _MISSING:
+                append(value)
+    return arrays
+
+
+def _score_distribution(scores: np.ndarray) -> Tuple[int, int, int]:
+    """Count low (< 0.5), medium (0.5 to < 0.8) and high (>= 0.8) scores; NaN counts nowhere."""
+    buckets = np.searchsorted(_DISTRIBUTION_THRESHOLDS, scores, side='right')
+    low, medium, high = np.bincount(buckets, minlength=len(_DISTRIBUTION_THRESHOLDS) + 1).tolist()
+    # searchsorted sorts NaN past the last threshold
+    return low, medium, high - int(np.count_nonzero(np.isnan(scores)))
+
+
+def _np_summary(values: List[float]) -> Dict[str, float]:
+    """Mean, median and sample standard deviation of a non-empty score list."""
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "mean": float(arr.mean()),
+        "median": float(np.median(arr)),
+        "std_dev": float(arr.std(ddof=1)) if arr.size > 1 else 0
+    }
+
+
 class JustificationGenerator:
     """
     Generates automated justification documents for ontology term selection.
@@ -23,6 +82,13 @@ class JustificationGenerator:
     criteria, and results of automated ontology term selection processes.
     """
     
+    # Future work items appended to every set of recommendations
+    _FUTURE_WORK = (
+        "Implement machine learning approaches for automated term scoring",
+        "Develop domain-specific validation criteria",
+        "Create interactive visualization tools for term selection review"
+    )
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the JustificationGenerator.
@@ -30,7 +96,6 @@ class JustificationGenerator:
         Args:
             config: Optional configuration dictionary
         """
-        self.config = config or {}
         self.logger = logger
         
         # Default configuration
@@ -44,9 +109,7 @@ class JustificationGenerator:
         }
         
         # Merge with provided config
-        for key, value in self.default_config.items():
-            if key not in self.config:
-                self.config[key] = value
+        self.config = {**self.default_config, **(config or {})}
     
     def generate_selection_report(self, 
                                 selected_terms: List[Dict[str, Any]], 
@@ -61,29 +124,92 @@ class JustificationGenerator:
         Returns:
             Complete selection report dictionary
         """
-        report = {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "generator_version": "1.0.0",
-                "selection_threshold": self.config["selection_threshold"]
-            },
-            "summary": self._generate_summary(selected_terms, rejected_terms),
-            "methodology": self.generate_methodology_section(),
-            "selected_terms": selected_terms[:self.config["max_terms_display"]],
-            "rejected_terms": rejected_terms[:self.config["max_terms_display"]],
-            "statistics": self.generate_statistics_summary(selected_terms + rejected_terms)
+        return dict(self._iter_report_sections(selected_terms, rejected_terms))
+    
+    def generate_and_save_selection_report(self,
+                                           selected_terms: List[Dict[str, Any]],
+                                           rejected_terms: List[Dict[str, Any]],
+                                           output_path: str) -> None:
+        """
+        Generate a selection report and stream it straight to a JSON file.
+        
+        Sections are built and written one at a time, and the term lists are
+        encoded term by term, so the complete report never exists in memory.
+        The file content is identical to saving generate_selection_report()
+        with save_report_to_file().
+        
+        Args:
+            selected_terms: List of selected terms with scores
+            rejected_terms: List of rejected terms with reasons
+            output_path: Path to output JSON file
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            separator = b"{\n  "
+            for key, section in self._iter_report_sections(selected_terms, rejected_terms):
+                f.write(separator)
+                f.write(orjson.dumps(key))
+                f.write(b": ")
+                if isinstance(section, list) and section:
+                    # Re-indent each encoded term to its nesting depth inside the report
+                    item_separator = b"[\n    "
+                    for item in section:
+                        f.write(item_separator)
+                        f.write(orjson.dumps(item, option=_REPORT_JSON_OPTIONS).replace(b"\n", b"\n    "))
+                        item_separator = b",\n    "
+                    f.write(b"\n  ]")
+                else:
+                    f.write(orjson.dumps(section, option=_REPORT_JSON_OPTIONS).replace(b"\n", b"\n  "))
+                separator = b",\n  "
+            f.write(b"\n}")
+        
+        self.logger.info(f"Report saved to {output_path}")
+    
+    def _iter_report_sections(self,
+                              selected_terms: List[Dict[str, Any]],
+                              rejected_terms: List[Dict[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the (key, section) pairs of a selection report in report order.
+        
+        Each section is only built when requested, so streaming callers can
+        release it before the next one is computed.
+        
+        Args:
+            selected_terms: List of selected terms with scores
+            rejected_terms: List of rejected terms with reasons
+            
+        Yields:
+            Section name and section data
+        """
+        config = self.config
+        max_terms_display = config["max_terms_display"]
+        include_detailed_metrics = config.get("include_detailed_metrics", False)
+        include_visualizations = config.get("include_visualizations", False)
+        
+        yield "metadata", {
+            "generated_at": datetime.now().isoformat(),
+            "generator_version": "1.0.0",
+            "selection_threshold": config["selection_threshold"]
         }
+        yield "summary", self._generate_summary(selected_terms, rejected_terms)
+        yield "methodology", self.generate_methodology_section()
+        yield "selected_terms", selected_terms[:max_terms_display]
+        yield "rejected_terms", rejected_terms[:max_terms_display]
+        yield "statistics", self.generate_statistics_summary(selected_terms, rejected_terms)
         
-        # Add optional sections based on configuration
-        if self.config.get("include_detailed_metrics", False):
-            report["detailed_metrics"] = self._generate_detailed_metrics(selected_terms)
-            report["score_distribution"] = self._analyze_score_distribution(selected_terms)
-            report["validation_details"] = self._generate_validation_summary(selected_terms)
+        # Add optional sections based on configuration, sharing one scan of the selected scores
+        if include_detailed_metrics or include_visualizations:
+            score_arrays = _extract_score_arrays(selected_terms)
         
-        if self.config.get("include_visualizations", False):
-            report["visualization_data"] = self.create_score_visualization_data(selected_terms)
+        if include_detailed_metrics:
+            yield "detailed_metrics", self._generate_detailed_metrics(selected_terms, score_arrays)
+            yield "score_distribution", self._analyze_score_distribution(selected_terms, score_arrays)
+            yield "validation_details", self._generate_validation_summary(selected_terms, score_arrays)
         
-        return report
+        if include_visualizations:
+            yield "visualization_data", self.create_score_visualization_data(selected_terms, score_arrays)
     
     def generate_methodology_section(self) -> Dict[str, Any]:
         """
@@ -123,50 +249,51 @@ class JustificationGenerator:
             }
         }
     
-    def generate_statistics_summary(self, terms_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_statistics_summary(self, *terms_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Generate statistical summary of term scores.
         
         Args:
-            terms_data: List of terms with scoring data
+            *terms_data: One or more lists of terms with scoring data, summarized
+                together without being concatenated
             
         Returns:
             Statistical summary dictionary
         """
-        if not terms_data:
+        if not any(terms_data):
             return {"error": "No terms data provided"}
         
-        # Extract scores
-        final_scores = [term.get('final_score', 0) for term in terms_data if 'final_score' in term]
-        frequency_scores = [term.get('frequency_score', 0) for term in terms_data if 'frequency_score' in term]
-        citation_scores = [term.get('citation_impact', 0) for term in terms_data if 'citation_impact' in term]
+        # Extract scores in a single pass
+        score_arrays = _extract_score_arrays(chain.from_iterable(terms_data))
+        final_scores = score_arrays['final_score']
+        frequency_scores = score_arrays['frequency_score']
+        citation_scores = score_arrays['citation_impact']
+        
+        final = np.fromiter(final_scores, dtype=np.float64, count=len(final_scores))
+        low, medium, high = _score_distribution(final)
         
         stats = {
             "score_statistics": {
-                "mean_score": statistics.mean(final_scores) if final_scores else 0,
-                "median_score": statistics.median(final_scores) if final_scores else 0,
-                "std_deviation": statistics.stdev(final_scores) if len(final_scores) > 1 else 0,
-                "min_score": min(final_scores) if final_scores else 0,
-                "max_score": max(final_scores) if final_scores else 0
+                "mean_score": float(final.mean()) if final.size else 0,
+                "median_score": float(np.median(final)) if final.size else 0,
+                "std_deviation": float(final.std(ddof=1)) if final.size > 1 else 0,
+                "min_score": float(final.min()) if final.size else 0,
+                "max_score": float(final.max()) if final.size else 0
             },
             "distribution_analysis": {
-                "high_scoring_terms": len([s for s in final_scores if s >= 0.8]),
-                "medium_scoring_terms": len([s for s in final_scores if 0.5 <= s < 0.8]),
-                "low_scoring_terms": len([s for s in final_scores if s < 0.5])
+                "high_scoring_terms": high,
+                "medium_scoring_terms": medium,
+                "low_scoring_terms": low
             }
         }
         
         if frequency_scores:
-            stats["frequency_statistics"] = {
-                "mean": statistics.mean(frequency_scores),
-                "median": statistics.median(frequency_scores)
-            }
+            summary = _np_summary(frequency_scores)
+            stats["frequency_statistics"] = {"mean": summary["mean"], "median": summary["median"]}
         
         if citation_scores:
-            stats["citation_statistics"] = {
-                "mean": statistics.mean(citation_scores),
-                "median": statistics.median(citation_scores)
-            }
+            summary = _np_summary(citation_scores)
+            stats["citation_statistics"] = {"mean": summary["mean"], "median": summary["median"]}
         
         return stats
     
@@ -180,36 +307,30 @@ class JustificationGenerator:
         Returns:
             Markdown formatted report string
         """
-        markdown_lines = [
-            "# Ontology Term Selection Report",
-            "",
-            f"Generated: {report_data.get('metadata', {}).get('generated_at', 'Unknown')}",
-            "",
-            "## Summary",
-            "",
-            f"Total Selected: {report_data.get('summary', {}).get('total_selected', 0)}",
-            f"Total Rejected: {report_data.get('summary', {}).get('total_rejected', 0)}",
-            f"Selection Rate: {report_data.get('summary', {}).get('selection_rate', 0):.2%}",
-            "",
-            "## Methodology",
-            "",
-            report_data.get('methodology', {}).get('overview', 'No methodology provided'),
-            "",
-            "## Selected Terms",
-            ""
-        ]
+        metadata = report_data.get('metadata', {})
+        summary = report_data.get('summary', {})
+        
+        buffer = io.StringIO()
+        write = buffer.write
+        write("# Ontology Term Selection Report\n\n")
+        write(f"Generated: {metadata.get('generated_at', 'Unknown')}\n\n")
+        write("## Summary\n\n")
+        write(f"Total Selected: {summary.get('total_selected', 0)}\n")
+        write(f"Total Rejected: {summary.get('total_rejected', 0)}\n")
+        write(f"Selection Rate: {summary.get('selection_rate', 0):.2%}\n\n")
+        write("## Methodology\n\n")
+        write(f"{report_data.get('methodology', {}).get('overview', 'No methodology provided')}\n\n")
+        write("## Selected Terms\n")
         
         # Add selected terms
         selected_terms = report_data.get('selected_terms', [])
         for term in selected_terms[:10]:  # Limit to first 10 for readability
-            term_name = term.get('term', 'Unknown')
-            final_score = term.get('final_score', 0)
-            markdown_lines.append(f"- **{term_name}**: {final_score:.3f}")
+            write(f"\n- **{term.get('term', 'Unknown')}**: {term.get('final_score', 0):.3f}")
         
         if len(selected_terms) > 10:
-            markdown_lines.append(f"- ... and {len(selected_terms) - 10} more terms")
+            write(f"\n- ... and {len(selected_terms) - 10} more terms")
         
-        return "\n".join(markdown_lines)
+        return buffer.getvalue()
     
     def export_report_to_json(self, report_data: Dict[str, Any]) -> str:
         """
@@ -221,12 +342,13 @@ class JustificationGenerator:
         Returns:
             JSON formatted report string
         """
-        return json.dumps(report_data, indent=2, ensure_ascii=False)
+        return orjson.dumps(report_data, option=_REPORT_JSON_OPTIONS).decode('utf-8')
     
     def save_report_to_file(self, 
                            report_data: Dict[str, Any], 
                            output_path: str, 
-                           format: str = 'json') -> None:
+                           format: str = 'json',
+                           split_terms: bool = False) -> None:
         """
         Save report to file.
         
@@ -234,22 +356,60 @@ class JustificationGenerator:
             report_data: Report data to save
             output_path: Path to output file
             format: Output format ('json' or 'markdown')
+            split_terms: For JSON, write selected/rejected terms to NDJSON sidecar
+                files and keep only a manifest of them in the main report
         """
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
         if format.lower() == 'json':
-            content = self.export_report_to_json(report_data)
+            if split_terms:
+                report_data = self._write_terms_ndjson(report_data, output_file)
+            
+            output_file.write_bytes(orjson.dumps(report_data, option=_REPORT_JSON_OPTIONS))
         elif format.lower() == 'markdown':
             content = self.export_report_to_markdown(report_data)
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(content)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
         self.logger.info(f"Report saved to {output_path}")
     
+    def _write_terms_ndjson(self, report_data: Dict[str, Any], output_file: Path) -> Dict[str, Any]:
+        """
+        Write the report's term lists as NDJSON sidecar files.
+        
+        Each list is split into files of at most _NDJSON_BATCH_SIZE terms named
+        ``<stem>.<list>-000.ndjson``, one JSON term per line.
+        
+        Args:
+            report_data: Report data containing selected_terms/rejected_terms
+            output_file: Path of the main JSON report
+            
+        Returns:
+            Report data without the term lists, plus a term_files manifest
+        """
+        manifest = {
+            key: value for key, value in report_data.items()
+            if key not in ("selected_terms", "rejected_terms")
+        }
+        manifest["term_files"] = {}
+        
+        for key in ("selected_terms", "rejected_terms"):
+            terms = report_data.get(key, [])
+            file_names = []
+            for batch_index, start in enumerate(range(0, len(terms), _NDJSON_BATCH_SIZE)):
+                batch_file = output_file.with_name(f"{output_file.stem}.{key}-{batch_index:03d}.ndjson")
+                with open(batch_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                    for term in terms[start:start + _NDJSON_BATCH_SIZE]:
+                        f.write(orjson.dumps(term, option=_NDJSON_OPTIONS))
+                file_names.append(batch_file.name)
+            
+            manifest["term_files"][key] = {"count": len(terms), "files": file_names}
+        
+        return manifest
+    
     def _generate_summary(self, selected_terms: List[Dict], rejected_terms: List[Dict]) -> Dict[str, Any]:
         """Generate summary statistics."""
         total_selected = len(selected_terms)
@@ -276,41 +436,47 @@ class JustificationGenerator:
         if not validation_results:
             return {"error": "No validation results provided"}
 
-        # Extract validation data
-        confidence_scores = [result.get('confidence_score', 0) for result in validation_results]
-        all_sources = set()
+        # Extract validation data in a single pass
+        confidence_scores = []
+        source_counts = Counter()
         total_cross_refs = 0
 
         for result in validation_results:
-            sources = result.get('validation_sources', [])
-            all_sources.update(sources)
-            cross_refs = result.get('cross_references', [])
-            total_cross_refs += len(cross_refs)
+            confidence_scores.append(result.get('confidence_score', 0))
+            source_counts.update(result.get('validation_sources', ()))
+            total_cross_refs += len(result.get('cross_references', ()))
+
+        confidence = np.asarray(confidence_scores, dtype=np.float64)
+        low, medium, high = _score_distribution(confidence)
 
         return {
             "validation_summary": {
                 "total_terms_validated": len(validation_results),
-                "average_confidence": statistics.mean(confidence_scores) if confidence_scores else 0,
-                "validation_sources_used": list(all_sources),
+                "average_confidence": float(confidence.mean()),
+                "validation_sources_used": list(source_counts),
+                "source_frequencies": dict(source_counts.most_common()),
                 "total_cross_references": total_cross_refs
             },
             "cross_reference_analysis": {
                 "average_cross_refs_per_term": total_cross_refs / len(validation_results) if validation_results else 0,
-                "sources_coverage": len(all_sources)
+                "sources_coverage": len(source_counts)
             },
             "confidence_distribution": {
-                "high_confidence": len([s for s in confidence_scores if s >= 0.8]),
-                "medium_confidence": len([s for s in confidence_scores if 0.5 <= s < 0.8]),
-                "low_confidence": len([s for s in confidence_scores if s < 0.5])
+                "high_confidence": high,
+                "medium_confidence": medium,
+                "low_confidence": low
             }
         }
 
-    def create_score_visualization_data(self, terms_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def create_score_visualization_data(self,
+                                        terms_data: List[Dict[str, Any]],
+                                        score_arrays: Optional[Dict[str, List[float]]] = None) -> Dict[str, Any]:
         """
         Create data for score visualizations.
 
         Args:
             terms_data: List of terms with scoring data
+            score_arrays: Scores already extracted from terms_data, if available
 
         Returns:
             Visualization data dictionary
@@ -319,34 +485,28 @@ class JustificationGenerator:
             return {"error": "No terms data provided"}
 
         # Extract scores
-        final_scores = [term.get('final_score', 0) for term in terms_data if 'final_score' in term]
-        frequency_scores = [term.get('frequency_score', 0) for term in terms_data if 'frequency_score' in term]
+        if score_arrays is None:
+            score_arrays = _extract_score_arrays(terms_data)
+        final_scores = score_arrays['final_score']
+        frequency_scores = score_arrays['frequency_score']
 
         # Create score distribution bins
         if final_scores:
-            bins = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
-            counts = [0] * (len(bins) - 1)
-
-            for score in final_scores:
-                for i in range(len(bins) - 1):
-                    if bins[i] <= score < bins[i + 1]:
-                        counts[i] += 1
-                        break
-                else:
-                    if score >= bins[-1]:
-                        counts[-1] += 1
+            # Scores above 1.0 are clipped into the last (right-inclusive) bin;
+            # negative and NaN scores fall outside every bin
+            scores_arr = np.minimum(np.asarray(final_scores, dtype=np.float64), 1.0)
+            counts = np.histogram(scores_arr, bins=_SCORE_BINS)[0].tolist()
+            bins = _SCORE_BINS.tolist()
         else:
             bins = []
             counts = []
 
         # Top terms for display
-        sorted_terms = sorted(terms_data, key=lambda x: x.get('final_score', 0), reverse=True)
+        # Heap-select on (score, name) pairs; keying on the score keeps ties in input order
+        pairs = [(term.get('final_score', 0), term.get('term', 'Unknown')) for term in terms_data]
         top_terms = [
-            {
-                'term': term.get('term', 'Unknown'),
-                'score': term.get('final_score', 0)
-            }
-            for term in sorted_terms[:10]
+            {'term': name, 'score': score}
+            for score, name in heapq.nlargest(10, pairs, key=itemgetter(0))
         ]
 
         return {
@@ -403,58 +563,66 @@ class JustificationGenerator:
             )
 
         # Future work recommendations
-        recommendations["future_work"].extend([
-            "Implement machine learning approaches for automated term scoring",
-            "Develop domain-specific validation criteria",
-            "Create interactive visualization tools for term selection review"
-        ])
+        recommendations["future_work"].extend(self._FUTURE_WORK)
 
         return recommendations
 
-    def _generate_detailed_metrics(self, terms: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_detailed_metrics(self,
+                                   terms: List[Dict[str, Any]],
+                                   score_arrays: Optional[Dict[str, List[float]]] = None) -> Dict[str, Any]:
         """Generate detailed metrics for selected terms."""
         if not terms:
             return {}
 
+        if score_arrays is None:
+            score_arrays = _extract_score_arrays(terms)
         metrics = {}
 
         # Score component analysis
         for component in ['frequency_score', 'citation_impact', 'validation_score']:
-            scores = [term.get(component, 0) for term in terms if component in term]
+            scores = score_arrays[component]
             if scores:
-                metrics[f"{component}_analysis"] = {
-                    "mean": statistics.mean(scores),
-                    "median": statistics.median(scores),
-                    "std_dev": statistics.stdev(scores) if len(scores) > 1 else 0
-                }
+                metrics[f"{component}_analysis"] = _np_summary(scores)
 
         return metrics
 
-    def _analyze_score_distribution(self, terms: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_score_distribution(self,
+                                    terms: List[Dict[str, Any]],
+                                    score_arrays: Optional[Dict[str, List[float]]] = None) -> Dict[str, Any]:
         """Analyze score distribution patterns."""
-        final_scores = [term.get('final_score', 0) for term in terms if 'final_score' in term]
+        if score_arrays is None:
+            score_arrays = _extract_score_arrays(terms)
+        final_scores = score_arrays['final_score']
 
         if not final_scores:
             return {}
 
+        # One call sorts the scores once for the quartiles and the outlier cutoff
+        arr = np.asarray(final_scores, dtype=np.float64)
+        q1, q2, q3, q95 = np.percentile(arr, [25, 50, 75, 95])
+
         return {
             "quartiles": {
-                "q1": np.percentile(final_scores, 25) if final_scores else 0,
-                "q2": np.percentile(final_scores, 50) if final_scores else 0,
-                "q3": np.percentile(final_scores, 75) if final_scores else 0
+                "q1": float(q1),
+                "q2": float(q2),
+                "q3": float(q3)
             },
             "outliers": {
-                "count": len([s for s in final_scores if s > np.percentile(final_scores, 95)]) if final_scores else 0
+                "count": int((arr > q95).sum())
             }
         }
 
-    def _generate_validation_summary(self, terms: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_validation_summary(self,
+                                     terms: List[Dict[str, Any]],
+                                     score_arrays: Optional[Dict[str, List[float]]] = None) -> Dict[str, Any]:
         """Generate validation summary for detailed metrics."""
-        validation_scores = [term.get('validation_score', 0) for term in terms if 'validation_score' in term]
+        if score_arrays is None:
+            score_arrays = _extract_score_arrays(terms)
+        validation_scores = score_arrays['validation_score']
 
         return {
             "validation_coverage": len(validation_scores) / len(terms) if terms else 0,
-            "average_validation_score": statistics.mean(validation_scores) if validation_scores else 0
+            "average_validation_score": float(np.mean(validation_scores)) if validation_scores else 0
         }
 
     def _calculate_correlation(self, scores1: List[float], scores2: List[float]) -> float:
@@ -463,6 +631,15 @@ class JustificationGenerator:
             return 0.0
 
         try:
-            return np.corrcoef(scores1, scores2)[0, 1]
-        except:
+            x = np.asarray(scores1, dtype=np.float64)
+            y = np.asarray(scores2, dtype=np.float64)
+        except (TypeError, ValueError):
             return 0.0
+
+        # Closed-form Pearson r; constant or non-finite inputs have no correlation
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sx, sy = x.std(), y.std()
+            if not (sx > 0 and sy > 0):
+                return 0.0
+            r = ((x - x.mean()) * (y - y.mean())).mean() / (sx * sy)
+        return float(np.clip(r, -1.0, 1.0)) if np.isfinite(r) else 0.0
@@ -0,0 +1,175 @@
+"""
+Result cache for expensive external lookups.
+
+This module provides a size- and TTL-bounded LRU cache used to avoid repeating
+network round-trips, such as SPARQL validation queries and citation lookups,
+within a run and, optionally, across runs.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Sentinel distinguishing a cache miss from a cached None
+MISSING = object()
+
+
+class ResultCache:
+    """
+    Size- and TTL-bounded LRU cache for JSON-serializable results.
+    
+    Entries live in an in-memory LRU and, when a cache directory is given,
+    in a SQLite table so results survive across runs.
+    """
+    
+    # Number of disk writes between pruning the SQLite table back to max_entries
+    _PRUNE_INTERVAL = 1024
+    
+    def __init__(self, max_entries: int, ttl: float, cache_dir: Optional[str] = None, name: str = "validation_cache"):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept in each tier
+            ttl: Default number of seconds an entry stays valid
+            cache_dir: Optional directory for the persistent SQLite tier
+            name: File name (without extension) of the SQLite database
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._writes_since_prune = 0
+        
+        if cache_dir:
+            cache_path = Path(cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                str(cache_path / f"{name}.sqlite3"),
+                isolation_level=None,
+                check_same_thread=False
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+        
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+        
+            if self._db is None:
+                return default
+        
+            row = self._db.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+            if row is None:
+                return default
+        
+            self._db.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+            value = json.loads(row[0])
+            self._remember(key, row[1], value)
+            return value
+    
+    def update(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Store several values with a single disk transaction.
+        
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Optional number of seconds the entries stay valid, overriding the default
+        """
+        if not items:
+            return
+        
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            for key, value in items.items():
+                self._remember(key, expires_at, value)
+        
+            if self._db is None:
+                return
+        
+            with self._db:
+                self._db.execute("BEGIN")
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    [(key, json.dumps(value), expires_at, now) for key, value in items.items()]
+                )
+        
+            self._writes_since_prune += len(items)
+            if self._writes_since_prune >= self._PRUNE_INTERVAL:
+                self._prune(now)
+    
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM cache_entries")
+    
+    def close(self) -> None:
+        """Prune and close the persistent tier."""
+        with self._lock:
+            if self._db is not None:
+                self._prune(time.time())
+                self._db.close()
+                self._db = None
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, MISSING) is not MISSING
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.update({key: value})
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        """Insert into the in-memory LRU, evicting the least recently used entry."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _prune(self, now: float) -> None:
+        """Drop expired rows and trim the table to its least recently used max_entries."""
+        self._db.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        self._db.execute(
+            "DELETE FROM cache_entries WHERE key IN ("
+            "SELECT key FROM cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._writes_since_prune = 0
@@ -5,7 +5,10 @@ This module provides specialized SPARQL query building functionality
 specifically designed for ontology trimming and term validation operations.
 """
 
-from typing import Dict, List, Any, Optional, Set
+import re
+from functools import lru_cache
+from string import Template
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
@@ -19,6 +22,324 @@ class TermValidationQuery:
     query_type: str
 
 
+# Upper bound on memoized query strings per builder function
+_QUERY_CACHE_SIZE = 4096
+
+# Braces and keywords tallied by validate_query_syntax in a single scan
+_VALIDATION_TOKEN_RE = re.compile(r"\{|\}|SELECT|ASK|CONSTRUCT|DESCRIBE|WHERE|LIMIT|PREFIX", re.IGNORECASE)
+
+# Label matching strategies accepted by the "label_match" config option
+_LABEL_MATCH_MODES = ("contains", "regex", "virtuoso", "jena")
+
+# Characters with special meaning in SPARQL (XPath) regular expressions
+_REGEX_META_RE = re.compile(r"[\\.?*+{}()\[\]|^$]")
+
+# Namespace of Jena Text's text:query property function
+_JENA_TEXT_PREFIX = "PREFIX text: <http://jena.apache.org/text#>"
+
+# Aggregating subqueries shared verbatim between queries, so engines that
+# cache intermediate results can reuse them across queries
+_USAGE_COUNT_SUBQUERY_TEMPLATE = Template("""{
+        SELECT ?term (COUNT(DISTINCT ?relation) AS ?usage_count) WHERE {
+            { ?term ?relation ?object } UNION { ?subject ?relation ?term }
+            FILTER(STRSTARTS(str(?term), "$ontology_uri"))
+            FILTER(?relation NOT IN (rdf:type, rdfs:label, rdfs:comment, obo:IAO_0000115))
+        }
+        GROUP BY ?term
+    }""")
+
+_CITATION_COUNT_SUBQUERY = """{
+        SELECT ?term (COUNT(DISTINCT ?annotation) AS ?citation_count) WHERE {
+            ?annotation ?property ?term .
+            VALUES ?property { obo:RO_0002612 obo:RO_0002614 }  # evidence codes
+        }
+        GROUP BY ?term
+    }"""
+
+# Static query skeletons; builders only render the variable fragments
+_TERM_FREQUENCY_TEMPLATE = Template("""$prefixes
+
+SELECT ?term ?label ?definition (COALESCE(?usage_count, 0) AS ?final_usage_count) WHERE {
+    # Filter by ontology first for better performance
+    ?term rdfs:label ?label .
+    FILTER(STRSTARTS(str(?term), "$ontology_uri"))
+
+    # Apply term filter early
+    $filter_clause
+
+    # Filter out deprecated terms early
+    FILTER NOT EXISTS { ?term owl:deprecated "true"^^xsd:boolean }
+
+    # Get definition (prefer IAO definition over comment)
+    OPTIONAL {
+        { ?term obo:IAO_0000115 ?definition }
+        UNION
+        { ?term rdfs:comment ?definition . FILTER NOT EXISTS { ?term obo:IAO_0000115 ?def2 } }
+    }
+
+    # Optimized usage count with separate optional block
+    OPTIONAL $usage_count_subquery
+}
+ORDER BY DESC(?final_usage_count) ?label
+LIMIT $limit""")
+
+_CROSS_REFERENCE_UNION_TEMPLATE = Template("""{
+        ?equivalent_term rdfs:label ?equiv_label .
+        ?equivalent_term rdfs:comment ?equiv_definition .
+        FILTER(STRSTARTS(str(?equivalent_term), "$ontology_uri"))
+        FILTER(CONTAINS(LCASE(str(?equiv_label)), LCASE(str(?original_label))))
+        BIND("$ontology" AS ?source_ontology)
+    }""")
+
+_CROSS_REFERENCE_TEMPLATE = Template("""$prefixes
+
+SELECT ?original_label ?equivalent_term ?equiv_label ?equiv_definition ?source_ontology WHERE {
+    <$term_uri> rdfs:label ?original_label .
+
+    $union_pattern
+}
+ORDER BY ?source_ontology ?equiv_label
+LIMIT $limit""")
+
+_BULK_CROSS_REFERENCE_TEMPLATE = Template("""$prefixes
+
+SELECT ?orig_uri ?original_label ?equivalent_term ?equiv_label ?equiv_definition ?source_ontology WHERE {
+    VALUES ?orig_uri { $term_uris }
+    ?orig_uri rdfs:label ?original_label .
+
+    $union_pattern
+}
+ORDER BY ?orig_uri ?source_ontology ?equiv_label
+LIMIT $limit""")
+
+_HIERARCHICAL_ANALYSIS_TEMPLATE = Template("""$prefixes
+
+SELECT ?term ?label ?relation_type ?depth ?path WHERE {
+    {
+        # Optimized parents query with depth calculation
+        <$term_uri> rdfs:subClassOf{1,$max_depth} ?term .
+        ?term rdfs:label ?label .
+        BIND("parent" AS ?relation_type)
+
+        # More efficient depth calculation using property path
+        {
+            SELECT ?term (COUNT(?step) AS ?depth) WHERE {
+                <$term_uri> rdfs:subClassOf/rdfs:subClassOf* ?step .
+                ?step rdfs:subClassOf* ?term .
+                FILTER(?step != <$term_uri>)
+            }
+            GROUP BY ?term
+        }
+    } UNION {
+        # Optimized children query with depth calculation
+        ?term rdfs:subClassOf{1,$max_depth} <$term_uri> .
+        ?term rdfs:label ?label .
+        BIND("child" AS ?relation_type)
+
+        # More efficient depth calculation using property path
+        {
+            SELECT ?term (COUNT(?step) AS ?depth) WHERE {
+                ?term rdfs:subClassOf/rdfs:subClassOf* ?step .
+                ?step rdfs:subClassOf* <$term_uri> .
+                FILTER(?step != ?term)
+            }
+            GROUP BY ?term
+        }
+    }
+
+    # Optimized path string construction
+    BIND(CONCAT(str(?depth), ":", ?relation_type) AS ?path)
+
+    # Filter out the original term itself
+    FILTER(?term != <$term_uri>)
+}
+ORDER BY ?relation_type ?depth ?label
+LIMIT $limit""")
+
+_CITATION_SYNONYM_TEMPLATE = Template("""OPTIONAL {
+        { ?term obo:hasExactSynonym ?synonym }
+        UNION
+        { ?term obo:hasRelatedSynonym ?synonym }
+        $synonym_filter
+    }""")
+
+_CITATION_IMPACT_TEMPLATE = Template("""$prefixes
+
+$select_clause WHERE {
+    ?term rdfs:label ?label .
+
+    # Apply term filter early for performance
+    $term_filter
+    $synonym_clauses
+
+    # Optimized citation count with better filtering
+    OPTIONAL $citation_count_subquery
+
+    # Optimized impact score calculation
+    OPTIONAL {
+        SELECT ?term (COUNT(DISTINCT ?related) AS ?impact_score) WHERE {
+            { ?term ?relation ?related } UNION { ?related ?relation ?term }
+            FILTER(?relation NOT IN (rdf:type, rdfs:label, rdfs:comment, obo:IAO_0000115))
+        }
+        GROUP BY ?term
+    }
+}
+ORDER BY DESC(?final_impact_score) DESC(?final_citation_count) ?label
+LIMIT $limit""")
+
+
+def _regex_literal(terms: Iterable[str]) -> str:
+    """Quote terms as one SPARQL string literal holding a regex alternation."""
+    alternation = "|".join(_REGEX_META_RE.sub(r"\\\g<0>", term) for term in terms)
+    return '"' + alternation.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _text_search_literal(terms: Iterable[str]) -> str:
+    """Quote terms as one free-text search literal OR-ing them as phrases."""
+    phrases = " OR ".join('"' + term.replace('"', ' ') + '"' for term in terms)
+    return "'" + phrases.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _label_match_clause(label_match: str, variable: str, lowercase_terms: Iterable[str]) -> str:
+    """
+    Build the graph pattern restricting a label variable to the search terms.
+    
+    Args:
+        label_match: One of "regex", "virtuoso" or "jena"
+        variable: Label variable to match; "jena" only supports ?label
+        lowercase_terms: Lowercased search terms
+        
+    Returns:
+        Pattern using REGEX, Virtuoso's bif:contains or Jena Text's text:query
+    """
+    if label_match == "regex":
+        return f'FILTER(REGEX(str({variable}), {_regex_literal(lowercase_terms)}, "i"))'
+    if label_match == "virtuoso":
+        return f"{variable} bif:contains {_text_search_literal(lowercase_terms)} ."
+    return f"?term text:query (rdfs:label {_text_search_literal(lowercase_terms)}) ."
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _usage_count_subquery(ontology_uri: str) -> str:
+    """Render (and memoize) the per-term usage count subquery for one ontology."""
+    return _USAGE_COUNT_SUBQUERY_TEMPLATE.substitute(ontology_uri=ontology_uri)
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _term_frequency_query(prefixes_str: str,
+                          ontology_uri: str,
+                          terms: Tuple[str, ...],
+                          limit: int,
+                          label_match: str) -> str:
+    """Render (and memoize) the term frequency query for hashable arguments."""
+    # Match labels with the configured strategy; the default CONTAINS filter
+    # uses VALUES, lowercasing terms as they are quoted
+    if label_match != "contains":
+        filter_clause = _label_match_clause(label_match, "?label", map(str.lower, terms))
+        if label_match == "jena":
+            prefixes_str = f"{prefixes_str}\n{_JENA_TEXT_PREFIX}"
+    else:
+        values_clause = " ".join(f'"{term.lower()}"' for term in terms)
+        filter_clause = (
+            f"VALUES ?search_term {{ {values_clause} }}\n"
+            "    FILTER(CONTAINS(LCASE(str(?label)), ?search_term))"
+        )
+
+    return _TERM_FREQUENCY_TEMPLATE.substitute(
+        prefixes=prefixes_str,
+        ontology_uri=ontology_uri,
+        filter_clause=filter_clause,
+        usage_count_subquery=_usage_count_subquery(ontology_uri),
+        limit=limit
+    )
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _cross_reference_query(prefixes_str: str,
+                           term_uri: str,
+                           target_ontologies: Tuple[Tuple[str, str], ...],
+                           limit: int) -> str:
+    """Render (and memoize) the cross-reference query for (prefix, URI) targets."""
+    # Build UNION clauses for different ontologies
+    union_pattern = " UNION ".join(
+        _CROSS_REFERENCE_UNION_TEMPLATE.substitute(ontology=ontology, ontology_uri=ontology_uri)
+        for ontology, ontology_uri in target_ontologies
+    )
+
+    return _CROSS_REFERENCE_TEMPLATE.substitute(
+        prefixes=prefixes_str,
+        term_uri=term_uri,
+        union_pattern=union_pattern,
+        limit=limit
+    )
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _bulk_cross_reference_query(prefixes_str: str,
+                                term_uris: Tuple[str, ...],
+                                target_ontologies: Tuple[Tuple[str, str], ...],
+                                limit: int) -> str:
+    """Render (and memoize) one cross-reference query covering several term URIs."""
+    union_pattern = " UNION ".join(
+        _CROSS_REFERENCE_UNION_TEMPLATE.substitute(ontology=ontology, ontology_uri=ontology_uri)
+        for ontology, ontology_uri in target_ontologies
+    )
+
+    return _BULK_CROSS_REFERENCE_TEMPLATE.substitute(
+        prefixes=prefixes_str,
+        term_uris=" ".join(f"<{term_uri}>" for term_uri in term_uris),
+        union_pattern=union_pattern,
+        limit=limit
+    )
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _citation_impact_query(prefixes_str: str,
+                           terms: Tuple[str, ...],
+                           include_synonyms: bool,
+                           limit: int,
+                           label_match: str) -> str:
+    """Render (and memoize) the citation impact query for hashable arguments."""
+    # Match labels with the configured strategy; the default CONTAINS filter
+    # uses VALUES, lowercasing terms as they are quoted
+    if label_match != "contains":
+        lowercase_terms = [term.lower() for term in terms]
+        term_filter = _label_match_clause(label_match, "?label", lowercase_terms)
+        # Text indexes cover labels only, so Jena matches synonyms by regex
+        synonym_filter = _label_match_clause(
+            "regex" if label_match == "jena" else label_match, "?synonym", lowercase_terms
+        )
+        if label_match == "jena":
+            prefixes_str = f"{prefixes_str}\n{_JENA_TEXT_PREFIX}"
+    else:
+        values_clause = " ".join(f'"{term.lower()}"' for term in terms)
+        term_filter = (
+            f"VALUES ?search_term {{ {values_clause} }}\n"
+            "    FILTER(CONTAINS(LCASE(str(?label)), ?search_term))"
+        )
+        synonym_filter = (
+            f"VALUES ?search_term_syn {{ {values_clause} }}\n"
+            "        FILTER(CONTAINS(LCASE(str(?synonym)), ?search_term_syn))"
+        )
+
+    # Build optimized SELECT and WHERE clauses
+    if include_synonyms:
+        select_clause = "SELECT ?term ?label ?synonym (COALESCE(?citation_count, 0) AS ?final_citation_count) (COALESCE(?impact_score, 0) AS ?final_impact_score)"
+        synonym_clauses = _CITATION_SYNONYM_TEMPLATE.substitute(synonym_filter=synonym_filter)
+    else:
+        select_clause = "SELECT ?term ?label (COALESCE(?citation_count, 0) AS ?final_citation_count) (COALESCE(?impact_score, 0) AS ?final_impact_score)"
+        synonym_clauses = ""
+
+    return _CITATION_IMPACT_TEMPLATE.substitute(
+        prefixes=prefixes_str,
+        select_clause=select_clause,
+        term_filter=term_filter,
+        synonym_clauses=synonym_clauses,
+        citation_count_subquery=_CITATION_COUNT_SUBQUERY,
+        limit=limit
+    )
+
+
 class SPARQLBuilder:
     """
     Specialized SPARQL query builder for ontology trimming operations.
@@ -45,7 +366,11 @@ class SPARQLBuilder:
             "default_limit": 1000,
             "include_deprecated": False,
             "include_obsolete": False,
-            "min_confidence": 0.7
+            "min_confidence": 0.7,
+            # How term queries match labels: "contains" (CONTAINS over LCASE),
+            # "regex" (case-insensitive REGEX alternation), or a full-text
+            # index via "virtuoso" (bif:contains) or "jena" (text:query)
+            "label_match": "contains"
         }
         
         # Merge with provided config
@@ -53,7 +378,17 @@ class SPARQLBuilder:
             if key not in self.config:
                 self.config[key] = value
         
-        # Common prefixes for ontology trimming queries
+        if self.config["label_match"] not in _LABEL_MATCH_MODES:
+            raise ValueError(
+                f"Unsupported label_match: {self.config['label_match']!r} "
+                f"(expected one of {', '.join(_LABEL_MATCH_MODES)})"
+            )
+        
+        # Common prefixes for ontology trimming queries; PREFIX block rendered lazily
+        # and keyed on the mapping's items, so in-place edits are picked up too
+        self._prefixes_key: Optional[Tuple[Tuple[str, str], ...]] = None
+        self._prefixes_str: Optional[str] = None
+        self._prefix_probe: Optional[re.Pattern] = None
         self.prefixes = {
             "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
             "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
@@ -66,6 +401,16 @@ class SPARQLBuilder:
             "peco": "http://purl.obolibrary.org/obo/PECO_"
         }
     
+    @property
+    def prefixes(self) -> Dict[str, str]:
+        """Prefix-to-namespace mapping used by every generated query."""
+        return self._prefixes
+    
+    @prefixes.setter
+    def prefixes(self, value: Dict[str, str]) -> None:
+        self._prefixes = value
+        self._prefixes_key = None
+    
     def build_term_frequency_query(self,
                                  terms: List[str],
                                  ontology_prefix: str = "po") -> str:
@@ -79,59 +424,13 @@ class SPARQLBuilder:
         Returns:
             SPARQL query string for term frequency analysis
         """
-        prefixes_str = self._build_prefixes()
-
-        # Pre-compute lowercase terms for better performance
-        lowercase_terms = [term.lower() for term in terms]
-
-        # Create optimized FILTER clause using VALUES for better performance
-        if len(terms) == 1:
-            filter_clause = f'CONTAINS(LCASE(str(?label)), "{lowercase_terms[0]}")'
-        else:
-            values_clause = " ".join([f'"{term}"' for term in lowercase_terms])
-            filter_clause = f"""
-            VALUES ?search_term {{ {values_clause} }}
-            FILTER(CONTAINS(LCASE(str(?label)), ?search_term))
-            """
-
-        # Get ontology prefix URI for filtering
-        ontology_uri = self.prefixes.get(ontology_prefix, ontology_prefix)
-
-        query = f"""
-        {prefixes_str}
-
-        SELECT ?term ?label ?definition (COALESCE(?usage_count, 0) AS ?final_usage_count) WHERE {{
-            # Filter by ontology first for better performance
-            ?term rdfs:label ?label .
-            FILTER(STRSTARTS(str(?term), "{ontology_uri}"))
-
-            # Apply term filter early
-            {filter_clause}
-
-            # Filter out deprecated terms early
-            FILTER NOT EXISTS {{ ?term owl:deprecated "true"^^xsd:boolean }}
-
-            # Get definition (prefer IAO definition over comment)
-            OPTIONAL {{
-                {{ ?term obo:IAO_0000115 ?definition }}
-                UNION
-                {{ ?term rdfs:comment ?definition . FILTER NOT EXISTS {{ ?term obo:IAO_0000115 ?def2 }} }}
-            }}
-
-            # Optimized usage count with separate optional block
-            OPTIONAL {{
-                SELECT ?term (COUNT(DISTINCT ?relation) AS ?usage_count) WHERE {{
-                    {{ ?term ?relation ?object }} UNION {{ ?subject ?relation ?term }}
-                    FILTER(?relation NOT IN (rdf:type, rdfs:label, rdfs:comment, obo:IAO_0000115))
-                }}
-                GROUP BY ?term
-            }}
-        }}
-        ORDER BY DESC(?final_usage_count) ?label
-        LIMIT {self.config['default_limit']}
-        """
-
-        return query.strip()
+        return _term_frequency_query(
+            self._build_prefixes(),
+            self.prefixes.get(ontology_prefix, ontology_prefix),
+            tuple(terms),
+            self.config['default_limit'],
+            self.config['label_match']
+        )
     
     def build_cross_reference_query(self, 
                                   term_uri: str, 
@@ -146,37 +445,60 @@ class SPARQLBuilder:
         Returns:
             SPARQL query string for cross-reference validation
         """
-        prefixes_str = self._build_prefixes()
+        return _cross_reference_query(
+            self._build_prefixes(),
+            term_uri,
+            tuple((ontology, self.prefixes.get(ontology, ontology)) for ontology in target_ontologies),
+            self.config['default_limit']
+        )
+    
+    def build_bulk_cross_reference_query(self,
+                                         term_uris: List[str],
+                                         target_ontologies: List[str]) -> str:
+        """
+        Build one SPARQL query validating cross-references for several terms.
         
-        # Build UNION clauses for different ontologies
-        union_clauses = []
-        for ontology in target_ontologies:
-            union_clause = f"""
-            {{
-                ?equivalent_term rdfs:label ?equiv_label .
-                ?equivalent_term rdfs:comment ?equiv_definition .
-                FILTER(STRSTARTS(str(?equivalent_term), "{self.prefixes.get(ontology, ontology)}"))
-                FILTER(CONTAINS(LCASE(str(?equiv_label)), LCASE(str(?original_label))))
-                BIND("{ontology}" AS ?source_ontology)
-            }}
-            """
-            union_clauses.append(union_clause)
+        The terms are bound through VALUES ?orig_uri, which is also selected so
+        results can be attributed to their term. The result limit scales with
+        the number of terms, so each keeps the budget of a single-term query.
         
-        union_pattern = " UNION ".join(union_clauses)
+        Args:
+            term_uris: URIs of the terms to validate
+            target_ontologies: List of target ontology prefixes
+            
+        Returns:
+            SPARQL query string for bulk cross-reference validation
+        """
+        return _bulk_cross_reference_query(
+            self._build_prefixes(),
+            tuple(term_uris),
+            tuple((ontology, self.prefixes.get(ontology, ontology)) for ontology in target_ontologies),
+            self.config['default_limit'] * max(len(term_uris), 1)
+        )
+    
+    def build_usage_count_subquery(self, ontology_prefix: str = "po") -> str:
+        """
+        Build the subquery counting distinct relations per term of an ontology.
         
-        query = f"""
-        {prefixes_str}
+        The aggregate is restricted to the ontology's terms and rendered once
+        per ontology, so every query embedding it carries identical text.
         
-        SELECT ?original_label ?equivalent_term ?equiv_label ?equiv_definition ?source_ontology WHERE {{
-            <{term_uri}> rdfs:label ?original_label .
+        Args:
+            ontology_prefix: Ontology prefix to restrict the counts to
             
-            {union_pattern}
-        }}
-        ORDER BY ?source_ontology ?equiv_label
-        LIMIT {self.config['default_limit']}
+        Returns:
+            Braced SELECT subquery binding ?term and ?usage_count
         """
+        return _usage_count_subquery(self.prefixes.get(ontology_prefix, ontology_prefix))
+    
+    def build_citation_count_subquery(self) -> str:
+        """
+        Build the subquery counting evidence annotations per term.
         
-        return query.strip()
+        Returns:
+            Braced SELECT subquery binding ?term and ?citation_count
+        """
+        return _CITATION_COUNT_SUBQUERY
     
     def build_hierarchical_analysis_query(self,
                                         term_uri: str,
@@ -191,56 +513,13 @@ class SPARQLBuilder:
         Returns:
             SPARQL query string for hierarchical analysis
         """
-        prefixes_str = self._build_prefixes()
-
         # Optimized query using property paths with depth limits
-        query = f"""
-        {prefixes_str}
-
-        SELECT ?term ?label ?relation_type ?depth ?path WHERE {{
-            {{
-                # Optimized parents query with depth calculation
-                <{term_uri}> rdfs:subClassOf{{1,{max_depth}}} ?term .
-                ?term rdfs:label ?label .
-                BIND("parent" AS ?relation_type)
-
-                # More efficient depth calculation using property path
-                {{
-                    SELECT ?term (COUNT(?step) AS ?depth) WHERE {{
-                        <{term_uri}> rdfs:subClassOf/rdfs:subClassOf* ?step .
-                        ?step rdfs:subClassOf* ?term .
-                        FILTER(?step != <{term_uri}>)
-                    }}
-                    GROUP BY ?term
-                }}
-            }} UNION {{
-                # Optimized children query with depth calculation
-                ?term rdfs:subClassOf{{1,{max_depth}}} <{term_uri}> .
-                ?term rdfs:label ?label .
-                BIND("child" AS ?relation_type)
-
-                # More efficient depth calculation using property path
-                {{
-                    SELECT ?term (COUNT(?step) AS ?depth) WHERE {{
-                        ?term rdfs:subClassOf/rdfs:subClassOf* ?step .
-                        ?step rdfs:subClassOf* <{term_uri}> .
-                        FILTER(?step != ?term)
-                    }}
-                    GROUP BY ?term
-                }}
-            }}
-
-            # Optimized path string construction
-            BIND(CONCAT(str(?depth), ":", ?relation_type) AS ?path)
-
-            # Filter out the original term itself
-            FILTER(?term != <{term_uri}>)
-        }}
-        ORDER BY ?relation_type ?depth ?label
-        LIMIT {self.config['default_limit']}
-        """
-
-        return query.strip()
+        return _HIERARCHICAL_ANALYSIS_TEMPLATE.substitute(
+            prefixes=self._build_prefixes(),
+            term_uri=term_uri,
+            max_depth=max_depth,
+            limit=self.config['default_limit']
+        )
     
     def build_citation_impact_query(self,
                                    terms: List[str],
@@ -255,75 +534,13 @@ class SPARQLBuilder:
         Returns:
             SPARQL query string for citation impact analysis
         """
-        prefixes_str = self._build_prefixes()
-
-        # Pre-compute lowercase terms for better performance
-        lowercase_terms = [term.lower() for term in terms]
-
-        # Optimized term filtering using VALUES
-        if len(terms) == 1:
-            term_filter = f'CONTAINS(LCASE(str(?label)), "{lowercase_terms[0]}")'
-            if include_synonyms:
-                synonym_filter = f'CONTAINS(LCASE(str(?synonym)), "{lowercase_terms[0]}")'
-        else:
-            values_clause = " ".join([f'"{term}"' for term in lowercase_terms])
-            term_filter = f"""
-            VALUES ?search_term {{ {values_clause} }}
-            FILTER(CONTAINS(LCASE(str(?label)), ?search_term))
-            """
-            if include_synonyms:
-                synonym_filter = f"""
-                VALUES ?search_term_syn {{ {values_clause} }}
-                FILTER(CONTAINS(LCASE(str(?synonym)), ?search_term_syn))
-                """
-
-        # Build optimized SELECT and WHERE clauses
-        if include_synonyms:
-            select_clause = "SELECT ?term ?label ?synonym (COALESCE(?citation_count, 0) AS ?final_citation_count) (COALESCE(?impact_score, 0) AS ?final_impact_score)"
-            synonym_clauses = f"""
-            OPTIONAL {{
-                {{ ?term obo:hasExactSynonym ?synonym }}
-                UNION
-                {{ ?term obo:hasRelatedSynonym ?synonym }}
-                {synonym_filter if len(terms) > 1 else f'FILTER({synonym_filter})'}
-            }}"""
-        else:
-            select_clause = "SELECT ?term ?label (COALESCE(?citation_count, 0) AS ?final_citation_count) (COALESCE(?impact_score, 0) AS ?final_impact_score)"
-            synonym_clauses = ""
-
-        query = f"""
-        {prefixes_str}
-
-        {select_clause} WHERE {{
-            ?term rdfs:label ?label .
-
-            # Apply term filter early for performance
-            {term_filter if len(terms) > 1 else f'FILTER({term_filter})'}
-            {synonym_clauses}
-
-            # Optimized citation count with better filtering
-            OPTIONAL {{
-                SELECT ?term (COUNT(DISTINCT ?annotation) AS ?citation_count) WHERE {{
-                    ?annotation ?property ?term .
-                    VALUES ?property {{ obo:RO_0002612 obo:RO_0002614 }}  # evidence codes
-                }}
-                GROUP BY ?term
-            }}
-
-            # Optimized impact score calculation
-            OPTIONAL {{
-                SELECT ?term (COUNT(DISTINCT ?related) AS ?impact_score) WHERE {{
-                    {{ ?term ?relation ?related }} UNION {{ ?related ?relation ?term }}
-                    FILTER(?relation NOT IN (rdf:type, rdfs:label, rdfs:comment, obo:IAO_0000115))
-                }}
-                GROUP BY ?term
-            }}
-        }}
-        ORDER BY DESC(?final_impact_score) DESC(?final_citation_count) ?label
-        LIMIT {self.config['default_limit']}
-        """
-
-        return query.strip()
+        return _citation_impact_query(
+            self._build_prefixes(),
+            tuple(terms),
+            include_synonyms,
+            self.config['default_limit'],
+            self.config['label_match']
+        )
     
     def build_term_validation_queries(self, 
                                     terms: List[str], 
@@ -331,6 +548,11 @@ class SPARQLBuilder:
         """
         Build comprehensive validation queries for a list of terms.
         
+        Terms are batched rather than queried one by one: a single frequency
+        query covers all terms, plus one cross-reference query per ontology
+        whose results carry the originating term in ?orig_uri. Batched queries
+        use term="*" and a result limit scaled by the number of terms.
+        
         Args:
             terms: List of terms to validate
             ontologies: List of ontology prefixes to check against
@@ -338,29 +560,38 @@ class SPARQLBuilder:
         Returns:
             List of TermValidationQuery objects
         """
-        queries = []
+        if not terms:
+            return []
         
-        for term in terms:
-            # Frequency analysis query
-            freq_query = self.build_term_frequency_query([term])
+        limit = self.config['default_limit'] * len(terms)
+        prefixes_str = self._build_prefixes()
+        
+        # Frequency analysis query over all terms
+        queries = [TermValidationQuery(
+            term="*",
+            query=_term_frequency_query(
+                prefixes_str, self.prefixes.get("po", "po"), tuple(terms), limit, self.config['label_match']
+            ),
+            ontology="combined",
+            query_type="frequency_analysis"
+        )]
+        
+        # Create dummy URIs for cross-reference (in real scenario, these would be actual term URIs)
+        term_uris = tuple(f"http://example.org/term/{term.replace(' ', '_')}" for term in terms)
+        
+        # Cross-reference validation for each ontology
+        for ontology in ontologies:
             queries.append(TermValidationQuery(
-                term=term,
-                query=freq_query,
-                ontology="combined",
-                query_type="frequency_analysis"
+                term="*",
+                query=_bulk_cross_reference_query(
+                    prefixes_str,
+                    term_uris,
+                    ((ontology, self.prefixes.get(ontology, ontology)),),
+                    limit
+                ),
+                ontology=ontology,
+                query_type="cross_reference"
             ))
-            
-            # Cross-reference validation for each ontology
-            for ontology in ontologies:
-                # Create a dummy URI for cross-reference (in real scenario, this would be actual term URI)
-                term_uri = f"http://example.org/term/{term.replace(' ', '_')}"
-                cross_ref_query = self.build_cross_reference_query(term_uri, [ontology])
-                queries.append(TermValidationQuery(
-                    term=term,
-                    query=cross_ref_query,
-                    ontology=ontology,
-                    query_type="cross_reference"
-                ))
         
         return queries
     
@@ -368,14 +599,30 @@ class SPARQLBuilder:
         """
         Build PREFIX declarations for SPARQL queries.
         
+        The block is built once and reused until ``prefixes`` is reassigned
+        or changed in place.
+        
         Returns:
             PREFIX declarations string
         """
-        prefixes = []
-        for prefix, uri in self.prefixes.items():
-            prefixes.append(f"PREFIX {prefix}: <{uri}>")
+        self._refresh_prefix_cache()
+        return self._prefixes_str
+
+    def _refresh_prefix_cache(self) -> None:
+        """Rebuild the PREFIX block and prefix probe if the mapping has changed."""
+        key = tuple(self._prefixes.items())
+        if key == self._prefixes_key:
+            return
         
-        return "\n".join(prefixes)
+        self._prefixes_key = key
+        self._prefixes_str = "\n".join(
+            f"PREFIX {prefix}: <{uri}>" for prefix, uri in key
+        )
+        # One alternation matching any "<prefix>:" usage, searched once per validation
+        self._prefix_probe = (
+            re.compile(r"\b(?:" + "|".join(re.escape(prefix) for prefix, _ in key) + r"):")
+            if key else None
+        )
 
     def build_term_similarity_query(self,
                                   source_term: str,
@@ -538,32 +785,46 @@ class SPARQLBuilder:
             "warnings": []
         }
 
-        # Basic syntax checks
-        query_upper = query.upper()
+        # Basic syntax checks: tally braces and collect keywords in one scan
+        open_braces = close_braces = 0
+        has_prefix_declaration = False
+        keywords = set()
+        for match in _VALIDATION_TOKEN_RE.finditer(query):
+            token = match.group()
+            if token == "{":
+                open_braces += 1
+            elif token == "}":
+                close_braces += 1
+            else:
+                # PREFIX declarations are matched case-sensitively, keywords are not
+                has_prefix_declaration = has_prefix_declaration or token == "PREFIX"
+                keywords.add(token.upper())
+
+        has_select = "SELECT" in keywords
 
         # Check for required keywords
-        if not any(keyword in query_upper for keyword in ["SELECT", "ASK", "CONSTRUCT", "DESCRIBE"]):
+        if keywords.isdisjoint(("SELECT", "ASK", "CONSTRUCT", "DESCRIBE")):
             validation_result["valid"] = False
             validation_result["errors"].append("Query must contain SELECT, ASK, CONSTRUCT, or DESCRIBE")
 
         # Check for WHERE clause in SELECT queries
-        if "SELECT" in query_upper and "WHERE" not in query_upper:
+        if has_select and "WHERE" not in keywords:
             validation_result["valid"] = False
             validation_result["errors"].append("SELECT queries must contain WHERE clause")
 
         # Check for balanced braces
-        open_braces = query.count("{")
-        close_braces = query.count("}")
         if open_braces != close_braces:
             validation_result["valid"] = False
             validation_result["errors"].append(f"Unbalanced braces: {open_braces} open, {close_braces} close")
 
         # Check for proper PREFIX declarations
-        if "PREFIX" not in query and any(prefix in query for prefix in self.prefixes.keys()):
+        self._refresh_prefix_cache()
+        if (not has_prefix_declaration and self._prefix_probe is not None
+                and self._prefix_probe.search(query) is not None):
             validation_result["warnings"].append("Query uses prefixes but lacks PREFIX declarations")
 
         # Check for potential performance issues
-        if "LIMIT" not in query_upper and "SELECT" in query_upper:
+        if "LIMIT" not in keywords and has_select:
             validation_result["warnings"].append("Query lacks LIMIT clause, may return large result set")
 
         return validation_result
@@ -581,34 +842,34 @@ class SPARQLBuilder:
         optimized_query = query
 
         # Add query hints for better performance
-        if "SELECT" in query.upper() and "LIMIT" not in query.upper():
+        query_upper = query.upper()
+        if "SELECT" in query_upper and "LIMIT" not in query_upper:
             optimized_query += f"\nLIMIT {self.config['default_limit']}"
 
-        # Optimize FILTER placement - move early in query
-        lines = optimized_query.split('\n')
-        filter_lines = [line for line in lines if 'FILTER(' in line and 'OPTIONAL' not in line]
-        non_filter_lines = [line for line in lines if line not in filter_lines]
-
-        # Insert filters after WHERE clause for better performance
+        # Optimize FILTER placement - move early in query. A single pass keeps
+        # every other line in order, collects distinct FILTER lines and
+        # remembers where the first WHERE clause opens
         optimized_lines = []
-        where_found = False
-        for line in non_filter_lines:
+        filter_lines = []
+        seen_filters = set()
+        insert_at = None
+        for line in optimized_query.split('\n'):
+            if 'FILTER(' in line and 'OPTIONAL' not in line:
+                if line not in seen_filters:
+                    seen_filters.add(line)
+                    filter_lines.append(line)
+                continue
             optimized_lines.append(line)
-            if 'WHERE {' in line and not where_found:
-                where_found = True
-                # Add filters right after WHERE clause
-                for filter_line in filter_lines:
-                    if filter_line.strip():
-                        optimized_lines.append(filter_line)
-
-        # Remove duplicate filter lines from original positions
-        final_lines = []
-        for line in optimized_lines:
-            if line in filter_lines and any(f in final_lines for f in filter_lines):
-                continue  # Skip duplicate filter
-            final_lines.append(line)
-
-        return '\n'.join(final_lines)
+            if insert_at is None and 'WHERE {' in line:
+                insert_at = len(optimized_lines)
+
+        # Insert filters right after the WHERE clause for better performance;
+        # without one there is nowhere to hoist them, so the query is left as is
+        if insert_at is None:
+            return optimized_query
+        optimized_lines[insert_at:insert_at] = filter_lines
+
+        return '\n'.join(optimized_lines)
 
     def add_query_hints(self, query: str, hints: Dict[str, Any] = None) -> str:
         """
@@ -640,6 +901,10 @@ class SPARQLBuilder:
         if hints.get('result_caching', False):
             hint_comments.append("# HINT: ENABLE_CACHING")
 
+        # Ask engines that cache intermediate results to keep shared subqueries
+        if hints.get('pin_subqueries', False):
+            hint_comments.append("# HINT: PIN_SUBQUERIES")
+
         if hint_comments:
             hints_str = '\n'.join(hint_comments)
             # Insert hints after PREFIX declarations
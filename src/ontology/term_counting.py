@@ -0,0 +1,75 @@
+"""
+Term counting for corpus frequency analysis.
+
+This module holds the per-term counting loop used by CorpusAnalyzer. It only
+depends on the standard library, so spawned worker processes that count
+corpus slices start without importing the analyzer's heavier dependencies.
+"""
+
+import re
+from collections import Counter
+from typing import Iterable, List
+
+
+# Valid terms must contain at least one ASCII letter
+_LETTER_SEARCH = re.compile(r'[a-zA-Z]').search
+
+# Sentinel for raw terms not yet seen by _iter_valid_terms
+_UNSEEN = object()
+
+
+def _iter_valid_terms(term_lists: Iterable[List[str]],
+                      min_length: int,
+                      max_length: int,
+                      case_sensitive: bool):
+    """
+    Yield the normalized, valid terms of every document's term list.
+    
+    Inlines CorpusAnalyzer.normalize_term and CorpusAnalyzer._is_valid_term
+    so the per-term loop avoids method calls and config lookups.
+    
+    Args:
+        term_lists: The "terms" list of each document
+        min_length: Minimum term length
+        max_length: Maximum term length
+        case_sensitive: Whether to keep the original case
+        
+    Yields:
+        Normalized terms that pass the validity checks
+    """
+    letter_search = _LETTER_SEARCH
+    
+    # Term frequencies are Zipfian, so most occurrences repeat an already-seen raw
+    # term; memoize raw term -> normalized term (or None when invalid)
+    memo = {}
+    memo_get = memo.get
+    
+    for terms in term_lists:
+        for term in terms:
+            normalized = memo_get(term, _UNSEEN)
+            if normalized is _UNSEEN:
+                normalized = None
+                if term:
+                    candidate = term.strip()
+                    if not case_sensitive:
+                        candidate = candidate.lower()
+                    if min_length <= len(candidate) <= max_length and letter_search(candidate):
+                        normalized = candidate
+                memo[term] = normalized
+            
+            if normalized is not None:
+                yield normalized
+
+
+def _count_chunk(args) -> Counter:
+    """
+    Count the valid terms of one slice of a corpus in a worker process.
+    
+    Args:
+        args: Tuple of (term_lists, min_length, max_length, case_sensitive)
+        
+    Returns:
+        Counter of normalized term frequencies for the chunk
+    """
+    term_lists, min_length, max_length, case_sensitive = args
+    return Counter(_iter_valid_terms(term_lists, min_length, max_length, case_sensitive))
@@ -606,6 +606,13 @@ class TestStructuredLoggingSystem:
         uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
         assert re.match(uuid_pattern, correlation_id)
 
+        # Should be a valid random (version 4) UUID, unique per call
+        import uuid
+        parsed = uuid.UUID(correlation_id)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert structured_logger.generate_correlation_id() != correlation_id
+
     def test_correlation_id_context_propagation(self, structured_logger):
         """Test correlation ID context propagation across operations."""
         correlation_id = "test-correlation-123"
@@ -787,3 +794,249 @@ class TestStructuredLoggingSystem:
         # Verify no errors occurred
         assert len(errors) == 0
         assert log_count == 50  # 5 threads * 10 messages each
+
+    def test_concurrent_metrics_aggregation(self, structured_logger):
+        """Test that metrics recorded from several threads are merged."""
+        import threading
+
+        collector = structured_logger.metrics_collector
+
+        def recording_thread(thread_id):
+            for i in range(100):
+                collector.record_operation("shared_op", duration_ms=thread_id + 1, status="success")
+            collector.record_request("pmc")
+
+        threads = []
+        for thread_id in range(4):
+            thread = threading.Thread(target=recording_thread, args=(thread_id,))
+            threads.append(thread)
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        metrics = structured_logger.get_metrics()
+        op_metrics = metrics['operations']['shared_op']
+        assert op_metrics['count'] == 400
+        assert op_metrics['success_count'] == 400
+        assert op_metrics['status_counts'] == {'success': 400}
+        assert op_metrics['min_duration_ms'] == 1
+        assert op_metrics['max_duration_ms'] == 4
+        assert op_metrics['avg_duration_ms'] == 2.5
+        assert metrics['request_counts'] == {'pmc': 4}
+
+        structured_logger.reset_metrics()
+        assert structured_logger.get_metrics()['operations'] == {}
+
+    def test_format_log_record_json_line(self, structured_logger):
+        """Test formatting of a loguru record as a JSON log line."""
+        import json
+        from datetime import datetime
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        structured_logger.set_correlation_id("test-correlation-format")
+        record = {
+            'time': datetime(2025, 1, 1, 12, 0, 0),
+            'level': SimpleNamespace(name='INFO'),
+            'message': 'Formatted message',
+            'thread': SimpleNamespace(id=7),
+            'process': SimpleNamespace(id=42),
+            'name': 'tests.module',
+            'function': 'test_func',
+            'line': 10,
+            'extra': {'operation': 'format_op', 'skipped': None, 'path': Path('/tmp/x')}
+        }
+
+        formatted = structured_logger._format_log_record(record)
+
+        assert formatted.endswith('\n')
+        entry = json.loads(formatted)
+        assert entry['timestamp'] == '2025-01-01T12:00:00'
+        assert entry['level'] == 'INFO'
+        assert entry['logger'] == structured_logger.logger_name
+        assert entry['correlation_id'] == "test-correlation-format"
+        assert entry['thread_id'] == 7
+        assert entry['process_id'] == 42
+        assert entry['module'] == 'tests.module'
+        assert entry['operation'] == 'format_op'
+        assert entry['path'] == '/tmp/x'
+        assert 'skipped' not in entry
+
+        # Extra data overriding a static field falls back to full serialization
+        record['extra'] = {'logger': 'overridden'}
+        entry = json.loads(structured_logger._format_log_record(record))
+        assert entry['logger'] == 'overridden'
+        assert entry['process_id'] == 42
+
+        # Records without process info are still complete
+        del record['process']
+        entry = json.loads(structured_logger._format_log_record(record))
+        assert entry['logger'] == 'overridden'
+        assert 'process_id' not in entry
+
+    def test_buffered_log_output_flush(self, structured_logger, capsys):
+        """Test that queued log output is written once flushed."""
+        import json
+
+        for i in range(3):
+            structured_logger.info(f"Buffered message {i}")
+
+        assert structured_logger.flush() is True
+
+        entries = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        messages = [entry['message'] for entry in entries]
+        assert messages[-3:] == ["Buffered message 0", "Buffered message 1", "Buffered message 2"]
+
+    def test_log_output_is_structured_json(self, structured_logger, capsys):
+        """Test that logged records are written as JSON lines by _format_log_record."""
+        import json
+        import os
+
+        structured_logger.set_correlation_id("test-correlation-output")
+        structured_logger.info("Structured output", operation="output_op", status="success", attempt=2)
+        assert structured_logger.flush() is True
+
+        lines = capsys.readouterr().out.splitlines()
+        entry = json.loads(lines[-1])
+        assert entry['message'] == "Structured output"
+        assert entry['level'] == 'INFO'
+        assert entry['logger'] == structured_logger.logger_name
+        assert entry['process_id'] == os.getpid()
+        assert entry['correlation_id'] == "test-correlation-output"
+        assert entry['operation'] == "output_op"
+        assert entry['status'] == "success"
+        assert entry['attempt'] == 2
+        assert 'timestamp' in entry
+
+    def test_loggers_share_one_log_writer(self, structured_logger):
+        """Test that creating loggers does not start a log writer thread each."""
+        import threading
+        from src.literature.structured_logger import StructuredLogger
+
+        for _ in range(20):
+            StructuredLogger()
+
+        writers = [thread for thread in threading.enumerate() if thread.name == "structured-log-writer"]
+        assert len(writers) == 1
+
+        structured_logger.info("Shared writer message")
+        assert structured_logger.flush() is True
+
+    def test_correlation_id_async_task_propagation(self, structured_logger):
+        """Test that correlation IDs follow asyncio tasks."""
+        structured_logger.set_correlation_id("test-correlation-async")
+
+        async def read_in_task():
+            inherited = structured_logger.get_correlation_id()
+            structured_logger.set_correlation_id("task-local-correlation")
+            return inherited
+
+        async def run_task():
+            return await asyncio.create_task(read_in_task())
+
+        assert asyncio.run(run_task()) == "test-correlation-async"
+
+        # Changes inside the task should not leak back to the caller
+        assert structured_logger.get_correlation_id() == "test-correlation-async"
+
+    def test_format_timestamp_millisecond_cache(self, structured_logger):
+        """Test that record timestamps are reused within a millisecond."""
+        from datetime import datetime
+
+        first = datetime(2025, 1, 1, 12, 0, 0, 100)
+        same_millisecond = datetime(2025, 1, 1, 12, 0, 0, 900)
+        next_millisecond = datetime(2025, 1, 1, 12, 0, 0, 1100)
+
+        assert structured_logger._format_timestamp(first) == first.isoformat()
+        assert structured_logger._format_timestamp(same_millisecond) == first.isoformat()
+        assert structured_logger._format_timestamp(next_millisecond) == next_millisecond.isoformat()
+
+    def test_metrics_snapshot_cache(self, structured_logger):
+        """Test that metrics snapshots are reused until new metrics arrive."""
+        import json
+
+        collector = structured_logger.metrics_collector
+        collector.record_operation("cached_op", duration_ms=10, status="success")
+
+        first = structured_logger.get_metrics()
+        assert structured_logger.get_metrics() is first
+
+        metrics_json = structured_logger.get_metrics_json()
+        assert structured_logger.get_metrics_json() is metrics_json
+        assert json.loads(metrics_json)['operations']['cached_op']['count'] == 1
+
+        # New records invalidate the cached snapshot
+        collector.record_request("pmc")
+        second = structured_logger.get_metrics()
+        assert second is not first
+        assert second['request_counts'] == {'pmc': 1}
+        assert json.loads(structured_logger.get_metrics_json())['request_counts'] == {'pmc': 1}
+
+        structured_logger.reset_metrics()
+        assert structured_logger.get_metrics()['operations'] == {}
+
+    def test_metrics_survive_invalid_event(self, structured_logger):
+        """Test that a bad metric event does not stall metrics collection."""
+        collector = structured_logger.metrics_collector
+
+        # Unhashable operation names and non-numeric durations cannot be aggregated
+        collector.record_operation("valid_op", status="success")
+        collector.record_operation(["not", "hashable"], status="success")
+        collector.record_operation("bad_duration_op", duration_ms="slow", status="success")
+        collector.record_operation("valid_op", duration_ms="slow", status="error", error_type="ValueError")
+        collector.record_operation("valid_op", duration_ms=5, status="success")
+        collector.record_request("pmc")
+
+        # Only the bad events are skipped, without leaving partial counts behind
+        metrics = structured_logger.get_metrics()
+        assert set(metrics['operations']) == {'valid_op'}
+        valid_op = metrics['operations']['valid_op']
+        assert valid_op['count'] == 2
+        assert valid_op['success_count'] == 2
+        assert valid_op['error_count'] == 0
+        assert valid_op['error_types'] == {}
+        assert valid_op['total_duration_ms'] == 5
+        assert metrics['request_counts'] == {'pmc': 1}
+
+        collector.record_operation("valid_op", status="success")
+        assert structured_logger.get_metrics()['operations']['valid_op']['count'] == 3
+
+    def test_collectors_share_one_aggregator(self, structured_logger):
+        """Test that metrics collectors do not start an aggregator thread each."""
+        import threading
+        from src.literature.structured_logger import MetricsCollector
+
+        collectors = [MetricsCollector() for _ in range(20)]
+        for index, collector in enumerate(collectors):
+            collector.record_request(f"service_{index}")
+
+        aggregators = [thread for thread in threading.enumerate() if thread.name == "metrics-aggregator"]
+        assert len(aggregators) == 1
+
+        # Events are still kept apart per collector
+        assert collectors[3].get_metrics()['request_counts'] == {'service_3': 1}
+        assert structured_logger.get_metrics()['request_counts'] == {}
+
+    def test_minimum_level_skips_filtered_records(self):
+        """Test that messages below the minimum level are not emitted."""
+        from src.literature.structured_logger import StructuredLogger
+
+        info_logger = StructuredLogger(level="INFO")
+        try:
+            assert info_logger.is_enabled_for("INFO")
+            assert not info_logger.is_enabled_for("DEBUG")
+
+            with patch('loguru.logger.debug') as mock_debug, \
+                 patch('loguru.logger.info') as mock_info:
+                info_logger.debug("Filtered message", operation="filtered_op", status="success")
+                info_logger.info("Emitted message")
+
+            mock_debug.assert_not_called()
+            mock_info.assert_called_once()
+
+            # Metrics are still recorded for filtered messages
+            assert info_logger.get_metrics()['operations']['filtered_op']['count'] == 1
+        finally:
+            # Restore the DEBUG sink used by the rest of the suite
+            StructuredLogger()
@@ -1082,6 +1082,27 @@ class TestQuotaManagementAndRateLimiting(LiteratureTestBase):
         assert tracker.current_usage['hourly'] == 0
         assert tracker.current_usage['minute'] == 0
 
+    def test_quota_tracker_unlimited_quotas(self):
+        """Test that omitted quota limits are unenforced."""
+        from src.literature.quota_manager import QuotaTracker
+
+        tracker = QuotaTracker('test_api', {'minute_limit': 3})
+
+        assert tracker.daily_limit is None
+        assert tracker.hourly_limit is None
+
+        for i in range(3):
+            assert tracker.increment_usage() is True
+
+        # Only the configured minute quota should limit requests
+        assert tracker.increment_usage() is False
+        assert tracker.is_under_limit() is False
+        assert tracker.get_limiting_quota() == 'minute'
+
+        tracker.reset_quota('minute')
+        assert tracker.is_under_limit() is True
+        assert tracker.get_limiting_quota() is None
+
     def test_rate_limiter_initialization(self):
         """Test RateLimiter initialization."""
         from src.literature.quota_manager import RateLimiter
@@ -1264,6 +1285,66 @@ class TestQuotaManagementAndRateLimiting(LiteratureTestBase):
         limiting_quota = manager.get_limiting_quota('test_api')
         assert limiting_quota in ['daily', 'hourly', 'minute']
 
+    def test_quota_manager_batch_can_make_request(self):
+        """Test vectorized quota checks across multiple APIs."""
+        from src.literature.quota_manager import QuotaManager
+
+        config = {
+            'springer': {
+                'minute_limit': 1,
+                'requests_per_second': 10.0,
+                'burst_limit': 10
+            },
+            'elsevier': {
+                'daily_limit': 100,
+                'requests_per_second': 0.01,
+                'burst_limit': 1
+            },
+            'wiley': {
+                'requests_per_second': 10.0,
+                'burst_limit': 10
+            }
+        }
+
+        manager = QuotaManager(config)
+        api_names = ['springer', 'elsevier', 'wiley', 'unknown_api']
+
+        result = manager.batch_can_make_request(api_names)
+        assert result.tolist() == [True, True, True, False]
+
+        # Exhaust springer's minute quota and elsevier's token bucket
+        manager.record_request('springer')
+        manager.record_request('elsevier')
+
+        result = manager.batch_can_make_request(api_names)
+        assert result.tolist() == [False, False, True, False]
+
+        # Batch results should agree with the scalar checks
+        for api_name, allowed in zip(api_names, result):
+            assert manager.can_make_request(api_name) == allowed
+
+        manager.reset_quotas('springer')
+        assert manager.batch_can_make_request(['springer']).tolist() == [True]
+        assert manager.batch_can_make_request([]).tolist() == []
+
+    def test_quota_manager_batch_infinite_limit(self):
+        """Test that an explicit infinite limit is treated as unlimited."""
+        from src.literature.quota_manager import QuotaManager
+
+        manager = QuotaManager({
+            'unlimited_api': {
+                'daily_limit': float('inf'),
+                'minute_limit': 1,
+                'requests_per_second': 10.0,
+                'burst_limit': 10
+            }
+        })
+
+        assert manager.batch_can_make_request(['unlimited_api']).tolist() == [True]
+        manager.record_request('unlimited_api')
+        assert manager.batch_can_make_request(['unlimited_api']).tolist() == [False]
+        assert manager.can_make_request('unlimited_api') is False
+
     def test_quota_manager_error_handling(self):
         """Test QuotaManager error handling for unknown APIs."""
         from src.literature.quota_manager import QuotaManager
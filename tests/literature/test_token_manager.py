@@ -9,6 +9,7 @@ import os
 import json
 import tempfile
 import pytest
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -28,7 +29,10 @@ class TestTokenManager:
     @pytest.fixture
     def token_manager(self, temp_storage_path):
         """Create TokenManager instance for testing."""
-        return TokenManager(storage_path=str(temp_storage_path))
+        manager = TokenManager(storage_path=str(temp_storage_path))
+        yield manager
+        # Write pending changes before the temporary directory is removed
+        manager.flush()
     
     @pytest.fixture
     def sample_token_data(self):
@@ -148,6 +152,18 @@ class TestTokenManager:
         no_expiry_token = {}
         assert not token_manager._is_token_expired(no_expiry_token)
     
+    def test_token_expiration_uses_precomputed_deadline(self, token_manager):
+        """Test that stored tokens carry a numeric expiry deadline."""
+        token_manager.store_token(api_name='short_lived', token='short_lived_token', expires_in=200)
+        token_manager.store_token(api_name='long_lived', token='long_lived_token', expires_in=3600)
+        
+        short_lived = token_manager.tokens['short_lived']
+        assert isinstance(short_lived['expires_at_ts'], float)
+        
+        # Expiring within the 5 minute buffer counts as expired
+        assert token_manager._is_token_expired(short_lived)
+        assert not token_manager._is_token_expired(token_manager.tokens['long_lived'])
+    
     def test_register_refresh_callback(self, token_manager):
         """Test registering refresh callback."""
         def mock_refresh_callback(refresh_token):
@@ -306,6 +322,13 @@ class TestTokenManager:
         assert not token_manager.validate_token_format(123)
         assert not token_manager.validate_token_format('Bearer x')  # Too short after prefix
         assert not token_manager.validate_token_format('Token xyz')  # Too short after prefix
+        assert not token_manager.validate_token_format('Bearer xyz')  # Whole string is long enough
+        assert not token_manager.validate_token_format('Bearer    short   ')
+
+        # Surrounding whitespace is ignored, inner whitespace is kept
+        assert token_manager.validate_token_format('   padded_token_123   ')
+        assert not token_manager.validate_token_format('   short   ')
+        assert token_manager.validate_token_format('abc def ghi jkl')
     
     @patch('src.literature.token_manager.os.chmod')
     def test_file_permissions(self, mock_chmod, token_manager, sample_token_data):
@@ -314,6 +337,7 @@ class TestTokenManager:
             api_name=sample_token_data['api_name'],
             token=sample_token_data['token']
         )
+        token_manager.flush()
         
         # Verify chmod was called with restrictive permissions
         mock_chmod.assert_called()
@@ -329,6 +353,7 @@ class TestTokenManager:
             token=sample_token_data['token'],
             expires_in=sample_token_data['expires_in']
         )
+        manager1.flush()
         
         # Create new manager and verify token is loaded
         manager2 = TokenManager(storage_path=str(temp_storage_path))
@@ -336,6 +361,161 @@ class TestTokenManager:
         
         assert retrieved_token == sample_token_data['token']
     
+    def test_deferred_token_saves_are_coalesced(self, temp_storage_path):
+        """Test that repeated token changes are written once per flush."""
+        manager = TokenManager(storage_path=str(temp_storage_path), flush_interval=60)
+        
+        with patch.object(manager, '_save_tokens') as mock_save:
+            for i in range(5):
+                manager.store_token(api_name=f'api_{i}', token=f'token_{i}')
+            manager.revoke_token('api_0')
+            
+            mock_save.assert_not_called()
+            manager.flush()
+            mock_save.assert_called_once()
+            
+            # Nothing pending, so a second flush does not write
+            manager.flush()
+            mock_save.assert_called_once()
+    
+    def test_failed_deferred_save_is_retried(self, temp_storage_path):
+        """Test that a failed background save is retried and surfaces on the next change."""
+        manager = TokenManager(storage_path=str(temp_storage_path), flush_interval=0.01)
+        retried = threading.Event()
+        calls = []
+        
+        def failing_save():
+            calls.append(1)
+            if len(calls) >= 2:
+                retried.set()
+            raise OSError("disk full")
+        
+        with patch.object(manager, '_save_tokens', side_effect=failing_save):
+            manager.store_token(api_name='api', token='token_value_123')
+            assert retried.wait(5)
+            
+            # The next change saves synchronously, so the caller sees the error
+            with pytest.raises(OSError):
+                manager.store_token(api_name='other_api', token='token_value_456')
+        
+        manager.flush()
+        reloaded = TokenManager(storage_path=str(temp_storage_path))
+        assert set(reloaded.tokens) == {'api', 'other_api'}
+    
+    def test_managers_are_not_kept_alive_by_exit_hook(self, temp_storage_path):
+        """Test that unreferenced managers can be garbage collected."""
+        import gc
+        import weakref
+        
+        manager = TokenManager(storage_path=str(temp_storage_path), flush_interval=None)
+        manager_ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+        
+        assert manager_ref() is None
+    
+    def test_write_through_without_flush_interval(self, temp_storage_path, sample_token_data):
+        """Test that disabling the flush interval saves on every change."""
+        manager = TokenManager(storage_path=str(temp_storage_path), flush_interval=None)
+        manager.store_token(
+            api_name=sample_token_data['api_name'],
+            token=sample_token_data['token']
+        )
+        
+        assert temp_storage_path.exists()
+    
+    def test_storage_uses_versioned_aes_gcm_format(self, temp_storage_path, sample_token_data):
+        """Test that token files are written with the AES-GCM format."""
+        manager = TokenManager(storage_path=str(temp_storage_path), flush_interval=None)
+        manager.store_token(
+            api_name=sample_token_data['api_name'],
+            token=sample_token_data['token']
+        )
+        
+        encrypted_data = temp_storage_path.read_bytes()
+        assert encrypted_data[:1] == b'\x01'
+        assert sample_token_data['token'].encode() not in encrypted_data
+        assert len(manager.encryption_key) == 32
+    
+    def test_legacy_fernet_storage_is_loaded(self, temp_storage_path, sample_token_data):
+        """Test that token files written with Fernet can still be read."""
+        from cryptography.fernet import Fernet
+        fernet_key = Fernet.generate_key()
+        legacy_tokens = {
+            sample_token_data['api_name']: {'token': sample_token_data['token']}
+        }
+        temp_storage_path.write_bytes(Fernet(fernet_key).encrypt(json.dumps(legacy_tokens).encode()))
+        
+        manager = TokenManager(storage_path=str(temp_storage_path), encryption_key=fernet_key)
+        
+        assert manager.get_token(sample_token_data['api_name']) == sample_token_data['token']
+    
+    def test_passphrase_encryption_key_is_reusable(self, temp_storage_path, sample_token_data):
+        """Test that a passphrase key decrypts storage across instances."""
+        manager1 = TokenManager(storage_path=str(temp_storage_path),
+                                encryption_key='correct horse battery staple', flush_interval=None)
+        manager1.store_token(
+            api_name=sample_token_data['api_name'],
+            token=sample_token_data['token']
+        )
+        
+        manager2 = TokenManager(storage_path=str(temp_storage_path),
+                                encryption_key='correct horse battery staple')
+        assert manager2.get_token(sample_token_data['api_name']) == sample_token_data['token']
+    
+    def test_passphrase_key_is_salted(self, temp_storage_path, tmp_path):
+        """Test that passphrases are stretched with a per-store salt, not a bare hash."""
+        import hashlib
+        
+        passphrase = b'correct horse battery staple'
+        manager = TokenManager(storage_path=str(temp_storage_path), encryption_key=passphrase)
+        salt_path = temp_storage_path.with_suffix('.salt')
+        
+        assert salt_path.exists()
+        derived_key = manager._derive_aes_key(passphrase)
+        assert derived_key != hashlib.sha256(passphrase).digest()
+        
+        # Another store gets its own salt and therefore a different key
+        other_manager = TokenManager(storage_path=str(tmp_path / "other" / "tokens.enc"),
+                                     encryption_key=passphrase)
+        assert other_manager._derive_aes_key(passphrase) != derived_key
+    
+    def test_key_length_passphrase_is_stretched(self, temp_storage_path, sample_token_data):
+        """Test that a 32-character passphrase is not used directly as the AES key."""
+        import base64
+        
+        passphrase = b'a' * 32
+        manager = TokenManager(storage_path=str(temp_storage_path), encryption_key=passphrase,
+                               flush_interval=None)
+        manager.store_token(
+            api_name=sample_token_data['api_name'],
+            token=sample_token_data['token']
+        )
+        
+        derived_key = manager._derive_aes_key(passphrase)
+        assert derived_key != passphrase
+        assert temp_storage_path.with_suffix('.salt').exists()
+        
+        # Passphrases that base64-decode to 32 bytes are stretched too
+        encoded_passphrase = base64.urlsafe_b64encode(b'b' * 32)
+        assert manager._derive_aes_key(encoded_passphrase) != b'b' * 32
+        
+        reloaded = TokenManager(storage_path=str(temp_storage_path), encryption_key=passphrase.decode())
+        assert reloaded.get_token(sample_token_data['api_name']) == sample_token_data['token']
+    
+    def test_shared_instance_per_path_and_key(self, temp_storage_path):
+        """Test that TokenManager.get reuses instances per path and key."""
+        manager1 = TokenManager.get(str(temp_storage_path))
+        manager2 = TokenManager.get(str(temp_storage_path))
+        assert manager1 is manager2
+        
+        keyed_manager = TokenManager.get(str(temp_storage_path), encryption_key='another passphrase')
+        assert keyed_manager is not manager1
+        assert TokenManager.get(str(temp_storage_path), encryption_key='another passphrase') is keyed_manager
+        
+        # Explicit construction stays uncached
+        assert TokenManager(storage_path=str(temp_storage_path)) is not manager1
+    
     def test_corrupted_storage_handling(self, temp_storage_path):
         """Test handling of corrupted storage file."""
         # Create corrupted storage file (binary data that's not valid Fernet)
@@ -33,9 +33,16 @@ class TestOntologySource:
         assert source.description == ""
         assert source.update_frequency_days == 7
         assert source.priority == 1
-        assert source.last_updated is None
-        assert source.file_hash is None
-        assert source.file_size is None
+    
+    def test_ontology_source_is_immutable(self):
+        """Test that OntologySource is a frozen, slotted configuration record."""
+        import dataclasses
+        
+        source = OntologySource(name="test_ontology", url="http://example.com/test.owl")
+        
+        assert not hasattr(source, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            source.url = "http://example.com/other.owl"
     
     def test_ontology_source_custom_values(self):
         """Test OntologySource initialization with custom values."""
@@ -75,7 +82,7 @@ class TestOntologyDownloader:
         """Test OntologyDownloader initialization."""
         assert downloader.cache_dir == Path(temp_cache_dir)
         assert downloader.cache_dir.exists()
-        assert downloader.metadata_file == Path(temp_cache_dir) / "metadata.json"
+        assert downloader.metadata_file == Path(temp_cache_dir) / "metadata.db"
         
         # Check that all 8 source ontologies are configured
         expected_sources = [
@@ -127,6 +134,24 @@ class TestOntologyDownloader:
         
         downloader = OntologyDownloader(cache_dir=temp_cache_dir)
         assert downloader.metadata == test_metadata
+        
+        # Legacy JSON metadata is imported into the metadata database
+        metadata_file.unlink()
+        assert OntologyDownloader(cache_dir=temp_cache_dir).metadata == test_metadata
+    
+    def test_metadata_saved_per_ontology(self, downloader, temp_cache_dir):
+        """Test that saving one ontology upserts only its row."""
+        downloader.metadata['chebi'] = {'last_updated': '2024-01-01T00:00:00', 'file_size': 10}
+        downloader.metadata['plant_ontology'] = {'last_updated': '2024-01-02T00:00:00'}
+        downloader._save_metadata('chebi')
+        
+        assert OntologyDownloader(cache_dir=temp_cache_dir).metadata == {
+            'chebi': {'last_updated': '2024-01-01T00:00:00', 'file_size': 10}
+        }
+        
+        downloader.metadata['chebi']['file_hash'] = 'abc'
+        downloader._save_metadata('chebi')
+        assert OntologyDownloader(cache_dir=temp_cache_dir).metadata['chebi']['file_hash'] == 'abc'
     
     def test_metadata_loading_corrupted(self, temp_cache_dir):
         """Test metadata loading when metadata file is corrupted."""
@@ -177,9 +202,9 @@ class TestOntologyDownloader:
         """Test successful ontology download."""
         mock_content = b"<?xml version='1.0'?><owl:Ontology>test content</owl:Ontology>"
         
-        with patch('requests.get') as mock_get:
+        with patch.object(downloader.session, 'get') as mock_get:
             # Mock successful response
-            mock_response = Mock()
+            mock_response = Mock(status_code=200, headers={})
             mock_response.raise_for_status.return_value = None
             mock_response.iter_content.return_value = [mock_content]
             mock_get.return_value = mock_response
@@ -202,9 +227,189 @@ class TestOntologyDownloader:
             assert 'file_size' in metadata
             assert metadata['file_size'] == len(mock_content)
     
+    def test_download_ontology_durable_before_metadata(self, downloader):
+        """Test that the file and its directory are synced before metadata is saved."""
+        import os
+        
+        events = []
+        real_fsync = os.fsync
+        
+        def record_fsync(fd):
+            events.append('fsync')
+            real_fsync(fd)
+        
+        with patch.object(downloader.session, 'get') as mock_get, \
+             patch('src.ontology.integration.ontology_downloader.os.fsync', side_effect=record_fsync), \
+             patch.object(downloader, '_save_metadata', side_effect=lambda name: events.append('save')):
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.iter_content.return_value = [b"durable content"]
+            mock_get.return_value = mock_response
+            
+            success, _ = downloader.download_ontology('chebi', force_update=True)
+        
+        assert success is True
+        assert events == ['fsync', 'fsync', 'save']
+        assert not (downloader.cache_dir / "chebi.owl.tmp").exists()
+        assert (downloader.cache_dir / "chebi.owl").read_bytes() == b"durable content"
+    
+    def test_stream_to_file_pipeline(self, downloader, temp_cache_dir):
+        """Test that the pipelined writer preserves chunk order and surfaces write errors."""
+        import hashlib
+        
+        chunks = [bytes([i]) * (i + 1) for i in range(50)]
+        temp_file = Path(temp_cache_dir) / "pipeline.tmp"
+        
+        file_hash, tree_hash, file_size = downloader._stream_to_file(iter(chunks), temp_file)
+        
+        assert temp_file.read_bytes() == b"".join(chunks)
+        assert file_hash == hashlib.sha256(b"".join(chunks)).hexdigest()
+        assert tree_hash == downloader._get_file_tree_hash(temp_file)
+        assert file_size == sum(map(len, chunks))
+        
+        # Chunks straddling span boundaries give the same tree hash as hashing the file
+        with patch('src.ontology.integration.ontology_downloader._TREE_HASH_SPAN', 7):
+            _, small_span_hash, _ = downloader._stream_to_file(iter(chunks), temp_file)
+        assert small_span_hash == downloader._get_file_tree_hash(temp_file, span_size=7)
+        
+        # A failing write stage must not deadlock the reader on a full queue
+        failing_file = MagicMock()
+        failing_file.__enter__.return_value.write.side_effect = OSError("disk full")
+        with patch('src.ontology.integration.ontology_downloader.open', create=True, return_value=failing_file):
+            with pytest.raises(OSError, match="disk full"):
+                downloader._stream_to_file(iter(chunks), temp_file)
+    
+    def test_download_ontology_hashes_while_streaming(self, downloader):
+        """Test that the download hash is computed in the write loop, not by re-reading."""
+        import hashlib
+        
+        chunks = [b"first chunk ", b"second chunk ", b"third"]
+        
+        with patch.object(downloader.session, 'get') as mock_get, \
+             patch.object(downloader, '_get_file_hash') as mock_file_hash:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.raise_for_status.return_value = None
+            mock_response.iter_content.return_value = chunks
+            mock_get.return_value = mock_response
+            
+            success, _ = downloader.download_ontology('chebi', force_update=True)
+        
+        assert success is True
+        mock_file_hash.assert_not_called()
+        assert downloader.metadata['chebi']['file_hash'] == hashlib.sha256(b"".join(chunks)).hexdigest()
+        assert downloader.metadata['chebi']['file_size'] == sum(map(len, chunks))
+        
+        cache_file = downloader.cache_dir / "chebi.owl"
+        assert downloader.metadata['chebi']['tree_hash'] == downloader._get_file_tree_hash(cache_file)
+    
+    def test_changed_cache_file_fails_tree_hash_check(self, downloader):
+        """Test that a cache file changed after download is re-fetched, while a touched one is kept."""
+        import os
+        
+        downloader.min_request_interval = 0
+        with patch.object(downloader.session, 'get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.iter_content.return_value = [b"original content"]
+            mock_get.return_value = mock_response
+            downloader.download_ontology('chebi', force_update=True)
+        
+        cache_file = downloader.cache_dir / "chebi.owl"
+        assert downloader._needs_update(downloader.sources['chebi']) is False
+        
+        # Same bytes under a new mtime pass the tree hash check and are recorded
+        os.utime(cache_file, ns=(0, 10 ** 9))
+        with patch.object(downloader, '_get_file_tree_hash', wraps=downloader._get_file_tree_hash) as mock_tree_hash:
+            assert downloader._needs_update(downloader.sources['chebi']) is False
+            assert downloader._needs_update(downloader.sources['chebi']) is False
+            assert mock_tree_hash.call_count == 1
+        assert OntologyDownloader(cache_dir=str(downloader.cache_dir)).metadata['chebi']['file_mtime_ns'] == 10 ** 9
+        
+        # Same-size content that differs, or a truncated file, needs a new download
+        cache_file.write_bytes(b"tampered content")
+        assert downloader._needs_update(downloader.sources['chebi']) is True
+        assert downloader.get_download_status()['chebi']['needs_update'] is True
+        cache_file.write_bytes(b"original")
+        assert downloader._needs_update(downloader.sources['chebi']) is True
+    
+    def test_file_hash_uses_hasher_factory(self, downloader, temp_cache_dir):
+        """Test that file hashing matches SHA256 and goes through _make_hasher."""
+        import hashlib
+        
+        test_file = Path(temp_cache_dir) / "hash_me.owl"
+        content = b"ontology bytes " * 1000
+        test_file.write_bytes(content)
+        
+        assert downloader._get_file_hash(test_file) == hashlib.sha256(content).hexdigest()
+        
+        downloader._file_hashes.clear()
+        with patch.object(OntologyDownloader, '_make_hasher', return_value=hashlib.md5()):
+            assert downloader._get_file_hash(test_file) == hashlib.md5(content).hexdigest()
+    
+    def test_download_ontology_not_modified(self, downloader, temp_cache_dir):
+        """Test that a 304 response keeps the cached file and only refreshes last_updated."""
+        cache_file = Path(temp_cache_dir) / "chebi.owl"
+        cache_file.write_bytes(b"cached content")
+        
+        old_date = (datetime.now() - timedelta(days=10)).isoformat()
+        downloader.metadata['chebi'] = {
+            'last_updated': old_date,
+            'file_hash': 'cached_hash',
+            'file_size': 14,
+            'etag': '"abc123"',
+            'last_modified': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+        
+        with patch.object(downloader.session, 'get') as mock_get:
+            mock_get.return_value = Mock(status_code=304, headers={})
+            
+            success, message = downloader.download_ontology('chebi')
+        
+        assert success is True
+        assert "not modified" in message
+        assert mock_get.call_args.kwargs['headers'] == {
+            'If-None-Match': '"abc123"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+        mock_get.return_value.iter_content.assert_not_called()
+        assert cache_file.read_bytes() == b"cached content"
+        assert downloader.metadata['chebi']['file_hash'] == 'cached_hash'
+        assert downloader.metadata['chebi']['last_updated'] > old_date
+    
+    def test_download_ontology_stores_validators(self, downloader, temp_cache_dir):
+        """Test that ETag/Last-Modified are recorded and the file hash is memoized across instances."""
+        with patch.object(downloader.session, 'get') as mock_get:
+            mock_response = Mock(status_code=200, headers={'ETag': '"v1"', 'Last-Modified': 'Tue, 02 Jan 2024 00:00:00 GMT'})
+            mock_response.iter_content.return_value = [b"fresh content"]
+            mock_get.return_value = mock_response
+            
+            downloader.download_ontology('chebi', force_update=True)
+        
+        assert mock_get.call_args.kwargs['headers'] == {}
+        metadata = downloader.metadata['chebi']
+        assert metadata['etag'] == '"v1"'
+        assert metadata['last_modified'] == 'Tue, 02 Jan 2024 00:00:00 GMT'
+        
+        reloaded = OntologyDownloader(cache_dir=temp_cache_dir)
+        with patch.object(reloaded, '_make_hasher') as mock_hasher:
+            assert reloaded._get_file_hash(reloaded.cache_dir / "chebi.owl") == metadata['file_hash']
+            mock_hasher.assert_not_called()
+    
+    def test_file_tree_hash(self, downloader, temp_cache_dir):
+        """Test that the tree hash is the SHA256 of ordered per-span SHA256 digests."""
+        import hashlib
+        
+        test_file = Path(temp_cache_dir) / "tree.owl"
+        content = bytes(range(256)) * 40
+        test_file.write_bytes(content)
+        
+        spans = [content[i:i + 1000] for i in range(0, len(content), 1000)]
+        expected = hashlib.sha256(b"".join(hashlib.sha256(span).digest() for span in spans)).hexdigest()
+        
+        assert downloader._get_file_tree_hash(test_file, span_size=1000) == expected
+        assert downloader._get_file_tree_hash(test_file) != downloader._get_file_hash(test_file)
+    
     def test_download_ontology_network_error(self, downloader):
         """Test ontology download with network error."""
-        with patch('requests.get') as mock_get:
+        with patch.object(downloader.session, 'get') as mock_get:
             mock_get.side_effect = requests.RequestException("Network error")
             
             success, message = downloader.download_ontology('chebi', force_update=True)
@@ -238,28 +443,109 @@ class TestOntologyDownloader:
     def test_download_all_ontologies(self, downloader):
         """Test downloading all ontologies."""
         mock_content = b"test ontology content"
+        downloader.min_request_interval = 0
         
-        with patch('requests.get') as mock_get, \
-             patch('time.sleep') as mock_sleep:  # Speed up test
-            
+        with patch.object(downloader.session, 'get') as mock_get:
             # Mock successful responses for all ontologies
-            mock_response = Mock()
+            mock_response = Mock(status_code=200, headers={})
             mock_response.raise_for_status.return_value = None
             mock_response.iter_content.return_value = [mock_content]
             mock_get.return_value = mock_response
             
             results = downloader.download_all_ontologies(force_update=True)
             
-            # Verify all 8 ontologies were processed
+            # Verify all 8 ontologies were processed through the shared session
             assert len(results) == 8
+            assert mock_get.call_count == 8
             
             # Verify all downloads were successful
             for source_name, (success, message) in results.items():
                 assert success is True
                 assert f"Successfully downloaded {source_name}" in message
             
-            # Verify delay was added between downloads
-            assert mock_sleep.call_count == 8
+            # Persisted metadata reflects every download
+            reloaded = OntologyDownloader(cache_dir=str(downloader.cache_dir))
+            assert reloaded.metadata == downloader.metadata
+            assert len(reloaded.metadata) == 8
+    
+    def test_download_all_ontologies_concurrent(self, downloader):
+        """Test that downloads overlap instead of running one after another."""
+        import threading
+        
+        barrier = threading.Barrier(8, timeout=5)
+        
+        def fake_get(url, **kwargs):
+            # Only returns once all 8 downloads are in flight at the same time
+            barrier.wait()
+            response = Mock(status_code=200, headers={})
+            response.raise_for_status.return_value = None
+            response.iter_content.return_value = [url.encode()]
+            return response
+        
+        downloader.min_request_interval = 0
+        with patch.object(downloader.session, 'get', side_effect=fake_get):
+            results = downloader.download_all_ontologies(force_update=True)
+        
+        assert list(results) == list(downloader.sources)
+        assert all(success for success, _ in results.values())
+        assert downloader.get_ontology_path('ncbi_taxonomy').read_bytes() == downloader.sources['ncbi_taxonomy'].url.encode()
+    
+    def test_needs_any_update_fast_path(self, downloader, temp_cache_dir):
+        """Test that an all-fresh cache skips per-source work and downloads."""
+        assert downloader.needs_any_update() is True
+        
+        now = datetime.now().isoformat()
+        for source_name, source in downloader.sources.items():
+            (Path(temp_cache_dir) / f"{source.name}.{source.format}").write_text("cached")
+            downloader.metadata[source_name] = {'last_updated': now}
+        
+        assert downloader.needs_any_update() is False
+        
+        with patch.object(downloader, '_compute_fresh_until') as mock_compute, \
+             patch.object(downloader.session, 'get') as mock_get:
+            assert downloader.needs_any_update() is False
+            results = downloader.download_all_ontologies()
+            mock_compute.assert_not_called()
+            mock_get.assert_not_called()
+        
+        assert all(success and "is up to date" in message for success, message in results.values())
+    
+    def test_deleted_cache_file_is_redownloaded_within_fresh_window(self, downloader, temp_cache_dir):
+        """Test that a cache file removed while the cache looks fresh is fetched again."""
+        now = datetime.now().isoformat()
+        for source_name, source in downloader.sources.items():
+            (Path(temp_cache_dir) / f"{source.name}.{source.format}").write_text("cached")
+            downloader.metadata[source_name] = {'last_updated': now}
+        
+        assert downloader.needs_any_update() is False
+        
+        (Path(temp_cache_dir) / "chebi.owl").unlink()
+        
+        downloader.min_request_interval = 0
+        with patch.object(downloader.session, 'get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.iter_content.return_value = [b"fresh chebi"]
+            mock_get.return_value = mock_response
+            
+            results = downloader.download_all_ontologies()
+        
+        mock_get.assert_called_once()
+        assert results['chebi'] == (True, "Successfully downloaded chebi")
+        assert (Path(temp_cache_dir) / "chebi.owl").read_bytes() == b"fresh chebi"
+        assert downloader.needs_any_update() is False
+    
+    def test_throttle_host_spaces_requests_per_host(self, downloader):
+        """Test that only requests to the same host wait for the minimum gap."""
+        downloader.min_request_interval = 30
+        
+        with patch('src.ontology.integration.ontology_downloader.time.sleep') as mock_sleep:
+            downloader._throttle_host('http://purl.obolibrary.org/obo/chebi.owl')
+            downloader._throttle_host('https://ftp.ebi.ac.uk/pub/chebi.owl')
+            mock_sleep.assert_not_called()
+            
+            downloader._throttle_host('http://purl.obolibrary.org/obo/po.owl')
+            mock_sleep.assert_called_once()
+            assert 29 < mock_sleep.call_args[0][0] <= 30
     
     def test_get_ontology_path_existing(self, downloader, temp_cache_dir):
         """Test getting path for existing ontology."""
@@ -315,3 +601,8 @@ class TestOntologyDownloader:
         assert po_status['cache_path'] is None
         assert po_status['last_updated'] is None
         assert po_status['needs_update'] is True
+        
+        # Status agrees with _needs_update for every source
+        for source_name, source in downloader.sources.items():
+            assert status[source_name]['needs_update'] is downloader._needs_update(source)
+        assert chebi_status['needs_update'] is False
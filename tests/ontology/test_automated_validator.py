@@ -23,7 +23,7 @@ class TestAutomatedValidator(OntologyTestBase):
         validator = AutomatedValidator()
         
         # Mock external ontology data
-        with patch.object(validator, '_query_external_ontology') as mock_query:
+        with patch.object(validator, '_query_external_ontology_batch') as mock_query:
             mock_query.return_value = {
                 "leaf": {"found": True, "confidence": 0.95, "source": "Plant Ontology"},
                 "root": {"found": True, "confidence": 0.88, "source": "Plant Ontology"},
@@ -62,7 +62,7 @@ class TestAutomatedValidator(OntologyTestBase):
         
         validator = AutomatedValidator()
         
-        with patch.object(validator, '_query_external_ontology') as mock_query:
+        with patch.object(validator, '_query_external_ontology_batch') as mock_query:
             mock_query.return_value = {
                 "nonexistent_term": {"found": False, "confidence": 0.0, "source": "Plant Ontology"}
             }
@@ -79,7 +79,7 @@ class TestAutomatedValidator(OntologyTestBase):
         
         validator = AutomatedValidator(ontology_sources=["Plant Ontology", "Gene Ontology"])
         
-        with patch.object(validator, '_query_external_ontology') as mock_query:
+        with patch.object(validator, '_query_external_ontology_batch') as mock_query:
             mock_query.side_effect = [
                 {"leaf": {"found": True, "confidence": 0.95, "source": "Plant Ontology"}},
                 {"leaf": {"found": True, "confidence": 0.88, "source": "Gene Ontology"}}
@@ -92,6 +92,83 @@ class TestAutomatedValidator(OntologyTestBase):
             assert result["leaf"]["found"] is True
             assert result["leaf"]["confidence"] > 0.8
     
+    def test_cross_reference_validation_queries_concurrently(self):
+        """Test that queries for different sources are in flight at the same time."""
+        from src.ontology.automated_validator import AutomatedValidator
+        import threading
+        
+        validator = AutomatedValidator(ontology_sources=["Plant Ontology", "Gene Ontology"])
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def query(terms, source):
+            # Only passes if the other source's query is running concurrently
+            barrier.wait()
+            return {term: {"found": True, "confidence": 0.9, "source": source} for term in terms}
+        
+        with patch.object(validator, '_query_external_ontology_batch', side_effect=query) as mock_query:
+            result = validator.cross_reference_validation(["leaf"])
+            
+            assert mock_query.call_count == 2
+            assert result["leaf"]["found"] is True
+            assert result["leaf"]["source"] == "Plant Ontology, Gene Ontology"
+            
+            # Repeat lookups are served from the validation cache
+            validator.cross_reference_validation(["leaf"])
+            assert mock_query.call_count == 2
+    
+    def test_validation_cache_persists_across_instances(self, tmp_path):
+        """Test that validation results are reused from the on-disk cache."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        found = {"leaf": {"found": True, "confidence": 0.9, "source": "Plant Ontology"}}
+        
+        validator = AutomatedValidator(ontology_sources=["Plant Ontology"], cache_dir=str(tmp_path))
+        with patch.object(validator, '_query_external_ontology_batch', return_value=found):
+            validator.cross_reference_validation(["leaf"])
+        validator.validation_cache.close()
+        
+        restarted = AutomatedValidator(ontology_sources=["Plant Ontology"], cache_dir=str(tmp_path))
+        with patch.object(restarted, '_query_external_ontology_batch') as mock_query:
+            result = restarted.cross_reference_validation(["leaf"])
+            
+            mock_query.assert_not_called()
+            assert result["leaf"]["found"] is True
+    
+    def test_cross_reference_validation_skips_trivial_terms(self):
+        """Test that terms without letters or too short are not sent to endpoints."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(ontology_sources=["Plant Ontology"])
+        
+        with patch.object(validator, '_query_external_ontology_batch') as mock_query:
+            mock_query.return_value = {"leaf": {"found": True, "confidence": 0.9, "source": "Plant Ontology"}}
+            
+            result = validator.cross_reference_validation(["", "123", "x", "--_", " a ", "leaf"])
+            
+            mock_query.assert_called_once_with(["leaf"], "Plant Ontology")
+            assert result["leaf"]["found"] is True
+            for term in ["", "123", "x", "--_", " a "]:
+                assert result[term]["found"] is False
+                assert result[term]["confidence"] == 0.0
+    
+    def test_cross_reference_validation_caches_misses_briefly(self):
+        """Test that not-found results use the shorter negative cache TTL and errors are not cached."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(ontology_sources=["Plant Ontology"], negative_cache_ttl=0)
+        
+        with patch.object(validator, '_query_external_ontology_batch') as mock_query:
+            mock_query.side_effect = lambda terms, source: {
+                "leaf": {"found": True, "confidence": 0.9, "source": source},
+                "root": {"found": False, "confidence": 0.0, "source": source},
+                "stem": {"found": False, "confidence": 0.0, "source": source, "error": "timeout"}
+            }
+            
+            validator.cross_reference_validation(["leaf", "root", "stem"])
+            validator.cross_reference_validation(["leaf", "root", "stem"])
+            
+            assert mock_query.call_args_list[1][0][0] == ["root", "stem"]
+    
     def test_calculate_multi_metric_score_basic(self, sample_terms):
         """Test basic multi-metric scoring functionality."""
         from src.ontology.automated_validator import AutomatedValidator
@@ -127,6 +204,28 @@ class TestAutomatedValidator(OntologyTestBase):
             assert isinstance(score_data["combined_score"], (int, float))
             assert 0.0 <= score_data["combined_score"] <= 1.0
     
+    def test_calculate_multi_metric_score_values(self):
+        """Test min-max normalization and weighting of multi-metric scores."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(scoring_weights={"frequency": 0.75, "citation_impact": 0.25})
+        
+        term_data = {
+            "leaf": {"frequency": 150, "citation_impact": 10},
+            "root": {"frequency": 100, "citation_impact": 10},
+            "stem": {"frequency": 125}
+        }
+        
+        result = validator.calculate_multi_metric_score(term_data)
+        
+        assert result["leaf"]["component_scores"] == {"frequency": 1.0, "citation_impact": 1.0}
+        assert result["root"]["component_scores"] == {"frequency": 0.0, "citation_impact": 1.0}
+        assert result["stem"]["component_scores"] == {"frequency": 0.5, "citation_impact": 0.0}
+        assert result["leaf"]["combined_score"] == pytest.approx(1.0)
+        assert result["root"]["combined_score"] == pytest.approx(0.25)
+        assert result["stem"]["combined_score"] == pytest.approx(0.375)
+        assert isinstance(result["stem"]["combined_score"], float)
+    
     def test_calculate_multi_metric_score_empty_input(self):
         """Test multi-metric scoring with empty input."""
         from src.ontology.automated_validator import AutomatedValidator
@@ -219,6 +318,51 @@ class TestAutomatedValidator(OntologyTestBase):
             assert "high_score" in result["recommended_terms"]
             assert "low_score" in result["rejected_terms"]
     
+    def test_validate_term_selection_rejects_unscored_terms(self):
+        """Test the threshold split, including the boundary and terms without scores."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(selection_threshold=0.8)
+        
+        with patch.object(validator, 'cross_reference_validation', return_value={}), \
+             patch.object(validator, 'calculate_multi_metric_score') as mock_scoring:
+            
+            mock_scoring.return_value = {
+                "leaf": {"combined_score": 0.8, "component_scores": {}},
+                "root": {"combined_score": 0.79, "component_scores": {}},
+                "stem": {"combined_score": 0.95, "component_scores": {}}
+            }
+            
+            result = validator.validate_term_selection(["leaf", "root", "unscored", "stem"])
+            
+            assert result["recommended_terms"] == ["leaf", "stem"]
+            assert result["rejected_terms"] == ["root", "unscored"]
+            assert result["summary"]["recommendation_rate"] == 0.5
+    
+    def test_validate_term_selection_does_not_mutate_metadata(self):
+        """Test that validation confidence is merged without modifying the caller's metadata."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator()
+        term_metadata = {
+            "leaf": {"frequency": 150, "citation_impact": 45, "cluster_coherence": 0.85},
+            "root": {"frequency": 120, "citation_impact": 38, "cluster_coherence": 0.78}
+        }
+        
+        with patch.object(validator, 'cross_reference_validation') as mock_validation, \
+             patch.object(validator, 'calculate_multi_metric_score', return_value={}) as mock_scoring:
+            
+            mock_validation.return_value = {
+                "leaf": {"found": True, "confidence": 0.95, "source": "Plant Ontology"}
+            }
+            
+            validator.validate_term_selection(["leaf", "root"], term_metadata)
+            
+            scoring_data = mock_scoring.call_args[0][0]
+            assert scoring_data["leaf"]["validation_confidence"] == 0.95
+            assert "validation_confidence" not in scoring_data["root"]
+            assert "validation_confidence" not in term_metadata["leaf"]
+    
     def test_generate_validation_report(self, tmp_path):
         """Test validation report generation."""
         from src.ontology.automated_validator import AutomatedValidator
@@ -276,6 +420,132 @@ class TestAutomatedValidator(OntologyTestBase):
             assert "leaf" in result
             assert result["leaf"]["found"] is True
     
+    def test_query_external_ontology_batch(self):
+        """Test that a batch of terms is validated with a single VALUES query."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator()
+        
+        with patch('src.ontology.automated_validator.SPARQLWrapper') as mock_sparql:
+            mock_endpoint = Mock()
+            mock_sparql.return_value = mock_endpoint
+            
+            mock_endpoint.query.return_value.convert.return_value = {
+                "results": {
+                    "bindings": [
+                        {"t": {"value": "leaf"}, "term": {"value": "http://purl.obolibrary.org/obo/PO_0025034"}},
+                        {"t": {"value": "leaf"}, "term": {"value": "http://purl.obolibrary.org/obo/PO_0000001"}}
+                    ]
+                }
+            }
+            
+            result = validator._query_external_ontology_batch(["Leaf", 'say "root"'], "Plant Ontology")
+            
+            assert mock_endpoint.query.call_count == 1
+            query = mock_endpoint.setQuery.call_args[0][0]
+            assert 'VALUES ?t { "leaf" "say \\"root\\"" }' in query
+            
+            assert result["Leaf"]["found"] is True
+            assert result["Leaf"]["uri"] == "http://purl.obolibrary.org/obo/PO_0025034"
+            assert result['say "root"']["found"] is False
+    
+    def test_build_validation_query_endpoint_features(self):
+        """Test that label matching uses the syntax configured for each endpoint."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(endpoint_features={
+            "Gene Ontology": "jena-text",
+            "Chemical Ontology": "virtuoso"
+        })
+        
+        exact = validator._build_validation_query(["leaf"], "Plant Ontology")
+        assert 'VALUES ?t { "leaf" }' in exact
+        assert "FILTER(LCASE(STR(?label)) = ?t)" in exact
+        assert "CONTAINS" not in exact
+        
+        jena = validator._build_validation_query(["leaf", "root"], "Gene Ontology")
+        assert "PREFIX text: <http://jena.apache.org/text#>" in jena
+        assert '{ ?term text:query (rdfs:label "leaf") . BIND("leaf" AS ?t) } UNION' in jena
+        
+        virtuoso = validator._build_validation_query(["o'leaf"], "Chemical Ontology")
+        assert '?label bif:contains "\'o leaf\'"' in virtuoso
+        assert 'BIND("o\'leaf" AS ?t)' in virtuoso
+    
+    def test_build_validation_query_reuses_template(self):
+        """Test that query templates are compiled once per source and feature."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator()
+        
+        first = validator._build_validation_query(["leaf"], "Gene Ontology")
+        second = validator._build_validation_query(["root", "$stem"], "Gene Ontology")
+        
+        assert len(validator._query_templates) == 1
+        assert first.endswith("LIMIT 10")
+        assert 'VALUES ?t { "root" "$stem" }' in second
+        assert second.endswith("LIMIT 20")
+    
+    def test_cross_reference_validation_batches_terms(self):
+        """Test that terms are split into one batch query per source and batch size."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(ontology_sources=["Plant Ontology", "Gene Ontology"], sparql_batch_size=2)
+        
+        with patch.object(validator, '_query_external_ontology_batch') as mock_query:
+            mock_query.side_effect = lambda terms, source: {
+                term: {"found": True, "confidence": 0.9, "source": source} for term in terms
+            }
+            
+            result = validator.cross_reference_validation(["leaf", "root", "stem"])
+            
+            assert mock_query.call_count == 4
+            batches = sorted((source, tuple(terms)) for (terms, source), _ in mock_query.call_args_list)
+            assert batches == [
+                ("Gene Ontology", ("leaf", "root")),
+                ("Gene Ontology", ("stem",)),
+                ("Plant Ontology", ("leaf", "root")),
+                ("Plant Ontology", ("stem",))
+            ]
+            assert all(validation["found"] for validation in result.values())
+    
+    def test_query_external_ontology_reuses_sparql_client(self):
+        """Test that one configured SPARQLWrapper is reused per endpoint."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator()
+        
+        with patch('src.ontology.automated_validator.SPARQLWrapper') as mock_sparql:
+            mock_endpoint = Mock()
+            mock_sparql.return_value = mock_endpoint
+            mock_endpoint.query.return_value.convert.return_value = {"results": {"bindings": []}}
+            
+            validator._query_external_ontology("leaf", "Plant Ontology")
+            validator._query_external_ontology("root", "Plant Ontology")
+            validator._query_external_ontology("leaf", "Gene Ontology")
+            
+            assert mock_sparql.call_count == 2
+            assert mock_endpoint.setTimeout.call_count == 2
+            assert mock_endpoint.setQuery.call_count == 3
+    
+    def test_cross_reference_validation_reuses_sparql_clients_across_calls(self):
+        """Test that SPARQL clients outlive the worker threads of each validation call."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(ontology_sources=["Plant Ontology", "Gene Ontology"], validation_cache=False)
+        
+        with patch('src.ontology.automated_validator.SPARQLWrapper') as mock_sparql:
+            mock_sparql.return_value.query.return_value.convert.return_value = {"results": {"bindings": []}}
+            
+            for terms in (["leaf"], ["root"], ["stem"]):
+                validator.cross_reference_validation(terms)
+            
+            endpoints = sorted(call.args[0] for call in mock_sparql.call_args_list)
+            assert endpoints == sorted([
+                validator.sparql_endpoints["Plant Ontology"],
+                validator.sparql_endpoints["Gene Ontology"]
+            ])
+            assert mock_sparql.return_value.query.call_count == 6
+    
     def test_query_external_ontology_timeout_handling(self):
         """Test handling of timeout errors in external ontology queries."""
         from src.ontology.automated_validator import AutomatedValidator
@@ -313,6 +583,24 @@ class TestAutomatedValidator(OntologyTestBase):
         for metric, scores in normalized.items():
             assert all(0.0 <= score <= 1.0 for score in scores)
     
+    def test_normalize_scores_values(self):
+        """Test normalized values, including constant and empty score lists."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator()
+        
+        normalized = validator._normalize_scores({
+            "frequency": [100, 200, 150],
+            "citation_impact": [7, 7],
+            "cluster_coherence": []
+        })
+        
+        assert normalized == {
+            "frequency": [0.0, 1.0, 0.5],
+            "citation_impact": [1.0, 1.0],
+            "cluster_coherence": []
+        }
+    
     def test_aggregate_validation_results(self):
         """Test aggregation of validation results from multiple sources."""
         from src.ontology.automated_validator import AutomatedValidator
@@ -329,3 +617,41 @@ class TestAutomatedValidator(OntologyTestBase):
 
         assert aggregated["found"] is True  # Should be True if found in any source
         assert 0.5 < aggregated["confidence"] < 1.0  # Should be weighted average
+    
+    def test_aggregate_validation_results_source_weights(self):
+        """Test that confidences are averaged using per-source weights."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        validator = AutomatedValidator(source_weights={"Plant Ontology": 3.0, "Gene Ontology": 1.0})
+        
+        aggregated = validator._aggregate_validation_results([
+            {"found": True, "confidence": 0.9, "source": "Plant Ontology"},
+            {"found": False, "confidence": 0.1, "source": "Gene Ontology"}
+        ])
+        
+        assert aggregated["confidence"] == pytest.approx((3.0 * 0.9 + 1.0 * 0.1) / 4.0)
+        assert isinstance(aggregated["confidence"], float)
+        
+        # Unlisted sources default to a weight of 1.0, and zero total weight yields 0.0
+        unweighted = AutomatedValidator(source_weights={})._aggregate_validation_results([
+            {"confidence": 0.9, "source": "Plant Ontology"},
+            {"confidence": 0.5, "source": "Gene Ontology"}
+        ])
+        assert unweighted["confidence"] == pytest.approx(0.7)
+        
+        ignored = AutomatedValidator(source_weights={"Plant Ontology": 0.0})._aggregate_validation_results([
+            {"confidence": 0.9, "source": "Plant Ontology"}
+        ])
+        assert ignored["confidence"] == 0.0
+    
+    def test_aggregate_validation_results_individual_results_opt_in(self):
+        """Test that per-source results are only kept when configured."""
+        from src.ontology.automated_validator import AutomatedValidator
+        
+        results_list = [{"found": True, "confidence": 0.9, "source": "Plant Ontology"}]
+        
+        aggregated = AutomatedValidator()._aggregate_validation_results(results_list)
+        assert "individual_results" not in aggregated
+        
+        kept = AutomatedValidator(keep_individual_results=True)._aggregate_validation_results(results_list)
+        assert kept["individual_results"] == results_list
@@ -5,6 +5,7 @@ This module contains tests for corpus analysis functionality including
 term frequency analysis and citation impact scoring.
 """
 
+import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -86,6 +87,85 @@ class TestCorpusAnalyzer(OntologyTestBase):
         assert "root" not in result  # Appears 1 time, below threshold
         assert "stem" not in result  # Appears 1 time, below threshold
     
+    def test_analyze_term_frequency_respects_term_config(self):
+        """Test that length limits, case sensitivity and letter checks are applied."""
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        
+        analyzer = CorpusAnalyzer({"min_term_length": 3, "max_term_length": 6, "case_sensitive": True})
+        
+        test_data = [
+            {"document_id": "doc1", "terms": [" Leaf ", "leaf", "Leaf", "ab", "mesophyll", "123", "", None]},
+            {"document_id": "doc2"}
+        ]
+        
+        result = analyzer.analyze_term_frequency(test_data)
+        
+        assert result == {"Leaf": 2, "leaf": 1}
+    
+    def test_analyze_term_frequency_parallel_matches_serial(self):
+        """Test that counting in worker processes gives the same frequencies."""
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        
+        test_data = [
+            {"document_id": f"doc{i}", "terms": ["Leaf", "root", "stem"][:i % 3 + 1] + ["x"]}
+            for i in range(30)
+        ]
+        
+        serial = CorpusAnalyzer().analyze_term_frequency(test_data)
+        parallel = CorpusAnalyzer({"parallel_threshold": 1, "frequency_workers": 3}).analyze_term_frequency(test_data)
+        
+        assert parallel == serial
+        assert list(parallel) == list(serial)
+        assert parallel == {"leaf": 30, "root": 20, "stem": 10}
+    
+    def test_parallel_frequency_workers_are_spawned(self):
+        """Test that frequency workers are spawned rather than forked from a threaded process."""
+        from src.ontology import corpus_analyzer
+        
+        assert corpus_analyzer._POOL_CONTEXT.get_start_method() == "spawn"
+        
+        # Workers only receive the term lists, not whole documents
+        with patch.object(corpus_analyzer._POOL_CONTEXT, 'Pool') as mock_pool:
+            mock_pool.return_value.__enter__.return_value.map.return_value = []
+            corpus_analyzer.CorpusAnalyzer({"parallel_threshold": 1, "frequency_workers": 2}).analyze_term_frequency([
+                {"document_id": "doc1", "abstract": "long text", "terms": ["leaf"]},
+                {"document_id": "doc2", "terms": ["root"]}
+            ])
+        
+        _, chunks = mock_pool.return_value.__enter__.return_value.map.call_args[0]
+        assert [chunk[0] for chunk in chunks] == [[["leaf"]], [["root"]]]
+    
+    @pytest.mark.slow
+    @pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 CPUs")
+    def test_parallel_threshold_beats_serial_counting(self):
+        """Benchmark: at the default threshold, spawned workers beat counting in-process."""
+        import random
+        import time
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        
+        threshold = CorpusAnalyzer().config["parallel_threshold"]
+        rng = random.Random(0)
+        vocabulary = [f"metabolite {i}" for i in range(20000)]
+        corpus = [
+            {"document_id": f"doc{i}", "title": "Plant metabolite study",
+             "terms": [vocabulary[min(int(rng.paretovariate(1.1)), 19999)] for _ in range(20)]}
+            for i in range(threshold)
+        ]
+        
+        def best_time(analyzer):
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                result = analyzer.analyze_term_frequency(corpus)
+                timings.append(time.perf_counter() - start)
+            return min(timings), result
+        
+        serial_time, serial = best_time(CorpusAnalyzer({"parallel_threshold": threshold + 1}))
+        parallel_time, parallel = best_time(CorpusAnalyzer({"frequency_workers": 4}))
+        
+        assert parallel == serial
+        assert parallel_time < serial_time
+    
     def test_calculate_citation_impact_basic(self, mock_corpus_data):
         """Test basic citation impact calculation."""
         from src.ontology.corpus_analyzer import CorpusAnalyzer
@@ -160,6 +240,51 @@ class TestCorpusAnalyzer(OntologyTestBase):
             assert "high_impact_term" in result
             assert result["high_impact_term"] > 0
     
+    def test_calculate_citation_impact_concurrent_lookups(self):
+        """Test that citation lookups for different terms run concurrently."""
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        import threading
+        
+        analyzer = CorpusAnalyzer({"citation_jitter": 0})
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def search(query):
+            # Only passes if the other term's lookup is in flight at the same time
+            barrier.wait()
+            return [Mock(citedby=20 if "leaf" in query else 10)]
+        
+        with patch('src.ontology.corpus_analyzer.scholarly') as mock_scholarly:
+            mock_scholarly.search_pubs_query.side_effect = search
+            
+            result = analyzer.calculate_citation_impact(["root", "leaf", "root"])
+            
+            assert result == {"root": 10.0, "leaf": 20.0}
+            assert list(result) == ["root", "leaf"]
+    
+    def test_calculate_citation_impact_uses_cache(self, tmp_path):
+        """Test that citation lookups are cached on disk and failures are retried."""
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        
+        config = {"citation_jitter": 0, "cache_dir": str(tmp_path)}
+        analyzer = CorpusAnalyzer(dict(config))
+        
+        with patch('src.ontology.corpus_analyzer.scholarly') as mock_scholarly:
+            mock_scholarly.search_pubs_query.return_value = [Mock(citedby=10)]
+            analyzer.calculate_citation_impact(["leaf"])
+        analyzer.citation_cache.close()
+        
+        restarted = CorpusAnalyzer(dict(config))
+        with patch('src.ontology.corpus_analyzer.scholarly') as mock_scholarly:
+            mock_scholarly.search_pubs_query.side_effect = TimeoutError("API timeout")
+            
+            assert restarted.calculate_citation_impact(["leaf"]) == {"leaf": 10.0}
+            assert restarted.calculate_citation_impact(["leaf"], weight_recent=True) == {"leaf": pytest.approx(12.0)}
+            assert restarted.calculate_citation_impact(["root"]) == {"root": 0.0}
+            
+            # Only the uncached term reached Scholar, and its failure was not cached
+            assert mock_scholarly.search_pubs_query.call_count == 1
+            assert "root" not in restarted.citation_cache
+    
     def test_get_term_statistics_comprehensive(self, mock_corpus_data):
         """Test comprehensive term statistics calculation."""
         from src.ontology.corpus_analyzer import CorpusAnalyzer
@@ -183,6 +308,23 @@ class TestCorpusAnalyzer(OntologyTestBase):
             assert isinstance(leaf_stats["citation_impact"], (int, float))
             assert isinstance(leaf_stats["combined_score"], (int, float))
     
+    def test_get_term_statistics_combined_scores(self):
+        """Test frequency and citation normalization in the combined score."""
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        
+        analyzer = CorpusAnalyzer({"frequency_weight": 0.7, "citation_weight": 0.3})
+        corpus = [{"terms": ["leaf", "leaf", "leaf", "leaf", "root", "root"]}]
+        
+        with patch.object(analyzer, 'calculate_citation_impact') as mock_citation:
+            mock_citation.return_value = {"leaf": 10.0, "root": 40.0}
+            
+            result = analyzer.get_term_statistics(corpus)
+        
+        assert result["leaf"]["frequency"] == 4
+        assert result["leaf"]["combined_score"] == pytest.approx(0.7 + 0.3 * 0.25)
+        assert result["root"]["combined_score"] == pytest.approx(0.7 * 0.5 + 0.3)
+        assert isinstance(result["root"]["combined_score"], float)
+    
     def test_normalize_term_basic(self):
         """Test basic term normalization functionality."""
         from src.ontology.corpus_analyzer import CorpusAnalyzer
@@ -196,6 +338,20 @@ class TestCorpusAnalyzer(OntologyTestBase):
         assert analyzer.normalize_term("  Leaf  ") == "leaf"
         assert analyzer.normalize_term("leaf-tissue") == "leaf-tissue"
     
+    def test_is_valid_term(self):
+        """Test term validity checks."""
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        
+        analyzer = CorpusAnalyzer({"min_term_length": 2, "max_term_length": 5})
+        
+        assert analyzer._is_valid_term("leaf") is True
+        assert analyzer._is_valid_term("a1") is True
+        assert analyzer._is_valid_term("") is False
+        assert analyzer._is_valid_term("a") is False
+        assert analyzer._is_valid_term("leaves") is False
+        assert analyzer._is_valid_term("1234") is False
+        assert analyzer._is_valid_term("éé") is False
+    
     def test_filter_terms_by_relevance(self):
         """Test filtering terms by relevance score."""
         from src.ontology.corpus_analyzer import CorpusAnalyzer
@@ -238,3 +394,21 @@ class TestCorpusAnalyzer(OntologyTestBase):
             loaded_data = json.load(f)
         
         assert loaded_data == test_results
+    
+    def test_export_analysis_results_unicode_and_numpy(self, tmp_path):
+        """Test that exported results keep non-ASCII text and serialize NumPy values."""
+        from src.ontology.corpus_analyzer import CorpusAnalyzer
+        import json
+        import numpy as np
+        
+        analyzer = CorpusAnalyzer()
+        output_file = tmp_path / "analysis_results.json"
+        
+        analyzer.export_analysis_results(
+            {"β-carotene": {"scores": np.array([0.5, 1.0]), "frequency": 3}},
+            str(output_file)
+        )
+        
+        text = output_file.read_text(encoding="utf-8")
+        assert "β-carotene" in text
+        assert json.loads(text) == {"β-carotene": {"scores": [0.5, 1.0], "frequency": 3}}
@@ -32,6 +32,10 @@ class TestJustificationGenerator(OntologyTestBase):
         
         assert generator_custom.config['output_format'] == 'markdown'
         assert generator_custom.config['include_metrics'] is True
+        assert generator_custom.config['max_terms_display'] == 100
+        
+        # The caller's dictionary is not filled in with defaults
+        assert custom_config == {'output_format': 'markdown', 'include_metrics': True}
     
     def test_generate_selection_report_basic(self):
         """Test basic selection report generation."""
@@ -111,6 +115,43 @@ class TestJustificationGenerator(OntologyTestBase):
         assert 'score_distribution' in report
         assert 'validation_details' in report
     
+    def test_selection_report_extracts_scores_once(self):
+        """Test that optional report sections share one extraction of the selected scores."""
+        from src.ontology import justification_generator
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator({'include_detailed_metrics': True, 'include_visualizations': True})
+        
+        selected_terms = [
+            {'term': 'leaf', 'final_score': 0.9, 'frequency_score': 0.8, 'validation_score': 0.7},
+            {'term': 'stem', 'final_score': 0.7, 'frequency_score': 0.6}
+        ]
+        
+        with patch.object(justification_generator, '_extract_score_arrays',
+                          wraps=justification_generator._extract_score_arrays) as mock_extract:
+            report = generator.generate_selection_report(selected_terms, [{'term': 'x', 'final_score': 0.1}])
+        
+        # One scan for the combined statistics, one shared by the optional sections
+        assert mock_extract.call_count == 2
+        assert report['validation_details']['validation_coverage'] == 0.5
+        assert report['detailed_metrics']['frequency_score_analysis']['mean'] == pytest.approx(0.7)
+        assert report['visualization_data']['top_terms'][0] == {'term': 'leaf', 'score': 0.9}
+    
+    def test_analyze_score_distribution_plain_floats(self):
+        """Test that quartiles are plain Python floats rather than NumPy scalars."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        terms = [{'final_score': score} for score in (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)]
+        
+        distribution = generator._analyze_score_distribution(terms)
+        
+        assert all(type(value) is float for value in distribution['quartiles'].values())
+        assert distribution['quartiles']['q2'] == pytest.approx(0.55)
+        assert distribution['outliers'] == {'count': 1}
+        assert type(distribution['outliers']['count']) is int
+    
     def test_generate_methodology_section(self):
         """Test methodology section generation."""
         from src.ontology.justification_generator import JustificationGenerator
@@ -162,6 +203,53 @@ class TestJustificationGenerator(OntologyTestBase):
         assert score_stats['min_score'] == 0.76
         assert score_stats['max_score'] == 0.95
     
+    def test_generate_statistics_summary_distribution(self):
+        """Test score statistics and bucket boundaries, skipping terms without scores."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        terms_data = [
+            {'final_score': 0.8}, {'final_score': 0.5}, {'final_score': 0.49},
+            {'final_score': 1.0}, {'frequency_score': 0.3}
+        ]
+        
+        stats = generator.generate_statistics_summary(terms_data)
+        
+        assert stats['distribution_analysis'] == {
+            'high_scoring_terms': 2,
+            'medium_scoring_terms': 1,
+            'low_scoring_terms': 1
+        }
+        assert stats['score_statistics']['median_score'] == pytest.approx(0.65)
+        assert stats['score_statistics']['std_deviation'] == pytest.approx(0.2477, rel=1e-3)
+        assert stats['frequency_statistics'] == {'mean': 0.3, 'median': 0.3}
+        assert 'citation_statistics' not in stats
+        assert all(type(value) in (int, float) for value in stats['score_statistics'].values())
+        
+        # Several lists are summarized as if concatenated
+        assert generator.generate_statistics_summary(terms_data[:2], [], terms_data[2:]) == stats
+        assert 'error' in generator.generate_statistics_summary([], [])
+    
+    def test_score_extraction_distinguishes_missing_from_zero(self):
+        """Test that stored zero scores are counted while missing keys are skipped."""
+        from src.ontology.justification_generator import _extract_score_arrays
+        
+        terms = [
+            {'final_score': 0, 'validation_score': 0.0},
+            {'final_score': 0.9, 'frequency_score': 0.4},
+            {'term': 'unscored'}
+        ]
+        
+        arrays = _extract_score_arrays(iter(terms))
+        
+        assert arrays == {
+            'final_score': [0, 0.9],
+            'frequency_score': [0.4],
+            'citation_impact': [],
+            'validation_score': [0.0]
+        }
+    
     def test_export_report_to_markdown(self):
         """Test exporting report to markdown format."""
         from src.ontology.justification_generator import JustificationGenerator
@@ -227,6 +315,120 @@ class TestJustificationGenerator(OntologyTestBase):
         assert loaded_data['summary']['total_selected'] == 5
         assert loaded_data['selected_terms'][0]['term'] == 'leaf'
     
+    def test_save_report_to_file_matches_json_export(self, tmp_path):
+        """Test that the streamed JSON file matches export_report_to_json byte for byte."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        report_data = {
+            'summary': {'total_selected': 2, 'selection_rate': 0.5},
+            'selected_terms': [{'term': 'β-carotene', 'final_score': 0.91}, {'term': 'leaf'}]
+        }
+        
+        output_file = tmp_path / "nested" / "report.json"
+        generator.save_report_to_file(report_data, str(output_file), format='json')
+        
+        assert output_file.read_text(encoding='utf-8') == generator.export_report_to_json(report_data)
+        
+        with pytest.raises(ValueError):
+            generator.save_report_to_file(report_data, str(tmp_path / "report.txt"), format='txt')
+        assert not (tmp_path / "report.txt").exists()
+    
+    def test_export_report_to_json_numpy_values(self):
+        """Test that NumPy scalars and arrays in a report serialize as plain JSON values."""
+        import numpy as np
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        report_data = {
+            'quartiles': {'q1': np.float64(0.25), 'q2': np.float64(0.5)},
+            'counts': np.array([1, 2, 3]),
+            'total': np.int64(6),
+            'term': 'β-carotene'
+        }
+        
+        json_content = generator.export_report_to_json(report_data)
+        
+        assert json.loads(json_content) == {
+            'quartiles': {'q1': 0.25, 'q2': 0.5},
+            'counts': [1, 2, 3],
+            'total': 6,
+            'term': 'β-carotene'
+        }
+        assert 'β-carotene' in json_content
+        assert json_content.startswith('{\n  "quartiles"')
+    
+    def test_save_report_to_file_split_terms(self, tmp_path):
+        """Test writing term lists as batched NDJSON sidecars next to a manifest."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        selected_terms = [{'term': f'term_{i}', 'final_score': 0.9} for i in range(5)]
+        report_data = {
+            'summary': {'total_selected': 5},
+            'selected_terms': selected_terms,
+            'rejected_terms': [{'term': 'ß-obsolete', 'rejection_reason': 'Low score'}]
+        }
+        
+        output_file = tmp_path / "report.json"
+        with patch('src.ontology.justification_generator._NDJSON_BATCH_SIZE', 2):
+            generator.save_report_to_file(report_data, str(output_file), split_terms=True)
+        
+        manifest = json.loads(output_file.read_text(encoding='utf-8'))
+        assert 'selected_terms' not in manifest
+        assert manifest['summary'] == {'total_selected': 5}
+        assert manifest['term_files']['selected_terms'] == {
+            'count': 5,
+            'files': ['report.selected_terms-000.ndjson', 'report.selected_terms-001.ndjson',
+                      'report.selected_terms-002.ndjson']
+        }
+        
+        loaded = [
+            json.loads(line)
+            for name in manifest['term_files']['selected_terms']['files']
+            for line in (tmp_path / name).read_text(encoding='utf-8').splitlines()
+        ]
+        assert loaded == selected_terms
+        
+        rejected_file = tmp_path / manifest['term_files']['rejected_terms']['files'][0]
+        assert rejected_file.read_text(encoding='utf-8') == '{"term":"ß-obsolete","rejection_reason":"Low score"}\n'
+        
+        # The caller's report is left intact
+        assert report_data['selected_terms'] is selected_terms
+    
+    def test_generate_and_save_selection_report_matches_saved_report(self, tmp_path):
+        """Test streaming a report to disk yields the same file as saving the full report."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator({
+            'include_detailed_metrics': True,
+            'include_visualizations': True
+        })
+        
+        selected_terms = [
+            {'iri': f'http://example.org/term_{i}', 'label': f'term_{i}', 'final_score': 0.5 + i * 0.1,
+             'scores': {'relevance': 0.9, 'confidence': 0.7}, 'source': 'ChEBI'}
+            for i in range(4)
+        ]
+        
+        fixed_now = Mock()
+        fixed_now.isoformat.return_value = '2024-01-01T00:00:00'
+        with patch('src.ontology.justification_generator.datetime') as mock_datetime:
+            mock_datetime.now.return_value = fixed_now
+            
+            streamed_file = tmp_path / "streamed" / "report.json"
+            generator.generate_and_save_selection_report(selected_terms, [], str(streamed_file))
+            
+            saved_file = tmp_path / "saved.json"
+            report = generator.generate_selection_report(selected_terms, [])
+            generator.save_report_to_file(report, str(saved_file))
+        
+        assert streamed_file.read_bytes() == saved_file.read_bytes()
+        assert json.loads(streamed_file.read_text(encoding='utf-8'))['rejected_terms'] == []
+    
     def test_generate_validation_details(self):
         """Test validation details generation."""
         from src.ontology.justification_generator import JustificationGenerator
@@ -255,6 +457,45 @@ class TestJustificationGenerator(OntologyTestBase):
         assert 'average_confidence' in summary
         assert 'validation_sources_used' in summary
     
+    def test_generate_validation_details_confidence_distribution(self):
+        """Test confidence bucket counts at the 0.5 and 0.8 boundaries."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        validation_results = [{'confidence_score': score} for score in (0.8, 0.95, 0.5, 0.79, 0.49)]
+        validation_results.append({'term': 'no_score'})
+        
+        details = generator.generate_validation_details(validation_results)
+        
+        assert details['confidence_distribution'] == {
+            'high_confidence': 2,
+            'medium_confidence': 2,
+            'low_confidence': 2
+        }
+    
+    def test_generate_validation_details_source_frequencies(self):
+        """Test that source usage is counted across results in first-seen order."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        validation_results = [
+            {'validation_sources': ['Plant Ontology', 'ChEBI'], 'cross_references': ['a', 'b'], 'confidence_score': 0.9},
+            {'validation_sources': ['ChEBI'], 'cross_references': ['c'], 'confidence_score': 0.6},
+            {'validation_sources': ['ChEBI', 'Gene Ontology'], 'confidence_score': 0.3}
+        ]
+        
+        details = generator.generate_validation_details(validation_results)
+        summary = details['validation_summary']
+        
+        assert summary['validation_sources_used'] == ['Plant Ontology', 'ChEBI', 'Gene Ontology']
+        assert summary['source_frequencies'] == {'ChEBI': 3, 'Plant Ontology': 1, 'Gene Ontology': 1}
+        assert list(summary['source_frequencies'])[0] == 'ChEBI'
+        assert summary['total_cross_references'] == 3
+        assert summary['average_confidence'] == pytest.approx(0.6)
+        assert details['cross_reference_analysis']['sources_coverage'] == 3
+    
     def test_create_score_visualization_data(self):
         """Test score visualization data creation."""
         from src.ontology.justification_generator import JustificationGenerator
@@ -281,6 +522,41 @@ class TestJustificationGenerator(OntologyTestBase):
         assert len(distribution['bins']) > 0
         assert len(distribution['counts']) > 0
     
+    def test_score_visualization_histogram_edges(self):
+        """Test histogram bin edges: left-inclusive bins, 1.0 and above in the last bin."""
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        scores = [0.0, 0.2, 0.39, 0.4, 0.6, 0.79, 0.8, 1.0, 1.2, -0.1]
+        terms_data = [{'term': f't{i}', 'final_score': score} for i, score in enumerate(scores)]
+        
+        distribution = generator.create_score_visualization_data(terms_data)['score_distribution']
+        
+        assert distribution['bins'] == [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+        assert distribution['counts'] == [1, 2, 1, 2, 3]
+    
+    def test_calculate_correlation(self):
+        """Test Pearson correlation, including degenerate inputs that have no correlation."""
+        import numpy as np
+        from src.ontology.justification_generator import JustificationGenerator
+        
+        generator = JustificationGenerator()
+        
+        x = [0.1, 0.4, 0.35, 0.8, 0.65]
+        y = [0.2, 0.5, 0.3, 0.9, 0.4]
+        
+        result = generator._calculate_correlation(x, y)
+        assert isinstance(result, float)
+        assert result == pytest.approx(np.corrcoef(x, y)[0, 1])
+        assert generator._calculate_correlation([1, 2, 3], [3, 2, 1]) == pytest.approx(-1.0)
+        
+        # Constant, mismatched, too short and non-numeric inputs
+        assert generator._calculate_correlation([0.5, 0.5, 0.5], y[:3]) == 0.0
+        assert generator._calculate_correlation(x, y[:4]) == 0.0
+        assert generator._calculate_correlation([0.1], [0.2]) == 0.0
+        assert generator._calculate_correlation([None, 0.2], [0.1, 0.3]) == 0.0
+    
     def test_generate_recommendations(self):
         """Test recommendations generation."""
         from src.ontology.justification_generator import JustificationGenerator
@@ -0,0 +1,59 @@
+"""
+Tests for the ResultCache class.
+
+This module contains tests for the bounded, expiring result cache used to
+avoid repeating external lookups.
+"""
+
+import pytest
+
+from tests.ontology.test_base import OntologyTestBase
+
+
+class TestResultCache(OntologyTestBase):
+    """Test cases for ResultCache class."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the in-memory tier is bounded."""
+        from src.ontology.result_cache import ResultCache
+        
+        cache = ResultCache(max_entries=2, ttl=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+    
+    def test_expires_entries(self, tmp_path):
+        """Test that entries older than their TTL are treated as misses."""
+        from src.ontology.result_cache import ResultCache
+        
+        cache = ResultCache(max_entries=10, ttl=60, cache_dir=str(tmp_path))
+        cache.update({"leaf": {"found": True}}, ttl=0)
+        cache["root"] = {"found": True}
+        
+        assert "leaf" not in cache
+        assert cache.get("leaf") is None
+        assert cache["root"] == {"found": True}
+        with pytest.raises(KeyError):
+            cache["leaf"]
+        cache.close()
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test that the SQLite tier survives reopening the cache."""
+        from src.ontology.result_cache import ResultCache
+        
+        cache = ResultCache(max_entries=10, ttl=60, cache_dir=str(tmp_path), name="citations")
+        cache["leaf"] = 12.5
+        cache.close()
+        
+        reopened = ResultCache(max_entries=10, ttl=60, cache_dir=str(tmp_path), name="citations")
+        assert reopened["leaf"] == 12.5
+        
+        reopened.clear()
+        assert "leaf" not in reopened
+        reopened.close()
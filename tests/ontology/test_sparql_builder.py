@@ -150,9 +150,15 @@ class TestSPARQLBuilder(OntologyTestBase):
         assert isinstance(queries, list)
         assert len(queries) > 0
         
-        # Should have frequency analysis + cross-reference queries
-        expected_count = len(terms) * (1 + len(ontologies))  # 1 freq + N cross-ref per term
+        # Terms are batched: one frequency query + one cross-reference query per ontology
+        expected_count = 1 + len(ontologies)
         assert len(queries) == expected_count
+        assert all(q.term == '*' for q in queries)
+        assert [q.ontology for q in queries] == ['combined', 'po', 'go']
+        for query in queries:
+            assert 'leaf' in query.query
+            assert 'stem' in query.query
+            assert 'LIMIT 2000' in query.query
         
         # Check query types
         query_types = [q.query_type for q in queries]
@@ -313,3 +319,205 @@ class TestSPARQLBuilder(OntologyTestBase):
         assert 'PREFIX po:' in prefixes
         assert 'PREFIX go:' in prefixes
         assert 'PREFIX chebi:' in prefixes
+    
+    def test_prefixes_building_is_cached(self):
+        """Test the PREFIX block is reused and rebuilt when prefixes are replaced."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        prefixes = builder._build_prefixes()
+        assert builder._build_prefixes() is prefixes
+        
+        builder.prefixes = {**builder.prefixes, 'envo': 'http://purl.obolibrary.org/obo/ENVO_'}
+        rebuilt = builder._build_prefixes()
+        
+        assert rebuilt.startswith(prefixes)
+        assert rebuilt.endswith('PREFIX envo: <http://purl.obolibrary.org/obo/ENVO_>')
+        assert 'PREFIX envo:' in builder.build_deprecated_terms_query('envo')
+    
+    def test_prefixes_cache_follows_in_place_changes(self):
+        """Test the PREFIX block is rebuilt when the mapping is edited in place."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        prefixes = builder._build_prefixes()
+        builder.prefixes['envo'] = 'http://purl.obolibrary.org/obo/ENVO_'
+        
+        assert builder._build_prefixes().endswith('PREFIX envo: <http://purl.obolibrary.org/obo/ENVO_>')
+        assert 'PREFIX envo:' in builder.build_deprecated_terms_query('envo')
+        
+        del builder.prefixes['envo']
+        assert builder._build_prefixes() == prefixes
+        assert 'PREFIX envo:' not in builder.build_term_frequency_query(['leaf'])
+    
+    def test_term_queries_are_memoized(self):
+        """Test repeated builder calls reuse the rendered query until inputs change."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        query = builder.build_term_frequency_query(['leaf', 'stem'])
+        assert builder.build_term_frequency_query(['leaf', 'stem']) is query
+        
+        cross_ref = builder.build_cross_reference_query('http://example.org/term/leaf', ['go'])
+        assert builder.build_cross_reference_query('http://example.org/term/leaf', ['go']) is cross_ref
+        
+        # Changing the configured limit yields a fresh query
+        builder.config['default_limit'] = 10
+        limited = builder.build_term_frequency_query(['leaf', 'stem'])
+        assert limited is not query
+        assert limited.endswith('LIMIT 10')
+    
+    def test_optimize_query_performance_hoists_distinct_filters(self):
+        """Test FILTER lines move after WHERE once each, keeping the rest in order."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder({'default_limit': 50})
+        
+        query = "\n".join([
+            "SELECT ?s WHERE {",
+            "    ?s rdfs:label ?label .",
+            "    FILTER(LANG(?label) = \"en\")",
+            "    OPTIONAL { ?s rdfs:comment ?comment }",
+            "    FILTER(STRLEN(?label) > 3)",
+            "    FILTER(LANG(?label) = \"en\")",
+            "}"
+        ])
+        
+        optimized = builder.optimize_query_performance(query)
+        
+        assert optimized.split("\n") == [
+            "SELECT ?s WHERE {",
+            "    FILTER(LANG(?label) = \"en\")",
+            "    FILTER(STRLEN(?label) > 3)",
+            "    ?s rdfs:label ?label .",
+            "    OPTIONAL { ?s rdfs:comment ?comment }",
+            "}",
+            "LIMIT 50"
+        ]
+        
+        # Without a WHERE clause there is nothing to hoist filters into
+        no_where = "ASK { ?s ?p ?o . FILTER(?o > 1) }"
+        assert builder.optimize_query_performance(no_where) == no_where
+    
+    def test_validate_query_syntax_lowercase_keywords(self):
+        """Test keywords are recognized regardless of case while braces are still counted."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        result = builder.validate_query_syntax("select ?s where { { ?s ?p ?o } limit 5")
+        
+        assert result['valid'] is False
+        assert result['errors'] == ["Unbalanced braces: 2 open, 1 close"]
+        assert result['warnings'] == []
+    
+    def test_validate_query_syntax_prefix_usage_warning(self):
+        """Test the missing PREFIX warning only fires for actual prefixed names."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        result = builder.validate_query_syntax("SELECT ?s WHERE { ?s rdfs:label ?label } LIMIT 10")
+        assert result['warnings'] == ["Query uses prefixes but lacks PREFIX declarations"]
+        
+        # "po" inside another word or IRI is not a prefix usage
+        result = builder.validate_query_syntax("SELECT ?report WHERE { ?report <http://x.org/p> ?o } LIMIT 10")
+        assert result['warnings'] == []
+        
+        # The probe follows reassigned prefixes
+        builder.prefixes = {'envo': 'http://purl.obolibrary.org/obo/ENVO_'}
+        result = builder.validate_query_syntax("SELECT ?s WHERE { ?s envo:part_of ?o } LIMIT 10")
+        assert result['warnings'] == ["Query uses prefixes but lacks PREFIX declarations"]
+    
+    def test_validate_query_syntax_follows_in_place_prefix_changes(self):
+        """Test the prefix probe is rebuilt when the mapping is edited in place."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        query = "SELECT ?x WHERE { ?x envo:foo ?y } LIMIT 1"
+        
+        assert builder.validate_query_syntax(query)['warnings'] == []
+        
+        builder.prefixes['envo'] = 'http://purl.obolibrary.org/obo/ENVO_'
+        result = builder.validate_query_syntax(query)
+        assert result['warnings'] == ["Query uses prefixes but lacks PREFIX declarations"]
+        
+        builder.prefixes.clear()
+        assert builder.validate_query_syntax(query)['warnings'] == []
+    
+    def test_build_bulk_cross_reference_query(self):
+        """Test a bulk cross-reference query binds every term URI through VALUES."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        term_uris = ["http://purl.obolibrary.org/obo/PO_0025034", "http://purl.obolibrary.org/obo/PO_0009025"]
+        query = builder.build_bulk_cross_reference_query(term_uris, ['go', 'chebi'])
+        
+        assert f'VALUES ?orig_uri {{ <{term_uris[0]}> <{term_uris[1]}> }}' in query
+        assert 'SELECT ?orig_uri ?original_label' in query
+        assert '?orig_uri rdfs:label ?original_label' in query
+        assert query.count('BIND(') == 2
+        assert query.endswith('LIMIT 2000')
+        assert builder.validate_query_syntax(query)['valid'] is True
+    
+    def test_label_match_strategies(self):
+        """Test term queries can match labels by regex or through a full-text index."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        terms = ['Leaf', 'cell (plant)']
+        
+        regex_builder = SPARQLBuilder({'label_match': 'regex'})
+        query = regex_builder.build_term_frequency_query(terms)
+        assert 'FILTER(REGEX(str(?label), "leaf|cell \\\\(plant\\\\)", "i"))' in query
+        assert 'VALUES ?search_term' not in query
+        
+        citation = regex_builder.build_citation_impact_query(terms)
+        assert 'FILTER(REGEX(str(?synonym), "leaf|cell \\\\(plant\\\\)", "i"))' in citation
+        
+        virtuoso_query = SPARQLBuilder({'label_match': 'virtuoso'}).build_term_frequency_query(["5'-nucleotidase"])
+        assert """?label bif:contains '"5\\'-nucleotidase"' .""" in virtuoso_query
+        
+        jena_citation = SPARQLBuilder({'label_match': 'jena'}).build_citation_impact_query(terms)
+        assert 'PREFIX text: <http://jena.apache.org/text#>' in jena_citation
+        assert """?term text:query (rdfs:label '"leaf" OR "cell (plant)"') .""" in jena_citation
+        assert 'FILTER(REGEX(str(?synonym),' in jena_citation
+        
+        with pytest.raises(ValueError, match="label_match"):
+            SPARQLBuilder({'label_match': 'fulltext'})
+    
+    def test_single_term_queries_use_values(self):
+        """Test a single term is bound through VALUES like a term list."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        query = builder.build_term_frequency_query(['Leaf'])
+        assert 'VALUES ?search_term { "leaf" }' in query
+        assert 'FILTER(CONTAINS(LCASE(str(?label)), ?search_term))' in query
+        
+        citation = builder.build_citation_impact_query(['Leaf'])
+        assert 'VALUES ?search_term { "leaf" }' in citation
+        assert 'VALUES ?search_term_syn { "leaf" }' in citation
+        assert 'FILTER(CONTAINS(LCASE(str(?synonym)), ?search_term_syn))' in citation
+    
+    def test_shared_count_subqueries(self):
+        """Test term queries embed the shared, memoized aggregate subqueries verbatim."""
+        from src.ontology.sparql_builder import SPARQLBuilder
+        
+        builder = SPARQLBuilder()
+        
+        usage_subquery = builder.build_usage_count_subquery('chebi')
+        assert usage_subquery is builder.build_usage_count_subquery('chebi')
+        assert 'FILTER(STRSTARTS(str(?term), "http://purl.obolibrary.org/obo/CHEBI_"))' in usage_subquery
+        assert f"OPTIONAL {usage_subquery}" in builder.build_term_frequency_query(['glucose'], 'chebi')
+        
+        citation_subquery = builder.build_citation_count_subquery()
+        assert '?citation_count' in citation_subquery
+        assert f"OPTIONAL {citation_subquery}" in builder.build_citation_impact_query(['leaf'])
+        
+        hinted = builder.add_query_hints(builder.build_citation_impact_query(['leaf']), {'pin_subqueries': True})
+        assert '# HINT: PIN_SUBQUERIES' in hinted